@@ -1,6 +1,5 @@
-import google.generativeai as genai
 from django.conf import settings
-from resumes.utils import calculate_skill_match_score
+from resumes.utils import get_job_profile, normalize_skills, skill_id_match_score
 from .models import SkillGapAnalysis, LearningPath
 
 def generate_cover_letter(user, job, tone='professional', custom_prompt=''):
@@ -11,6 +10,8 @@ def generate_cover_letter(user, job, tone='professional', custom_prompt=''):
         print("Gemini AI configuration failed: GEMINI_API_KEY not set in settings.")
         return generate_template_cover_letter(user, job, tone)
     try:
+        # Imported on first use; the SDK is slow to import and most processes never call it
+        import google.generativeai as genai
         genai.configure(api_key=GEMINI_API_KEY)
         model = genai.GenerativeModel('gemini-pro')
     except Exception as e:
@@ -65,6 +66,7 @@ def generate_cold_email(user, job, recruiter_email):
         if not GEMINI_API_KEY:
             print("Gemini AI configuration failed: GEMINI_API_KEY not set in settings.")
             return generate_template_cold_email(user, job, recruiter_email)
+        import google.generativeai as genai
         genai.configure(api_key=GEMINI_API_KEY)
         model = genai.GenerativeModel('gemini-pro')
     except Exception as e:
@@ -109,15 +111,15 @@ def generate_cold_email(user, job, recruiter_email):
 def analyze_skill_gap(user, job):
     """Analyze skill gaps and provide learning recommendations"""
     
-    user_skills = set(skill.lower() for skill in (user.skills or []))
-    job_skills = set(skill.lower() for skill in job.skills)
+    user_skills = set(normalize_skills(user.skills))
+    job_skills = set(get_job_profile(job).skill_ids)
     
     # Calculate skill match
     matching_skills = user_skills.intersection(job_skills)
     missing_skills = job_skills - user_skills
     
     # Use advanced skill matching
-    skill_match_score = calculate_skill_match_score(list(user_skills), list(job_skills))
+    skill_match_score = skill_id_match_score(list(user_skills), list(job_skills))
     
     # Create skill gap analysis
     analysis = SkillGapAnalysis.objects.create(
@@ -99,7 +99,7 @@ def skill_gap_analysis_view(request):
         )
     
     try:
-        job = Job.objects.get(id=job_id)
+        job = Job.objects.select_related('profile').get(id=job_id)
         analysis = analyze_skill_gap(request.user, job)
         
         serializer = SkillGapAnalysisSerializer(analysis)
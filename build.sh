@@ -12,6 +12,10 @@ pip install --upgrade setuptools wheel
 # Install requirements
 pip install -r requirements.txt
 
+# Install the NLTK data resume parsing needs next to the code (see NLTK_DATA_DIR);
+# the app never downloads it at runtime
+python -m nltk.downloader -d nltk_data punkt stopwords
+
 # Try to install spaCy model (optional - won't fail build if it fails)
 python -m spacy download en_core_web_sm || echo "Warning: Could not download spaCy model, continuing..."
 
@@ -229,5 +229,62 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 
+# Resume parsing
+# Size of the in-process background pool that parses uploaded resumes
+RESUME_PARSE_WORKERS = config('RESUME_PARSE_WORKERS', default=2, cast=int)
+# Limits of the content-hash parse cache; least recently used entries are evicted first
+RESUME_PARSE_CACHE_MAX_ENTRIES = config('RESUME_PARSE_CACHE_MAX_ENTRIES', default=5000, cast=int)
+RESUME_PARSE_CACHE_MAX_BYTES = config('RESUME_PARSE_CACHE_MAX_BYTES', default=200 * 1024 * 1024, cast=int)
+# The limits are checked once per this many cache inserts of a process, so they can be exceeded by that much
+RESUME_PARSE_CACHE_EVICT_EVERY = config('RESUME_PARSE_CACHE_EVICT_EVERY', default=100, cast=int)
+# PDF extraction stops after this many pages / characters
+RESUME_PDF_MAX_PAGES = config('RESUME_PDF_MAX_PAGES', default=50, cast=int)
+RESUME_PDF_MAX_CHARS = config('RESUME_PDF_MAX_CHARS', default=200000, cast=int)
+# PDFs with at least this many pages are split across RESUME_PDF_WORKERS processes
+RESUME_PDF_PARALLEL_MIN_PAGES = config('RESUME_PDF_PARALLEL_MIN_PAGES', default=8, cast=int)
+RESUME_PDF_WORKERS = config('RESUME_PDF_WORKERS', default=2, cast=int)
+# 'auto' probes the text layer and uses PyPDF2 for simple layouts, 'pdfplumber'
+# always uses pdfplumber, 'fast' always uses PyPDF2 when it can read the file
+RESUME_PDF_STRATEGY = config('RESUME_PDF_STRATEGY', default='auto')
+# Most jobs one POST /api/resumes/analyze-batch/ request may score
+RESUME_ANALYZE_BATCH_MAX_JOBS = config('RESUME_ANALYZE_BATCH_MAX_JOBS', default=50, cast=int)
+# NLTK data (punkt, stopwords) is installed here by build.sh; it is never downloaded at runtime
+NLTK_DATA_DIR = config('NLTK_DATA_DIR', default=os.path.join(BASE_DIR, 'nltk_data'))
+
+# Job recommendations
+# Each process applies jobs saved by other processes to its skill index this often
+JOB_INDEX_SYNC_SECONDS = config('JOB_INDEX_SYNC_SECONDS', default=30, cast=int)
+# `manage.py build_job_index` publishes memory-mapped indexes here; workers use the
+# in-process indexes until a version has been published
+JOB_INDEX_DIR = config('JOB_INDEX_DIR', default=os.path.join(BASE_DIR, 'job_index'))
+# Build the in-process indexes in the background when the WSGI application loads;
+# until they are built, recommendation requests answer 503
+JOB_INDEX_WARM_ON_STARTUP = config('JOB_INDEX_WARM_ON_STARTUP', default=True, cast=bool)
+# Jobs changed since the published index was built that a worker scores next to it before
+# switching to an index built in its own process
+JOB_INDEX_OVERLAY_MAX_JOBS = config('JOB_INDEX_OVERLAY_MAX_JOBS', default=5000, cast=int)
+# Most recommendations one GET /api/jobs/recommendations/ request may ask for
+JOB_RECOMMENDATIONS_MAX = config('JOB_RECOMMENDATIONS_MAX', default=50, cast=int)
+
+# Logging
+# 'resumes.metrics' writes one key=value line per parsed resume with per-stage
+# timings (also attached to the record as `resume_parse` for JSON formatters)
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'resumes.metrics': {
+            'handlers': ['console'],
+            'level': config('RESUME_PARSE_METRICS_LOG_LEVEL', default='INFO'),
+            'propagate': False,
+        },
+    },
+}
+
 # AI Services Configuration
 # API keys are directly embedded in utility functions for deployment reliability
\ No newline at end of file
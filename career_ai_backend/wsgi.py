@@ -3,4 +3,9 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'career_ai_backend.settings')
 
-application = get_wsgi_application()
\ No newline at end of file
+application = get_wsgi_application()
+
+# Build the job indexes in the background now rather than in the first request
+from jobs.recommendations import warm_job_indexes  # noqa: E402
+
+warm_job_indexes()
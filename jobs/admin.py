@@ -1,6 +1,7 @@
 from django.contrib import admin
-from .models import Job, JobApplication,SavedJob
+from .models import Job, JobApplication, JobProfile, SavedJob
 
 admin.site.register(Job)
 admin.site.register(JobApplication)
 admin.site.register(SavedJob)
+admin.site.register(JobProfile)
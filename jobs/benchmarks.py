@@ -0,0 +1,197 @@
+"""Benchmarks for job recommendations and the job indexes.
+
+Run them with ``python manage.py benchmark_jobs``, which takes the same
+``--suite``, ``--json`` and ``--baseline`` options as ``benchmark_resumes``.
+"""
+import math
+import os
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from resumes.benchmarks import synthetic_resume_text, time_call
+from resumes.utils import SOFT_SKILLS, TECHNICAL_SKILLS, ResumeDocument, normalize_skills
+from .job_index import MappedJobIndex, write_job_index
+from .recommendations import JobTextIndex, SkillIndex, job_term_counts
+
+# Recommendation requests must stay under this p99 against RECOMMENDATION_JOBS active jobs
+RECOMMENDATION_P99_BUDGET_SECONDS = 0.020
+RECOMMENDATION_JOBS = 100000
+
+def synthetic_job_skills(rng, skills, count):
+    """Skill lists with a long-tailed popularity, like real postings: a few skills are everywhere"""
+    weights = [1 / (rank + 1) for rank in range(len(skills))]
+    return [list(dict.fromkeys(rng.choices(skills, weights, k=rng.randint(3, 10)))) for _ in range(count)]
+
+def brute_force_top_k(job_skills, skill_ids, k):
+    """Score every job, the scan the inverted index avoids"""
+    candidate_skills = set(skill_ids)
+    scored = []
+    for job_id, skills in job_skills.items():
+        matched = sum(1 for skill in skills if skill in candidate_skills)
+        if matched:
+            scored.append((matched / len(skills), matched, job_id))
+    return [job_id for _, _, job_id in sorted(scored, reverse=True)[:k]]
+
+def benchmark_recommendations(repeat=5, jobs=RECOMMENDATION_JOBS, requests=200, k=10):
+    """Latency percentiles of SkillIndex.top_k over a synthetic job corpus, checked against a full scan"""
+    rng = random.Random(7)
+    skills = normalize_skills(TECHNICAL_SKILLS + SOFT_SKILLS)
+    index = SkillIndex()
+    start = time.perf_counter()
+    for job_id, job_skills in enumerate(synthetic_job_skills(rng, skills, jobs), start=1):
+        index.add(job_id, job_skills)
+    build_seconds = time.perf_counter() - start
+    
+    queries = [rng.sample(skills, rng.randint(5, 20)) for _ in range(requests)]
+    latencies = []
+    for skill_ids in queries:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            index.top_k(skill_ids, k)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        latencies.append(best)
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    
+    ok = all(
+        [job_id for job_id, _, _ in index.top_k(skill_ids, k)] == brute_force_top_k(index.job_skills, skill_ids, k)
+        for skill_ids in queries[:10]
+    )
+    return [{
+        'name': f'recommendations/{jobs}-jobs',
+        'build_seconds': build_seconds,
+        'p50_seconds': latencies[len(latencies) // 2],
+        'p99_seconds': p99,
+        'budget_seconds': RECOMMENDATION_P99_BUDGET_SECONDS,
+        'ok': ok and p99 <= RECOMMENDATION_P99_BUDGET_SECONDS,
+    }]
+
+def dense_cosine_top_k(index, term_counts, k):
+    """Cosine against every document with freshly computed norms, the scan the TF-IDF index replaces"""
+    query = {term: (1 + math.log(count)) * index.idf(term) for term, count in term_counts.items()}
+    query_norm = math.sqrt(sum(weight ** 2 for weight in query.values()))
+    scored = []
+    for doc_id, weights in index.doc_terms.items():
+        vector = {term: weight * index.idf(term) for term, weight in weights.items()}
+        dot = sum(weight * query.get(term, 0) for term, weight in vector.items())
+        if dot:
+            norm = math.sqrt(sum(weight ** 2 for weight in vector.values()))
+            scored.append((dot / (norm * query_norm), doc_id))
+    return [doc_id for _, doc_id in sorted(scored, reverse=True)[:k]]
+
+def benchmark_tfidf(repeat=5, jobs=20000, requests=50, k=10):
+    """Latency of TF-IDF top-K search over synthetic job texts, checked against a dense scan.
+
+    The synthetic texts share a small vocabulary, so every query touches
+    nearly every job: the worst case for the postings walk.
+    """
+    index = JobTextIndex()
+    start = time.perf_counter()
+    for job_id in range(1, jobs + 1):
+        index.add(job_id, job_term_counts(synthetic_resume_text(0.2, seed=job_id), ['5+ years experience']))
+    build_seconds = time.perf_counter() - start
+    
+    queries = [ResumeDocument(synthetic_resume_text(2, seed=-seed)).term_counts for seed in range(1, requests + 1)]
+    index.top_k(queries[0], k)  # Norms are recomputed once after the bulk load
+    latencies = []
+    for term_counts in queries:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            index.top_k(term_counts, k)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        latencies.append(best)
+    latencies.sort()
+    
+    ok = all(
+        [doc_id for doc_id, _ in index.top_k(term_counts, k)] == dense_cosine_top_k(index, term_counts, k)
+        for term_counts in queries[:3]
+    )
+    return [{
+        'name': f'tfidf/{jobs}-jobs',
+        'build_seconds': build_seconds,
+        'p50_seconds': latencies[len(latencies) // 2],
+        'p99_seconds': latencies[int(len(latencies) * 0.99) - 1],
+        'ok': ok,
+    }]
+
+def benchmark_job_index(repeat=5, jobs=20000, requests=50, k=10):
+    """Heap cost and latency of the in-process job indexes against the memory-mapped published index.
+
+    Each gunicorn worker pays the in-process heap and build time; the mapped
+    index costs a worker only its small Python objects, the arrays being
+    shared page cache. Both must rank identically on the same snapshot.
+    """
+    rng = random.Random(11)
+    skills = TECHNICAL_SKILLS + SOFT_SKILLS
+    rows = [
+        (job_id, job_skills, synthetic_resume_text(0.2, seed=job_id), ['5+ years experience'])
+        for job_id, job_skills in enumerate(synthetic_job_skills(rng, skills, jobs), start=1)
+    ]
+    
+    def build_in_process():
+        skill_index, text_index = SkillIndex(), JobTextIndex()
+        for row in rows:
+            skill_index.index_row(row[0], row[1])
+            text_index.index_row(row[0], row[2], row[3])
+        return skill_index, text_index
+    
+    tracemalloc.start()
+    start = time.perf_counter()
+    skill_index, text_index = build_in_process()
+    build_seconds = time.perf_counter() - start
+    heap_kb = tracemalloc.get_traced_memory()[0] // 1024
+    tracemalloc.stop()
+    
+    root = tempfile.mkdtemp()
+    try:
+        start = time.perf_counter()
+        version = write_job_index(iter(rows), root)
+        write_seconds = time.perf_counter() - start
+        tracemalloc.start()
+        start = time.perf_counter()
+        mapped = MappedJobIndex(os.path.join(root, version))
+        map_seconds = time.perf_counter() - start
+        mapped_heap_kb = tracemalloc.get_traced_memory()[0] // 1024
+        tracemalloc.stop()
+        
+        skill_queries = [normalize_skills(rng.sample(skills, rng.randint(5, 20))) for _ in range(requests)]
+        text_queries = [ResumeDocument(synthetic_resume_text(2, seed=-seed)).term_counts for seed in range(1, requests + 1)]
+        text_index.top_k(text_queries[0], k)
+        
+        def p99(search, queries):
+            latencies = sorted(time_call(search, query, k, repeat=repeat) for query in queries)
+            return latencies[int(len(latencies) * 0.99) - 1]
+        
+        ok = all(skill_index.top_k(query, k) == mapped.skill_top_k(query, k) for query in skill_queries) and all(
+            [job_id for job_id, _ in text_index.top_k(query, k)] == [job_id for job_id, _ in mapped.text_top_k(query, k)]
+            for query in text_queries[:10]
+        )
+        result = {
+            'name': f'job-index/{jobs}-jobs',
+            'build_seconds': build_seconds,
+            'heap_kb': heap_kb,
+            'write_seconds': write_seconds,
+            'map_seconds': map_seconds,
+            'mapped_heap_kb': mapped_heap_kb,
+            'skill_p99_seconds': p99(skill_index.top_k, skill_queries),
+            'mapped_skill_p99_seconds': p99(mapped.skill_top_k, skill_queries),
+            'text_p99_seconds': p99(text_index.top_k, text_queries),
+            'mapped_text_p99_seconds': p99(mapped.text_top_k, text_queries),
+            'ok': ok,
+        }
+        del mapped
+        return [result]
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+SUITES = {
+    'job-index': benchmark_job_index,
+    'tfidf': benchmark_tfidf,
+    'recommendations': benchmark_recommendations,
+}
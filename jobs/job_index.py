@@ -0,0 +1,290 @@
+"""Job skill and TF-IDF indexes stored as versioned NumPy files and memory-mapped read-only.
+
+`manage.py build_job_index` writes every array of a snapshot of the active
+jobs into a new version directory under JOB_INDEX_DIR and then points the
+CURRENT file at it with an atomic rename. Each process maps the version named
+by CURRENT with np.load(mmap_mode='r'), so gunicorn workers share the index
+pages through the OS page cache instead of each building a copy in its heap,
+and pick up a newly published version at their next check.
+
+Layout of a version directory (postings are CSR: `*_offsets[i]:*_offsets[i + 1]`
+delimits entry i):
+
+    manifest.json                     version, built_at, job and vocabulary sizes
+    skills.npy, terms.npy             sorted vocabularies, looked up with searchsorted
+    slot_jobs.npy                     job id of each slot
+    skill_offsets.npy, skill_slots.npy
+    job_skill_offsets.npy, job_skill_ids.npy
+    term_offsets.npy, term_slots.npy, term_weights.npy   TF-IDF weights, IDF applied
+    idf.npy, norms.npy
+"""
+import json
+import logging
+import math
+import os
+import shutil
+import threading
+import time
+from array import array
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from resumes.utils import normalize_skills
+
+logger = logging.getLogger(__name__)
+
+# Terms longer than this are left out of the vocabulary so it can be a fixed-width array
+MAX_TERM_LENGTH = 40
+
+def index_root():
+    return getattr(settings, 'JOB_INDEX_DIR', None)
+
+def sorted_vocabulary(ids):
+    """Sort a {word: provisional id} vocabulary; returns the words and the provisional -> sorted id map"""
+    import numpy as np
+
+    words = sorted(ids, key=ids.get)
+    order = np.argsort(np.array(words, dtype=str), kind='stable')
+    remap = np.empty(len(words), dtype=np.int32)
+    remap[order] = np.arange(len(words), dtype=np.int32)
+    return [words[position] for position in order], remap
+
+def csr(rows, columns, values, size):
+    """Group (row, column, value) entries by column into offsets, rows and values arrays"""
+    import numpy as np
+
+    order = np.argsort(columns, kind='stable')
+    offsets = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(columns, minlength=size), out=offsets[1:])
+    return offsets, rows[order], None if values is None else values[order]
+
+def write_job_index(rows, root, version=None):
+    """Write the index of (job id, skills, description, requirements) rows as a new version under root.
+
+    Rows must come in increasing job id order. Returns the version name;
+    CURRENT is not changed, see publish_job_index.
+    """
+    import numpy as np
+    from .recommendations import job_term_counts
+
+    version = version or timezone.now().strftime('%Y%m%dT%H%M%S%f')
+    built_at = timezone.now()
+    slot_jobs = array('q')
+    skill_ids, skill_rows, skill_columns = {}, array('i'), array('i')
+    term_ids, term_rows, term_columns, term_frequencies = {}, array('i'), array('i'), array('d')
+    for slot, (job_id, skills, description, requirements) in enumerate(rows):
+        slot_jobs.append(job_id)
+        for skill in normalize_skills(skills):
+            skill_rows.append(slot)
+            skill_columns.append(skill_ids.setdefault(skill, len(skill_ids)))
+        for term, count in job_term_counts(description, requirements).items():
+            if len(term) <= MAX_TERM_LENGTH:
+                term_rows.append(slot)
+                term_columns.append(term_ids.setdefault(term, len(term_ids)))
+                term_frequencies.append(1 + math.log(count))
+
+    jobs = len(slot_jobs)
+    skills, skill_remap = sorted_vocabulary(skill_ids)
+    terms, term_remap = sorted_vocabulary(term_ids)
+    skill_rows, term_rows = np.frombuffer(skill_rows, dtype=np.int32), np.frombuffer(term_rows, dtype=np.int32)
+    skill_columns = skill_remap[np.frombuffer(skill_columns, dtype=np.int32)] if len(skill_columns) else skill_rows
+    term_columns = term_remap[np.frombuffer(term_columns, dtype=np.int32)] if len(term_columns) else term_rows
+
+    # The job -> skills CSR keeps each job's skills in their original order
+    job_skill_offsets = np.zeros(jobs + 1, dtype=np.int64)
+    np.cumsum(np.bincount(skill_rows, minlength=jobs), out=job_skill_offsets[1:])
+    skill_offsets, skill_slots, _ = csr(skill_rows, skill_columns, None, len(skills))
+
+    document_frequencies = np.bincount(term_columns, minlength=len(terms))
+    idf = np.log((1 + jobs) / (1 + document_frequencies)) + 1
+    weights = np.frombuffer(term_frequencies, dtype=np.float64) * idf[term_columns]
+    norms = np.sqrt(np.bincount(term_rows, weights=weights ** 2, minlength=jobs))
+    term_offsets, term_slots, term_weights = csr(term_rows, term_columns, weights, len(terms))
+
+    directory = os.path.join(root, version)
+    temp_directory = os.path.join(root, f'.{version}.tmp')
+    os.makedirs(temp_directory)
+    arrays = {
+        'skills': np.array(skills, dtype=f'<U{max(map(len, skills), default=1)}'),
+        'terms': np.array(terms, dtype=f'<U{max(map(len, terms), default=1)}'),
+        'slot_jobs': np.frombuffer(slot_jobs, dtype=np.int64),
+        'skill_offsets': skill_offsets,
+        'skill_slots': skill_slots,
+        'job_skill_offsets': job_skill_offsets,
+        'job_skill_ids': skill_columns,
+        'term_offsets': term_offsets,
+        'term_slots': term_slots,
+        'term_weights': term_weights,
+        'idf': idf,
+        'norms': norms,
+    }
+    for name, values in arrays.items():
+        np.save(os.path.join(temp_directory, f'{name}.npy'), values)
+    with open(os.path.join(temp_directory, 'manifest.json'), 'w') as file:
+        json.dump({
+            'version': version,
+            'built_at': built_at.isoformat(),
+            'jobs': jobs,
+            'skills': len(skills),
+            'terms': len(terms),
+        }, file)
+    os.rename(temp_directory, directory)
+    return version
+
+def publish_job_index(root, version, keep=3):
+    """Point CURRENT at a version atomically and delete all but the `keep` newest versions.
+
+    Processes still mapping a deleted version keep reading it until they swap;
+    the files are freed when the last mapping is closed.
+    """
+    temp_path = os.path.join(root, 'CURRENT.tmp')
+    with open(temp_path, 'w') as file:
+        file.write(version)
+    os.replace(temp_path, os.path.join(root, 'CURRENT'))
+    versions = sorted(name for name in os.listdir(root) if not name.startswith('.') and name != 'CURRENT')
+    for name in versions[:-keep] if keep else []:
+        if name != version:
+            shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+class MappedJobIndex:
+    """One published index version, mapped read-only"""
+
+    def __init__(self, directory):
+        import numpy as np
+
+        with open(os.path.join(directory, 'manifest.json')) as file:
+            self.manifest = json.load(file)
+        self.version = self.manifest['version']
+        self.built_at = parse_datetime(self.manifest['built_at'])
+        for name in ['skills', 'terms', 'slot_jobs', 'skill_offsets', 'skill_slots', 'job_skill_offsets',
+                     'job_skill_ids', 'term_offsets', 'term_slots', 'term_weights', 'idf', 'norms']:
+            setattr(self, name, np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r'))
+        self.size = len(self.slot_jobs)
+
+    def _lookup(self, vocabulary, word):
+        """Index of a word in a sorted vocabulary array, or None"""
+        import numpy as np
+
+        position = int(np.searchsorted(vocabulary, word))
+        if position < len(vocabulary) and vocabulary[position] == word:
+            return position
+        return None
+
+    def idf_of(self, term):
+        position = self._lookup(self.terms, term)
+        if position is None:
+            return math.log(1 + self.size) + 1
+        return float(self.idf[position])
+
+    def excluded_slots(self, job_ids):
+        """Slots of the given job ids; slots are in job id order, so this is a binary search"""
+        import numpy as np
+
+        if not job_ids:
+            return []
+        job_ids = np.fromiter(job_ids, dtype=np.int64, count=len(job_ids))
+        slots = np.searchsorted(self.slot_jobs, job_ids)
+        found = slots < self.size
+        found[found] = self.slot_jobs[slots[found]] == job_ids[found]
+        return slots[found]
+
+    def skill_top_k(self, skill_ids, k=10, exclude=()):
+        """Like SkillIndex.top_k, over the mapped postings"""
+        import numpy as np
+
+        candidate_skills = set(skill_ids)
+        postings = []
+        for skill_id in candidate_skills:
+            position = self._lookup(self.skills, skill_id)
+            if position is not None:
+                postings.append(self.skill_slots[self.skill_offsets[position]:self.skill_offsets[position + 1]])
+        if not postings:
+            return []
+        counts = np.bincount(np.concatenate(postings), minlength=self.size)
+        excluded = self.excluded_slots(exclude)
+        if len(excluded):
+            counts[excluded] = 0
+        slots = np.flatnonzero(counts)
+        matched = counts[slots]
+        lengths = self.job_skill_offsets[slots + 1] - self.job_skill_offsets[slots]
+        scores = matched / lengths
+        if len(slots) > k:
+            keep = scores >= np.partition(scores, len(scores) - k)[len(scores) - k]
+            slots, matched, scores = slots[keep], matched[keep], scores[keep]
+        job_ids = self.slot_jobs[slots]
+        results = []
+        for position in np.lexsort((job_ids, matched, scores))[::-1][:k]:
+            slot = slots[position]
+            job_skills = self.skills[self.job_skill_ids[self.job_skill_offsets[slot]:self.job_skill_offsets[slot + 1]]]
+            results.append((
+                int(job_ids[position]),
+                [str(skill_id) for skill_id in job_skills if skill_id in candidate_skills],
+                round(100 * float(scores[position]), 1),
+            ))
+        return results
+
+    def text_top_k(self, term_counts, k=10, exclude=()):
+        """Like TfidfIndex.top_k, over the mapped postings"""
+        import numpy as np
+
+        slot_arrays, weight_arrays = [], []
+        query_norm = 0.0
+        for term, count in term_counts.items():
+            position = self._lookup(self.terms, term) if len(term) <= MAX_TERM_LENGTH else None
+            idf = math.log(1 + self.size) + 1 if position is None else float(self.idf[position])
+            query_weight = (1 + math.log(count)) * idf
+            query_norm += query_weight ** 2
+            if position is None:
+                continue
+            start, end = self.term_offsets[position], self.term_offsets[position + 1]
+            slot_arrays.append(self.term_slots[start:end])
+            weight_arrays.append(self.term_weights[start:end] * query_weight)
+        if not slot_arrays:
+            return []
+        dots = np.bincount(np.concatenate(slot_arrays), weights=np.concatenate(weight_arrays), minlength=self.size)
+        excluded = self.excluded_slots(exclude)
+        if len(excluded):
+            dots[excluded] = 0
+        slots = np.flatnonzero(dots)
+        scores = dots[slots] / (self.norms[slots] * math.sqrt(query_norm))
+        if len(slots) > k:
+            best = np.argpartition(scores, len(scores) - k)[len(scores) - k:]
+            slots, scores = slots[best], scores[best]
+        order = np.argsort(-scores, kind='stable')
+        return [(int(self.slot_jobs[slots[position]]), float(scores[position])) for position in order]
+
+_published = {'index': None, 'version': None, 'checked_at': 0}
+_published_lock = threading.Lock()
+
+def published_job_index():
+    """The MappedJobIndex named by JOB_INDEX_DIR/CURRENT, or None when no usable index has been published.
+
+    CURRENT is re-read every JOB_INDEX_SYNC_SECONDS; a new version is mapped and
+    swapped in for the following requests. A version that cannot be mapped is
+    not tried again until CURRENT names another one.
+    """
+    root = index_root()
+    if not root:
+        return None
+    if time.monotonic() - _published['checked_at'] < getattr(settings, 'JOB_INDEX_SYNC_SECONDS', 30):
+        return _published['index']
+    with _published_lock:
+        if time.monotonic() - _published['checked_at'] >= getattr(settings, 'JOB_INDEX_SYNC_SECONDS', 30):
+            try:
+                with open(os.path.join(root, 'CURRENT')) as file:
+                    version = file.read().strip()
+            except FileNotFoundError:
+                version = None
+            if version != _published['version']:
+                _published['index'] = map_job_index(root, version) if version else None
+                _published['version'] = version
+            _published['checked_at'] = time.monotonic()
+    return _published['index']
+
+def map_job_index(root, version):
+    """Map a published version; None, so the in-process indexes are used, if it is missing or damaged"""
+    try:
+        return MappedJobIndex(os.path.join(root, version))
+    except (OSError, ValueError, KeyError) as e:
+        logger.error(f"Job index version {version} in {root} cannot be mapped, using in-process indexes: {str(e)}")
+        return None
@@ -0,0 +1,51 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from jobs.models import Job, JobProfile
+from resumes.utils import JOB_PROFILE_VERSION, build_job_profile
+
+PROFILE_FIELDS = ['skill_ids', 'keywords', 'tokens', 'description_length', 'version']
+
+class Command(BaseCommand):
+    help = f'Build the JobProfile of every job without one or with one older than version {JOB_PROFILE_VERSION}'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Jobs profiled and written per batch')
+        parser.add_argument('--all', action='store_true', help='Rebuild up-to-date profiles as well')
+
+    def handle(self, *args, **options):
+        jobs = Job.objects.all()
+        if not options['all']:
+            jobs = jobs.filter(Q(profile__isnull=True) | Q(profile__version__lt=JOB_PROFILE_VERSION))
+        total = jobs.count()
+        self.stdout.write(f'{total} job profiles to build')
+        start = time.perf_counter()
+        last_id = 0
+        built = 0
+
+        while True:
+            # Walk the jobs by primary key; rebuilt profiles drop out of the filter
+            batch = list(jobs.filter(id__gt=last_id).select_related('profile').order_by('id')[:options['batch_size']])
+            if not batch:
+                break
+            last_id = batch[-1].id
+
+            created, updated = [], []
+            for job in batch:
+                values = build_job_profile(job)
+                try:
+                    profile = job.profile
+                except JobProfile.DoesNotExist:
+                    created.append(JobProfile(job=job, **values))
+                    continue
+                for field, value in values.items():
+                    setattr(profile, field, value)
+                updated.append(profile)
+            JobProfile.objects.bulk_create(created)
+            JobProfile.objects.bulk_update(updated, PROFILE_FIELDS)
+            built += len(batch)
+
+            elapsed = time.perf_counter() - start
+            self.stdout.write(f'{built}/{total} jobs, {built / elapsed:.1f} jobs/sec')
+
+        self.stdout.write(self.style.SUCCESS(f'Built {built} job profiles in {time.perf_counter() - start:.1f}s'))
@@ -0,0 +1,47 @@
+import time
+from django.core.management.base import BaseCommand
+from jobs.models import JobApplication
+from resumes.utils import set_application_match_scores
+
+class Command(BaseCommand):
+    help = 'Compute the match score of every job application that has none'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Applications scored and written per batch')
+        parser.add_argument('--all', action='store_true', help='Rescore applications that already have a score')
+
+    def handle(self, *args, **options):
+        applications = JobApplication.objects.all()
+        if not options['all']:
+            applications = applications.filter(match_score__isnull=True)
+        total = applications.count()
+        self.stdout.write(f'{total} job applications to score')
+        start = time.perf_counter()
+        last_id = 0
+        processed = scored = 0
+
+        while True:
+            # Walk the applications by primary key; applicants without a resume
+            # stay unscored and must not be selected again
+            batch = list(
+                applications
+                .filter(id__gt=last_id)
+                .select_related('job__profile')
+                .order_by('id')[:options['batch_size']]
+            )
+            if not batch:
+                break
+            last_id = batch[-1].id
+
+            updated = set_application_match_scores(*batch)
+            JobApplication.objects.bulk_update(updated, ['match_score'])
+            processed += len(batch)
+            scored += len(updated)
+
+            elapsed = time.perf_counter() - start
+            self.stdout.write(f'{processed}/{total} applications, {processed / elapsed:.1f} applications/sec')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Scored {scored} job applications in {time.perf_counter() - start:.1f}s '
+            f'({processed - scored} without a resume)'
+        ))
@@ -0,0 +1,6 @@
+from jobs.benchmarks import SUITES
+from resumes.management.commands.benchmark_resumes import Command as BenchmarkCommand
+
+class Command(BenchmarkCommand):
+    help = 'Benchmark job recommendations and the job indexes'
+    suites = SUITES
@@ -0,0 +1,33 @@
+import os
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from jobs.job_index import publish_job_index, write_job_index
+from jobs.models import Job
+
+class Command(BaseCommand):
+    help = 'Build the memory-mapped job skill and TF-IDF index from the active jobs and publish it'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--keep', type=int, default=3, help='Published versions kept on disk (0 keeps all)')
+        parser.add_argument('--no-publish', action='store_true', help='Write the new version without switching CURRENT to it')
+
+    def handle(self, *args, **options):
+        root = getattr(settings, 'JOB_INDEX_DIR', None)
+        if not root:
+            raise CommandError('JOB_INDEX_DIR is not set')
+        os.makedirs(root, exist_ok=True)
+
+        start = time.perf_counter()
+        rows = (
+            Job.objects.filter(status='active')
+            .order_by('id')
+            .values_list('id', 'skills', 'description', 'requirements')
+            .iterator(chunk_size=5000)
+        )
+        version = write_job_index(rows, root)
+        self.stdout.write(f'Wrote job index version {version} in {time.perf_counter() - start:.1f}s')
+
+        if not options['no_publish']:
+            publish_job_index(root, version, keep=options['keep'])
+            self.stdout.write(self.style.SUCCESS(f'Published job index version {version}'))
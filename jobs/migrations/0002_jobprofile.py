@@ -0,0 +1,27 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:33
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobProfile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('skill_ids', models.JSONField(default=list)),
+                ('keywords', models.JSONField(default=list)),
+                ('tokens', models.JSONField(default=list)),
+                ('description_length', models.IntegerField(default=0)),
+                ('version', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='profile', to='jobs.job')),
+            ],
+        ),
+    ]
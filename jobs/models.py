@@ -39,6 +39,38 @@ class Job(models.Model):
     
     def __str__(self):
         return f"{self.title} at {self.company}"
+    
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # resumes.utils and the recommendation index import this module, so they are imported on use
+        from resumes.utils import refresh_job_profile
+        from .recommendations import index_job
+        update_fields = kwargs.get('update_fields')
+        update_fields = {'description', 'requirements', 'skills', 'status'} if update_fields is None else set(update_fields)
+        if {'description', 'skills'} & update_fields:
+            refresh_job_profile(self)
+        if {'description', 'requirements', 'skills', 'status'} & update_fields:
+            index_job(self)
+    
+    def delete(self, *args, **kwargs):
+        from .recommendations import unindex_job
+        job_id = self.id
+        result = super().delete(*args, **kwargs)
+        unindex_job(job_id)
+        return result
+
+class JobProfile(models.Model):
+    """Matching data derived from a job's skills and description, rebuilt whenever the job is saved"""
+    job = models.OneToOneField(Job, on_delete=models.CASCADE, related_name='profile')
+    skill_ids = models.JSONField(default=list)
+    keywords = models.JSONField(default=list)
+    tokens = models.JSONField(default=list)
+    description_length = models.IntegerField(default=0)
+    version = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return f"Profile of job {self.job_id} (v{self.version})"
 
 class JobApplication(models.Model):
     STATUS_CHOICES = [
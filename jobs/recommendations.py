@@ -0,0 +1,483 @@
+"""Job recommendations from in-memory indexes of the active jobs.
+
+Each process keeps a SkillIndex mapping a normalized skill id to the active
+jobs requiring it, and a JobTextIndex holding TF-IDF vectors of their
+descriptions and requirements. A request walks only the postings of the
+candidate's skills or resume terms, so its cost depends on how many jobs share
+one with the candidate, not on the size of the jobs table.
+
+The indexes, and the overlays of a published index, are built in a
+background thread, started when the WSGI application loads
+(warm_job_indexes), never inside a request; until the build is done,
+requests needing an index get JobIndexNotReady. Job.save() and Job.delete()
+update the indexes of the process that made the change. Other processes pick
+changes up from `updated_at` every JOB_INDEX_SYNC_SECONDS, also in the
+background; deleted jobs are dropped when the top jobs are loaded.
+"""
+import logging
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+from resumes.utils import ResumeDocument, as_document, normalize_skills
+from .job_index import published_job_index
+from .models import Job
+from .tfidf import TfidfIndex
+
+logger = logging.getLogger(__name__)
+
+# Saves that commit after a sync started can carry an earlier updated_at
+SYNC_OVERLAP = timedelta(seconds=5)
+
+class JobIndexNotReady(Exception):
+    """The job index this process needs is still being built"""
+
+class JobIndexMixin(ABC):
+    """Keeps an index of the active jobs in sync with the jobs table.
+
+    Subclasses list the Job `fields` they are built from and index one job's
+    values in `index_row`.
+    """
+    fields = ()
+    synced_until = None
+    checked_at = 0
+
+    @abstractmethod
+    def index_row(self, job_id, *values):
+        """Index one active job from its `fields` values"""
+
+    def apply(self, job):
+        """Index or drop a saved job according to its current status"""
+        if job.status == 'active':
+            self.index_row(job.id, *(getattr(job, field) for field in self.fields))
+        else:
+            self.remove(job.id)
+
+    def build(self):
+        """Load every active job"""
+        self.synced_until = timezone.now()
+        self.checked_at = time.monotonic()
+        rows = Job.objects.filter(status='active').values_list('id', *self.fields)
+        for job_id, *values in rows.iterator(chunk_size=5000):
+            self.index_row(job_id, *values)
+
+    def sync(self):
+        """Apply jobs saved by other processes since the last sync"""
+        since = self.synced_until - SYNC_OVERLAP
+        self.synced_until = timezone.now()
+        self.checked_at = time.monotonic()
+        for job_id, status, *values in Job.objects.filter(updated_at__gte=since).values_list('id', 'status', *self.fields):
+            if status == 'active':
+                self.index_row(job_id, *values)
+            else:
+                self.remove(job_id)
+
+class SkillIndex(JobIndexMixin):
+    """Inverted index from skill id to active job ids, with vectorized top-K scoring.
+
+    Every indexed job gets a slot; postings hold slots so matched-skill counts
+    are one np.bincount over the postings of the candidate's skills. The sets
+    are the source of truth and each posting's array is rebuilt on first use
+    after it changes, so updates stay cheap.
+    """
+    fields = ('skills',)
+
+    def __init__(self):
+        self.postings = {}
+        self.arrays = {}
+        self.job_skills = {}
+        self.slots = {}
+        self.free_slots = []
+        self.size = 0
+        self.slot_jobs = None
+        self.slot_lengths = None
+        self.lock = threading.Lock()
+
+    def add(self, job_id, skill_ids):
+        """Index a job under its skill ids, replacing what was indexed for it before"""
+        with self.lock:
+            self._remove(job_id)
+            if not skill_ids:
+                return
+            slot = self._allocate_slot()
+            self.slots[job_id] = slot
+            self.slot_jobs[slot] = job_id
+            self.slot_lengths[slot] = len(skill_ids)
+            self.job_skills[job_id] = tuple(skill_ids)
+            for skill_id in skill_ids:
+                self.postings.setdefault(skill_id, set()).add(slot)
+                self.arrays.pop(skill_id, None)
+
+    def remove(self, job_id):
+        with self.lock:
+            self._remove(job_id)
+
+    def _remove(self, job_id):
+        slot = self.slots.pop(job_id, None)
+        if slot is None:
+            return
+        for skill_id in self.job_skills.pop(job_id, ()):
+            slots = self.postings.get(skill_id)
+            if slots is not None:
+                slots.discard(slot)
+                if not slots:
+                    del self.postings[skill_id]
+            self.arrays.pop(skill_id, None)
+        self.slot_lengths[slot] = 0
+        self.free_slots.append(slot)
+
+    def _allocate_slot(self):
+        import numpy as np
+
+        if self.free_slots:
+            return self.free_slots.pop()
+        if self.slot_jobs is None or self.size == len(self.slot_jobs):
+            capacity = max(1024, self.size * 2)
+            slot_jobs = np.zeros(capacity, dtype=np.int64)
+            slot_lengths = np.zeros(capacity, dtype=np.float64)
+            if self.slot_jobs is not None:
+                slot_jobs[:self.size] = self.slot_jobs[:self.size]
+                slot_lengths[:self.size] = self.slot_lengths[:self.size]
+            self.slot_jobs, self.slot_lengths = slot_jobs, slot_lengths
+        self.size += 1
+        return self.size - 1
+
+    def _posting_array(self, skill_id):
+        import numpy as np
+
+        array = self.arrays.get(skill_id)
+        if array is None:
+            slots = self.postings[skill_id]
+            array = self.arrays[skill_id] = np.fromiter(slots, dtype=np.int64, count=len(slots))
+        return array
+
+    def index_row(self, job_id, skills):
+        self.add(job_id, normalize_skills(skills))
+
+    def top_k(self, skill_ids, k=10, exclude=()):
+        """The k (job id, matched skill ids, score) with the highest share of their skills matched.
+
+        Scores are the percentage of the job's skills the candidate has; ties
+        go to the job matching more skills, then to the newest job. Only the
+        jobs sharing a skill with the candidate are scored.
+        """
+        import numpy as np
+
+        candidate_skills = set(skill_ids)
+        with self.lock:
+            arrays = [self._posting_array(skill_id) for skill_id in candidate_skills if skill_id in self.postings]
+            if not arrays:
+                return []
+            counts = np.bincount(np.concatenate(arrays), minlength=self.size)
+            excluded = [self.slots[job_id] for job_id in exclude if job_id in self.slots]
+            if excluded:
+                counts[excluded] = 0
+            slots = np.flatnonzero(counts)
+            matched = counts[slots]
+            scores = matched / self.slot_lengths[slots]
+            if len(slots) > k:
+                # Keep everything tied with the k-th best score so the tie-break below is exact
+                keep = scores >= np.partition(scores, len(scores) - k)[len(scores) - k]
+                slots, matched, scores = slots[keep], matched[keep], scores[keep]
+            job_ids = self.slot_jobs[slots]
+            order = np.lexsort((job_ids, matched, scores))[::-1][:k]
+            return [
+                (int(job_ids[position]),
+                 [skill_id for skill_id in self.job_skills[int(job_ids[position])] if skill_id in candidate_skills],
+                 round(100 * float(scores[position]), 1))
+                for position in order
+            ]
+
+    def __len__(self):
+        return len(self.job_skills)
+
+def job_term_counts(description, requirements):
+    """Term counts of a job's description and requirements"""
+    return ResumeDocument('\n'.join([description or '', *(requirements or [])])).term_counts
+
+class JobTextIndex(JobIndexMixin, TfidfIndex):
+    """TF-IDF vectors of the active jobs' descriptions and requirements"""
+    fields = ('description', 'requirements')
+
+    def index_row(self, job_id, description, requirements):
+        self.add(job_id, job_term_counts(description, requirements))
+
+def overlay_max_jobs():
+    return getattr(settings, 'JOB_INDEX_OVERLAY_MAX_JOBS', 5000)
+
+class MappedIndexOverlay(JobIndexMixin):
+    """A published, memory-mapped index plus the jobs saved since it was built.
+
+    The saved jobs are kept in this process's heap, scored in Python next to
+    the mapped index and masked out of its results; publishing a new version
+    empties the overlay. Once more than JOB_INDEX_OVERLAY_MAX_JOBS jobs have
+    changed the overlay is `outgrown` and stops loading them.
+    """
+    outgrown = False
+
+    def __init__(self, mapped):
+        self.mapped = mapped
+        self.changed = {}
+
+    def build(self):
+        self.synced_until = self.mapped.built_at
+        self.sync()
+
+    def sync(self):
+        # Counted first, so the rows of an outgrown overlay are never loaded
+        changed = Job.objects.filter(updated_at__gte=self.mapped.built_at - SYNC_OVERLAP).count()
+        if changed > overlay_max_jobs() or len(self.changed) > overlay_max_jobs():
+            self.outgrown = True
+            self.checked_at = time.monotonic()
+            return
+        super().sync()
+
+    def remove(self, job_id):
+        self.changed[job_id] = None
+
+class MappedSkillIndex(MappedIndexOverlay):
+    fields = ('skills',)
+
+    def index_row(self, job_id, skills):
+        self.changed[job_id] = normalize_skills(skills)
+
+    def top_k(self, skill_ids, k=10, exclude=()):
+        changed = dict(self.changed)
+        results = self.mapped.skill_top_k(skill_ids, k, exclude=set(exclude) | set(changed))
+        candidate_skills = set(skill_ids)
+        for job_id, job_skills in changed.items():
+            if not job_skills or job_id in exclude:
+                continue
+            matched = [skill_id for skill_id in job_skills if skill_id in candidate_skills]
+            if matched:
+                results.append((job_id, matched, round(100 * len(matched) / len(job_skills), 1)))
+        results.sort(key=lambda result: (result[2], len(result[1]), result[0]), reverse=True)
+        return results[:k]
+
+class MappedTextIndex(MappedIndexOverlay):
+    fields = ('description', 'requirements')
+
+    def index_row(self, job_id, description, requirements):
+        self.changed[job_id] = job_term_counts(description, requirements)
+
+    def top_k(self, term_counts, k=10, exclude=()):
+        changed = dict(self.changed)
+        results = self.mapped.text_top_k(term_counts, k, exclude=set(exclude) | set(changed))
+        # Saved jobs are weighted with the published IDF so their scores compare with the mapped ones
+        query = {term: (1 + math.log(count)) * self.mapped.idf_of(term) for term, count in term_counts.items()}
+        query_norm = math.sqrt(sum(weight ** 2 for weight in query.values()))
+        for job_id, job_counts in changed.items():
+            if not job_counts or job_id in exclude:
+                continue
+            weights = {term: (1 + math.log(count)) * self.mapped.idf_of(term) for term, count in job_counts.items()}
+            dot = sum(weight * query[term] for term, weight in weights.items() if term in query)
+            if dot:
+                norm = math.sqrt(sum(weight ** 2 for weight in weights.values()))
+                results.append((job_id, dot / (norm * query_norm)))
+        results.sort(key=lambda result: result[1], reverse=True)
+        return results[:k]
+
+_indexes = {}
+_building = {}
+# Overlay class -> the mapped version it has outgrown
+_stale = {}
+_indexes_lock = threading.Lock()
+
+def get_index(index_class, mapped=None):
+    """The process-wide index of a class, synced with the database in the background.
+
+    An index that is not built yet, or an overlay of another mapped version
+    than the one passed, is built in the background. Until it is done the
+    overlay of the previous version keeps serving, or JobIndexNotReady is
+    raised when there is none.
+    """
+    index = _indexes.get(index_class)
+    if index is None or getattr(index, 'mapped', None) is not mapped:
+        build_in_background(index_class, mapped)
+        if index is None:
+            raise JobIndexNotReady(index_class.__name__)
+    elif time.monotonic() - index.checked_at >= getattr(settings, 'JOB_INDEX_SYNC_SECONDS', 30):
+        sync_in_background(index_class)
+    return index
+
+def start_thread(index_class, target, *args):
+    """Run target(index_class, *args) in a thread unless one is already working on the index; call with _indexes_lock held"""
+    thread = _building.get(index_class)
+    # A thread started before a fork (gunicorn --preload) does not run in the child
+    if thread is None or not thread.is_alive():
+        thread = _building[index_class] = threading.Thread(
+            target=target,
+            args=(index_class, *args),
+            name=f'{target.__name__}-{index_class.__name__}',
+            daemon=True
+        )
+        thread.start()
+    return thread
+
+def build_in_background(index_class, mapped=None):
+    """Start building an index, or an overlay of `mapped`, unless it is built or being built; returns the thread"""
+    with _indexes_lock:
+        index = _indexes.get(index_class)
+        if index is not None and getattr(index, 'mapped', None) is mapped:
+            return None
+        return start_thread(index_class, build_index, mapped)
+
+def sync_in_background(index_class):
+    """Start applying the jobs saved by other processes to an index unless a thread is already on it"""
+    with _indexes_lock:
+        return start_thread(index_class, sync_index)
+
+def build_index(index_class, mapped=None):
+    """Build an index, or an overlay of `mapped`, and make it available to requests"""
+    close_old_connections()
+    try:
+        start = time.perf_counter()
+        index = index_class() if mapped is None else index_class(mapped)
+        index.build()
+        with _indexes_lock:
+            _indexes[index_class] = index
+        if mapped is None:
+            logger.info(f"Built {index_class.__name__} of {len(index)} jobs in {time.perf_counter() - start:.1f}s")
+        else:
+            logger.info(
+                f"Built {index_class.__name__} of {len(index.changed)} jobs changed since job index version "
+                f"{mapped.version} in {time.perf_counter() - start:.1f}s"
+            )
+    except Exception:
+        logger.exception(f"Building {index_class.__name__} failed")
+    finally:
+        finish_thread(index_class)
+
+def sync_index(index_class):
+    """Apply the jobs saved by other processes to the current index of a class"""
+    close_old_connections()
+    try:
+        index = _indexes.get(index_class)
+        if index is not None:
+            index.sync()
+    except Exception:
+        logger.exception(f"Syncing {index_class.__name__} failed")
+    finally:
+        finish_thread(index_class)
+
+def finish_thread(index_class):
+    with _indexes_lock:
+        if _building.get(index_class) is threading.current_thread():
+            del _building[index_class]
+    close_old_connections()
+
+def warm_job_indexes():
+    """Start building the overlays of the published job index, or the in-process indexes, ahead of the first request.
+
+    Called when the WSGI application loads; returns the started build threads.
+    """
+    if not getattr(settings, 'JOB_INDEX_WARM_ON_STARTUP', True):
+        return []
+    mapped = published_job_index()
+    if mapped is not None:
+        threads = [build_in_background(overlay_class, mapped) for overlay_class in [MappedSkillIndex, MappedTextIndex]]
+    else:
+        threads = [build_in_background(index_class) for index_class in [SkillIndex, JobTextIndex]]
+    return [thread for thread in threads if thread]
+
+def select_index(index_class, overlay_class):
+    """The published index with its overlay, or the in-process index when none is usable.
+
+    Once the overlay is outgrown, the in-process index is built in the
+    background and replaces the overlay until a newer version is published.
+    """
+    mapped = published_job_index()
+    if mapped is None:
+        return get_index(index_class)
+    if _stale.get(overlay_class) is mapped:
+        return get_index(index_class)
+    # A newer version has been published; release the outgrown one
+    _stale.pop(overlay_class, None)
+    try:
+        overlay = get_index(overlay_class, mapped)
+    except JobIndexNotReady:
+        # An in-process index left from an outgrown version serves until the overlay is built
+        if index_class in _indexes:
+            return get_index(index_class)
+        raise
+    if overlay.mapped is not mapped:
+        # The previous version's overlay serves until the new one is built
+        return overlay
+    if not overlay.outgrown and len(overlay.changed) <= overlay_max_jobs():
+        _indexes.pop(index_class, None)
+        return overlay
+    if index_class not in _indexes:
+        build_in_background(index_class)
+        return overlay
+    logger.warning(
+        f"More than {overlay_max_jobs()} jobs changed since job index version {mapped.version}; "
+        f"serving {index_class.__name__} from this process until build_job_index publishes a newer one"
+    )
+    with _indexes_lock:
+        _stale[overlay_class] = mapped
+        _indexes.pop(overlay_class, None)
+    return get_index(index_class)
+
+def get_skill_index():
+    """The published skill index when build_job_index has run, else one built in this process"""
+    return select_index(SkillIndex, MappedSkillIndex)
+
+def get_text_index():
+    """The published TF-IDF index when build_job_index has run, else one built in this process"""
+    return select_index(JobTextIndex, MappedTextIndex)
+
+def index_job(job):
+    """Reflect a saved job in the indexes this process has built"""
+    for index in list(_indexes.values()):
+        index.apply(job)
+
+def unindex_job(job_id):
+    for index in list(_indexes.values()):
+        index.remove(job_id)
+
+def candidate_skill_ids(user):
+    """Normalized skills from the user's profile and their parsed resume"""
+    from resumes.models import Resume
+
+    skills = list(user.skills or [])
+    parsed_data = Resume.objects.filter(user=user).values_list('parsed_data', flat=True).first()
+    if parsed_data:
+        skills += parsed_data.get('skills', [])
+    return normalize_skills(skills)
+
+def recommend_jobs(user, k=10):
+    """Up to k (job, matched skill ids, score) for the user, best first, skipping jobs they applied to.
+
+    Raises JobIndexNotReady while the skill index is being built.
+    """
+    skill_ids = candidate_skill_ids(user)
+    if not skill_ids:
+        return []
+    applied = set(user.applications.values_list('job_id', flat=True))
+    # A few spare candidates cover jobs deleted or closed since the last sync
+    ranked = get_skill_index().top_k(skill_ids, k + 5, exclude=applied)
+    jobs = Job.objects.filter(status='active').in_bulk([job_id for job_id, _, _ in ranked])
+    return [
+        (jobs[job_id], matched, score)
+        for job_id, matched, score in ranked
+        if job_id in jobs
+    ][:k]
+
+def similar_jobs(user, k=10):
+    """Up to k (job, cosine similarity) of active jobs whose text is most similar to the user's resume.
+
+    Raises JobIndexNotReady while the TF-IDF index is being built.
+    """
+    from resumes.models import Resume
+
+    extracted_text = Resume.objects.filter(user=user).values_list('extracted_text', flat=True).first()
+    if not extracted_text:
+        return []
+    applied = set(user.applications.values_list('job_id', flat=True))
+    ranked = get_text_index().top_k(as_document(extracted_text).term_counts, k + 5, exclude=applied)
+    jobs = Job.objects.filter(status='active').in_bulk([job_id for job_id, _ in ranked])
+    return [(jobs[job_id], similarity) for job_id, similarity in ranked if job_id in jobs][:k]
@@ -15,7 +15,7 @@ class JobApplicationSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = JobApplication
-        fields = ['id', 'job', 'status', 'applied_at']
+        fields = ['id', 'job', 'status', 'match_score', 'applied_at']
 
 class SavedJobSerializer(serializers.ModelSerializer):
     job = JobSerializer(read_only=True)
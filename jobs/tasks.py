@@ -0,0 +1,26 @@
+import logging
+from django.db import close_old_connections, transaction
+from resumes.tasks import get_executor
+from resumes.utils import set_application_match_scores
+from .models import JobApplication
+
+logger = logging.getLogger(__name__)
+
+def enqueue_match_score(application):
+    """Score an application in the background pool once the surrounding transaction has committed"""
+    transaction.on_commit(lambda: get_executor().submit(score_application, application.id))
+
+def score_application(application_id):
+    """Compute and store the match score of one application"""
+    close_old_connections()
+    try:
+        application = JobApplication.objects.select_related('job__profile').filter(id=application_id).first()
+        if application is None:
+            logger.warning(f"Job application {application_id} no longer exists")
+            return
+        if set_application_match_scores(application):
+            JobApplication.objects.filter(id=application_id).update(match_score=application.match_score)
+    except Exception as e:
+        logger.exception(f"Scoring job application {application_id} failed: {str(e)}")
+    finally:
+        close_old_connections()
@@ -0,0 +1,150 @@
+"""Sparse TF-IDF index with vectorized top-K cosine search.
+
+The matrix is stored by column: each term keeps the slots of the documents
+containing it and their log-scaled term frequencies, as NumPy arrays rebuilt on
+first use after the term changes. A query's dot products with every document
+are one np.bincount over the postings of the query's terms, so only documents
+sharing a term are touched; np.argpartition then selects the top K.
+
+The index knows nothing about jobs; jobs.recommendations feeds it job text.
+"""
+import math
+import threading
+
+class TfidfIndex:
+    """Incrementally updated TF-IDF vectors keyed by document id.
+
+    IDF uses the smoothed form log((1 + N) / (1 + df)) + 1 and is computed at
+    query time from the current document frequencies. Document norms depend
+    on every term's IDF; a new document's norm is computed when it is added and
+    all norms are recomputed once the documents changed since the last full
+    pass exceed `renorm_fraction` of the index.
+    """
+
+    def __init__(self, renorm_fraction=0.05):
+        self.postings = {}
+        self.arrays = {}
+        self.doc_terms = {}
+        self.slots = {}
+        self.free_slots = []
+        self.size = 0
+        self.slot_docs = None
+        self.norms = None
+        self.renorm_fraction = renorm_fraction
+        self.changes = 0
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.doc_terms)
+
+    def idf(self, term):
+        return math.log((1 + len(self.doc_terms)) / (1 + len(self.postings.get(term, ())))) + 1
+
+    def add(self, doc_id, term_counts):
+        """Index a document from its term counts, replacing what was indexed for it before"""
+        with self.lock:
+            self._remove(doc_id)
+            if not term_counts:
+                return
+            slot = self._allocate_slot()
+            weights = {term: 1 + math.log(count) for term, count in term_counts.items()}
+            self.slots[doc_id] = slot
+            self.slot_docs[slot] = doc_id
+            self.doc_terms[doc_id] = weights
+            for term, weight in weights.items():
+                self.postings.setdefault(term, {})[slot] = weight
+                self.arrays.pop(term, None)
+            self.norms[slot] = math.sqrt(sum((weight * self.idf(term)) ** 2 for term, weight in weights.items()))
+            self.changes += 1
+
+    def remove(self, doc_id):
+        with self.lock:
+            self._remove(doc_id)
+
+    def _remove(self, doc_id):
+        slot = self.slots.pop(doc_id, None)
+        if slot is None:
+            return
+        for term in self.doc_terms.pop(doc_id):
+            slots = self.postings[term]
+            del slots[slot]
+            if not slots:
+                del self.postings[term]
+            self.arrays.pop(term, None)
+        self.norms[slot] = 0
+        self.free_slots.append(slot)
+        self.changes += 1
+
+    def _allocate_slot(self):
+        import numpy as np
+
+        if self.free_slots:
+            return self.free_slots.pop()
+        if self.slot_docs is None or self.size == len(self.slot_docs):
+            capacity = max(1024, self.size * 2)
+            slot_docs = np.zeros(capacity, dtype=np.int64)
+            norms = np.zeros(capacity, dtype=np.float64)
+            if self.slot_docs is not None:
+                slot_docs[:self.size] = self.slot_docs[:self.size]
+                norms[:self.size] = self.norms[:self.size]
+            self.slot_docs, self.norms = slot_docs, norms
+        self.size += 1
+        return self.size - 1
+
+    def _term_arrays(self, term):
+        """(slots, term frequency weights) of a term's postings"""
+        import numpy as np
+
+        arrays = self.arrays.get(term)
+        if arrays is None:
+            slots = self.postings[term]
+            arrays = self.arrays[term] = (
+                np.fromiter(slots.keys(), dtype=np.int64, count=len(slots)),
+                np.fromiter(slots.values(), dtype=np.float64, count=len(slots)),
+            )
+        return arrays
+
+    def _renormalize(self):
+        """Recompute every document norm with the current IDF"""
+        import numpy as np
+
+        squares = np.zeros(self.size, dtype=np.float64)
+        for term in self.postings:
+            slots, weights = self._term_arrays(term)
+            squares += np.bincount(slots, weights=(weights * self.idf(term)) ** 2, minlength=self.size)
+        self.norms[:self.size] = np.sqrt(squares)
+        self.changes = 0
+
+    def top_k(self, term_counts, k=10, exclude=()):
+        """The k (doc id, cosine similarity) most similar to the query term counts, best first"""
+        import numpy as np
+
+        with self.lock:
+            if not any(term in self.postings for term in term_counts):
+                return []
+            if self.changes > self.renorm_fraction * len(self.doc_terms):
+                self._renormalize()
+
+            slot_arrays, weight_arrays = [], []
+            query_norm = 0.0
+            for term, count in term_counts.items():
+                idf = self.idf(term)
+                query_weight = (1 + math.log(count)) * idf
+                query_norm += query_weight ** 2
+                if term not in self.postings:
+                    continue
+                slots, weights = self._term_arrays(term)
+                slot_arrays.append(slots)
+                weight_arrays.append(weights * (idf * query_weight))
+            dots = np.bincount(np.concatenate(slot_arrays), weights=np.concatenate(weight_arrays), minlength=self.size)
+            excluded = [self.slots[doc_id] for doc_id in exclude if doc_id in self.slots]
+            if excluded:
+                dots[excluded] = 0
+
+            slots = np.flatnonzero(dots)
+            scores = dots[slots] / (self.norms[slots] * math.sqrt(query_norm))
+            if len(slots) > k:
+                best = np.argpartition(scores, len(scores) - k)[len(scores) - k:]
+                slots, scores = slots[best], scores[best]
+            order = np.argsort(-scores, kind='stable')
+            return [(int(self.slot_docs[slots[position]]), float(scores[position])) for position in order]
@@ -13,6 +13,7 @@ urlpatterns = [
     path('my-applications/', candidate_applications, name='candidate-applications'),
     path('saved/', views.saved_jobs, name='saved-jobs'),
     path('recommendations/', views.job_recommendations, name='job-recommendations'),
+    path('similar/', views.similar_jobs_view, name='similar-jobs'),
     
     # New recruiter endpoints
     path('recruiter/jobs/', views.recruiter_jobs, name='recruiter-jobs'),
@@ -3,10 +3,13 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q
+from django.conf import settings
+from django.db.models import F, Q
 from resumes.utils import calculate_skill_match_score
 from .models import Job, JobApplication, SavedJob
+from .recommendations import JobIndexNotReady, recommend_jobs, similar_jobs
 from .serializers import JobSerializer, JobApplicationSerializer, SavedJobSerializer
+from .tasks import enqueue_match_score
 
 class JobListCreateView(generics.ListCreateAPIView):
     queryset = Job.objects.filter(status='active')
@@ -91,6 +94,8 @@ Best regards,
             applicant=request.user,
             cover_letter=cover_letter
         )
+        # Scored in the background; match_score is filled in shortly after the response
+        enqueue_match_score(application)
         
         serializer = JobApplicationSerializer(application)
         return Response({
@@ -211,6 +216,19 @@ def saved_jobs(request):
     serializer = SavedJobSerializer(saved_jobs, many=True)
     return Response(serializer.data)
 
+def recommendation_limit(request):
+    """The ?limit= of a recommendation request, clamped to JOB_RECOMMENDATIONS_MAX; raises ValueError"""
+    limit = int(request.GET.get('limit', 10))
+    return max(1, min(limit, getattr(settings, 'JOB_RECOMMENDATIONS_MAX', 50)))
+
+def index_not_ready():
+    """Response while this process is still building the job index"""
+    return Response(
+        {"error": "Job recommendations are still loading, please retry shortly"},
+        status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": "5"}
+    )
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def job_recommendations(request):
@@ -218,44 +236,29 @@ def job_recommendations(request):
     Get job recommendations for the authenticated user
     """
     try:
-        # Get user's skills and preferences for recommendations
-        user = request.user
-        
-        # Placeholder recommendations - replace with actual logic
+        limit = recommendation_limit(request)
+    except ValueError:
+        return Response(
+            {"error": "limit must be a number"}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    try:
+        # Active jobs sharing skills with the user's profile and resume, best match first
         recommendations = [
             {
-                "id": 1,
-                "title": "Senior Software Engineer",
-                "company": "TechCorp Inc.",
-                "location": "Remote",
-                "salary_range": "$80,000 - $120,000",
-                "match_score": 95,
-                "description": "Looking for experienced developers...",
-                "required_skills": ["Python", "Django", "React"],
-                "posted_date": "2024-08-15"
-            },
-            {
-                "id": 2,
-                "title": "Full Stack Developer",
-                "company": "WebDev Solutions",
-                "location": "New York, NY",
-                "salary_range": "$70,000 - $100,000",
-                "match_score": 88,
-                "description": "Join our dynamic team...",
-                "required_skills": ["JavaScript", "Node.js", "PostgreSQL"],
-                "posted_date": "2024-08-16"
-            },
-            {
-                "id": 3,
-                "title": "Frontend Developer",
-                "company": "Design Studio",
-                "location": "San Francisco, CA",
-                "salary_range": "$65,000 - $90,000",
-                "match_score": 82,
-                "description": "Creative frontend role...",
-                "required_skills": ["React", "CSS", "TypeScript"],
-                "posted_date": "2024-08-17"
+                "id": job.id,
+                "title": job.title,
+                "company": job.company,
+                "location": job.location,
+                "salary_range": f"{job.currency} {job.salary_min:,} - {job.salary_max:,}",
+                "match_score": score,
+                "matched_skills": matched_skills,
+                "description": job.description[:200],
+                "required_skills": job.skills,
+                "posted_date": job.created_at.date().isoformat()
             }
+            for job, matched_skills, score in recommend_jobs(request.user, limit)
         ]
         
         return Response({
@@ -264,12 +267,49 @@ def job_recommendations(request):
             "message": "Job recommendations retrieved successfully"
         }, status=status.HTTP_200_OK)
         
+    except JobIndexNotReady:
+        return index_not_ready()
     except Exception as e:
         return Response({
             "error": "Failed to fetch job recommendations",
             "detail": str(e)
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def similar_jobs_view(request):
+    """Active jobs whose description and requirements are most similar to the user's resume"""
+    try:
+        limit = recommendation_limit(request)
+    except ValueError:
+        return Response(
+            {"error": "limit must be a number"}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    try:
+        jobs = [
+            {
+                "id": job.id,
+                "title": job.title,
+                "company": job.company,
+                "location": job.location,
+                "similarity": round(similarity * 100, 1),
+                "required_skills": job.skills,
+                "posted_date": job.created_at.date().isoformat()
+            }
+            for job, similarity in similar_jobs(request.user, limit)
+        ]
+        return Response({"jobs": jobs, "count": len(jobs)}, status=status.HTTP_200_OK)
+        
+    except JobIndexNotReady:
+        return index_not_ready()
+    except Exception as e:
+        return Response({
+            "error": "Failed to fetch similar jobs",
+            "detail": str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def recruiter_jobs(request):
@@ -290,7 +330,9 @@ def job_applicants(request, job_id):
     """Get all applicants for a specific job"""
     try:
         job = Job.objects.get(id=job_id, posted_by=request.user)
-        applications = JobApplication.objects.filter(job=job).select_related('applicant')
+        applications = JobApplication.objects.filter(job=job).select_related('applicant').order_by(
+            F('match_score').desc(nulls_last=True), '-applied_at'
+        )
         serializer = JobApplicationSerializer(applications, many=True)
         return Response(serializer.data)
     except Job.DoesNotExist:
@@ -1,7 +1,9 @@
 
 from django.contrib import admin
-from .models import Resume,ResumeAnalysis,SkillExtraction
+from .models import Resume,ResumeAnalysis,ResumeParseJob,ParsedResumeCache,SkillExtraction
 
 admin.site.register(Resume)
 admin.site.register(ResumeAnalysis)
+admin.site.register(ResumeParseJob)
+admin.site.register(ParsedResumeCache)
 admin.site.register(SkillExtraction)
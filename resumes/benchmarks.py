@@ -0,0 +1,725 @@
+"""Benchmarks for the resume parsing pipeline.
+
+Run them with ``python manage.py benchmark_resumes``. Every suite returns a list
+of result dicts so the numbers can be printed or compared between commits:
+``--json results.json`` saves a run and ``--baseline results.json`` fails on
+timings or memory peaks that grew past ``--threshold``.
+"""
+import io
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+from django.conf import settings
+from . import docx_extraction, pdf_extraction
+from .scoring import ats_scores, feature_matrix, overall_scores, resume_features
+from .utils import (
+    SOFT_SKILLS, TECHNICAL_SKILLS, calculate_simple_similarity, extract_contact_info, extract_docx_python_docx,
+    PARSE_STAGES, ResumeDocument, extract_text_from_docx, extract_text_from_pdf, get_document, get_skill_matcher,
+    is_technical_skill_token, match_skill_tokens, parse_resume, parse_resume_text,
+)
+
+FILLER_WORDS = [
+    'designed', 'implemented', 'delivered', 'managed', 'improved', 'reduced', 'team',
+    'platform', 'customers', 'services', 'pipeline', 'performance', 'reliability',
+    'stakeholders', 'requirements', 'migration', 'latency', 'features', 'release',
+    'production', 'google', 'javascript', 'reporting', 'analytics', 'dashboards',
+]
+
+SECTION_HEADERS = ['Summary', 'Experience', 'Education', 'Skills', 'Projects', 'Certifications']
+
+# Hand-written resumes used to check that optimised extractors keep their output
+REGRESSION_RESUMES = [
+    """Priya Raman
+priya.raman@example.com | +91 98765 43210 | linkedin.com/in/priyaraman
+Professional Summary
+Full-stack engineer with 7 years of experience shipping Python and TypeScript products.
+Professional Experience
+Senior Software Engineer, Finlytics (2020 - Present)
+Led migration of a Django monolith to FastAPI microservices on AWS with Docker and Kubernetes.
+Built React and Redux dashboards; introduced Jest, Cypress and GitHub Actions pipelines.
+Software Developer, Cartwheel Labs (2017 - 2020)
+Developed Node.js and Express.js APIs backed by PostgreSQL, Redis and Elasticsearch.
+Education
+B.Tech in Computer Science, Anna University, 2013 - 2017
+Technical Skills
+Python, Django, Flask, FastAPI, JavaScript, TypeScript, React, Node.js, PostgreSQL, MongoDB,
+Redis, Docker, Kubernetes, Terraform, AWS, Git, Jira, Agile, Scrum
+Projects
+Resumatch - resume matching engine using Scikit-learn, Pandas and NLTK
+Certifications
+AWS Certified Solutions Architect - Associate (2021)
+""",
+    """MARCUS OYELARAN
+Data Scientist | marcus.o@example.org | (415) 555-0199 | github.com/moyelaran
+SUMMARY
+Data scientist focused on forecasting and experimentation. Comfortable with Python, R and SQL.
+EXPERIENCE
+Lead Data Scientist - Northwind Retail, 2019 to 2024
+Built demand forecasting with PyTorch, TensorFlow and Apache Spark on Hadoop; reduced stockouts 18%.
+Owned Tableau and Power BI reporting, mentoring five analysts in Pandas, NumPy and Matplotlib.
+Analyst - Contoso Health, 2016 to 2019
+Designed A/B testing framework in Jupyter and Seaborn; automated ETL with Airflow and Bash.
+EDUCATION
+M.S. Statistics, University of Michigan, 2016
+B.S. Mathematics, Georgia Tech, 2014
+SKILLS
+Machine Learning; Deep Learning; Keras; OpenCV; spaCy; Leadership; Communication; Mentoring
+""",
+    """Elena Fischer - Mobile & Frontend Developer
+elena.fischer@example.net   +49 30 1234567   linkedin.com/in/elena-fischer
+About
+Designer-turned-developer building iOS and Android apps with Flutter, React Native and Swift.
+Work History
+Mobile Developer at Appwerk GmbH 2021-2024: Kotlin, Swift, Firebase, Figma handoff, Sketch.
+Frontend Developer at Pixelhaus 2018-2021: Vue.js, Nuxt.js, Angular, Tailwind CSS, SASS, Webpack.
+Education
+Diploma, Media Informatics, HTW Berlin, 2018
+Skills & Tools
+Flutter | React Native | Swift | Kotlin | Vue.js | Angular | Tailwind CSS | Photoshop | Illustrator
+Teamwork, Creativity, Attention to Detail, Time Management, Problem Solving
+""",
+]
+
+# Roughly one page of resume text
+CHARS_PER_PAGE = 3000
+
+def synthetic_resume_text(pages, seed=0, skill_lines=0):
+    """Build a deterministic plain-text resume of about `pages` pages.
+
+    `skill_lines` adds a skills section of that many comma-separated skill
+    lists right after the contact details.
+    """
+    rng = random.Random(seed)
+    skills = TECHNICAL_SKILLS + SOFT_SKILLS
+    lines = ['Jane Candidate', 'jane.candidate@example.com | +1 (555) 010-2030']
+    if skill_lines:
+        lines.append('SKILLS')
+        lines.extend(', '.join(rng.sample(skills, 8)) for _ in range(skill_lines))
+    size = 0
+    while size < pages * CHARS_PER_PAGE:
+        header = rng.choice(SECTION_HEADERS)
+        lines.append(header)
+        for _ in range(rng.randint(4, 10)):
+            words = [rng.choice(FILLER_WORDS) for _ in range(rng.randint(6, 14))]
+            words.insert(rng.randint(0, len(words)), rng.choice(skills))
+            if rng.random() < 0.3:
+                words.append(f"{rng.randint(2005, 2024)}")
+            line = ' '.join(words).capitalize()
+            lines.append(line)
+            size += len(line) + 1
+    return '\n'.join(lines)
+
+def pdf_escape(text):
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+def synthetic_pdf_bytes(pages, columns=1, seed=0, lines_per_column=48, skill_lines=0):
+    """Build a minimal PDF with a Helvetica text layer in one or more columns"""
+    source_lines = synthetic_resume_text(pages + 1, seed=seed, skill_lines=skill_lines).split('\n')
+    column_width = 500 // columns
+    chars_per_line = max(column_width // 5, 20)
+    
+    objects = []
+    page_ids = []
+    # 1: catalog, 2: page tree, 3: font; pages and their content streams follow
+    next_id = 4
+    line_index = 0
+    for _ in range(pages):
+        stream_parts = []
+        for column in range(columns):
+            stream_parts.append(f'BT /F1 9 Tf 11 TL {50 + column * column_width} 790 Td')
+            for _ in range(lines_per_column):
+                line = source_lines[line_index % len(source_lines)][:chars_per_line]
+                line_index += 1
+                stream_parts.append(f'({pdf_escape(line)}) Tj T*')
+            stream_parts.append('ET')
+        stream = '\n'.join(stream_parts).encode('latin-1', 'replace')
+        page_id, content_id = next_id, next_id + 1
+        next_id += 2
+        page_ids.append(page_id)
+        objects.append((page_id, (
+            f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] '
+            f'/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>'
+        ).encode()))
+        objects.append((content_id, b'<< /Length %d >>\nstream\n' % len(stream) + stream + b'\nendstream'))
+    
+    kids = ' '.join(f'{page_id} 0 R' for page_id in page_ids)
+    objects = [
+        (1, b'<< /Type /Catalog /Pages 2 0 R >>'),
+        (2, f'<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>'.encode()),
+        (3, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>'),
+    ] + objects
+    
+    output = bytearray(b'%PDF-1.4\n')
+    offsets = {}
+    for object_id, body in objects:
+        offsets[object_id] = len(output)
+        output += b'%d 0 obj\n' % object_id + body + b'\nendobj\n'
+    xref_offset = len(output)
+    output += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    for object_id in range(1, len(objects) + 1):
+        output += b'%010d 00000 n \n' % offsets[object_id]
+    output += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref_offset)
+    return bytes(output)
+
+def synthetic_docx_bytes(pages, tables=0, seed=0, skill_lines=0):
+    """Build a DOCX resume of about `pages` pages of paragraphs plus `tables` skill tables"""
+    from docx import Document
+    
+    rng = random.Random(seed)
+    document = Document()
+    for index, line in enumerate(synthetic_resume_text(pages, seed=seed, skill_lines=skill_lines).split('\n')):
+        paragraph = document.add_paragraph(line)
+        if index % 7 == 3:
+            paragraph.add_run('\tremote')
+        if index % 11 == 5:
+            paragraph.add_run().add_break()
+            paragraph.add_run('continued')
+    for _ in range(tables):
+        table = document.add_table(rows=8, cols=4)
+        for row in table.rows:
+            for cell in row.cells:
+                cell.text = rng.choice(TECHNICAL_SKILLS)
+                if rng.random() < 0.2:
+                    cell.add_paragraph(f"{rng.randint(1, 10)} years")
+    output = io.BytesIO()
+    document.save(output)
+    return output.getvalue()
+
+def write_temp_file(data, suffix):
+    """Write bytes to a named temporary file and return its path"""
+    handle, path = tempfile.mkstemp(suffix=suffix)
+    with os.fdopen(handle, 'wb') as file:
+        file.write(data)
+    return path
+
+def time_call(func, *args, repeat=5):
+    """Best wall time of `repeat` calls, in seconds"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def legacy_skill_scan(text):
+    """The previous direct matching: one substring scan of the text per skill"""
+    text_lower = text.lower()
+    return [skill for skill in TECHNICAL_SKILLS + SOFT_SKILLS if skill.lower() in text_lower]
+
+def per_skill_boundary_scan(patterns, text):
+    """One word-boundary regex search per skill, the correct form of the legacy scan"""
+    text_lower = text.lower()
+    return [pattern for pattern in patterns if pattern.search(text_lower)]
+
+def legacy_skill_token_scan(tokens):
+    """The previous token x skill comparison loop"""
+    found = []
+    for token in tokens:
+        if token.istitle() and len(token) > 2:
+            for tech in TECHNICAL_SKILLS:
+                if tech.lower() in token.lower() or token.lower() in tech.lower():
+                    if token not in found:
+                        found.append(token)
+    return found
+
+def simple_tokens(text):
+    """Tokenizer used by the benchmarks; the comparisons do not depend on NLTK data"""
+    return re.findall(r"[\w.+#-]+", text)
+
+def cold_match_skill_tokens(tokens):
+    """match_skill_tokens without the benefit of the per-token cache"""
+    is_technical_skill_token.cache_clear()
+    return match_skill_tokens(tokens)
+
+def tier_points(value, steps):
+    """Points of the first (threshold, points) step that value reaches, else 0"""
+    for threshold, points in steps:
+        if value >= threshold:
+            return points
+    return 0
+
+def legacy_overall_score(resume):
+    """The previous per-resume overall rubric over parsed_data"""
+    sections = resume.parsed_data.get('sections', {})
+    score = sum(weight for section, weight in [('contact', 10), ('experience', 15), ('education', 10), ('skills', 5)]
+                if sections.get(section, False))
+    score += tier_points(len(resume.parsed_data.get('skills', [])), [(10, 20), (5, 15), (3, 10), (1, 5)])
+    score += tier_points(len(resume.parsed_data.get('experience', [])), [(3, 10), (1, 5)])
+    score += tier_points(len(resume.extracted_text), [(2000, 15), (1000, 12), (500, 8), (200, 5)])
+    score += tier_points(len(resume.parsed_data.get('keywords', [])), [(15, 10), (10, 7), (5, 5)])
+    contact_info = resume.parsed_data.get('contact_info', {})
+    score += 3 if contact_info.get('email') else 0
+    score += 2 if contact_info.get('phone') else 0
+    return min(score, 100)
+
+def legacy_ats_score(resume):
+    """The previous per-resume ATS rubric over parsed_data"""
+    score = 20 if resume.original_filename.lower().endswith(('.pdf', '.docx')) else 0
+    sections = resume.parsed_data.get('sections', {})
+    score += sum(10 for section in ['contact', 'experience', 'skills'] if sections.get(section))
+    score += tier_points(len(resume.parsed_data.get('skills', [])), [(8, 30), (5, 20), (3, 15), (1, 10)])
+    non_empty_lines = [line for line in resume.extracted_text.split('\n') if line.strip()]
+    score += tier_points(len(non_empty_lines), [(20, 20), (15, 15), (10, 10), (5, 5)])
+    return min(score, 100)
+
+def regression_corpus():
+    """Hand-written resumes followed by synthetic ones of increasing length"""
+    corpus = [(f'handwritten-{index}', text) for index, text in enumerate(REGRESSION_RESUMES)]
+    corpus += [(f'synthetic-{pages}-pages', synthetic_resume_text(pages, seed=pages)) for pages in (1, 2, 5, 20)]
+    return corpus
+
+def benchmark_skill_tokens(repeat=5):
+    """Check the precomputed token lookup against the token x skill loop and time both"""
+    results = []
+    for name, text in regression_corpus():
+        tokens = simple_tokens(text)
+        expected = set(legacy_skill_token_scan(tokens))
+        actual = set(match_skill_tokens(tokens))
+        results.append({
+            'name': f'skill-tokens/{name}',
+            'tokens': len(tokens),
+            'legacy_seconds': time_call(legacy_skill_token_scan, tokens, repeat=repeat),
+            'seconds': time_call(cold_match_skill_tokens, tokens, repeat=repeat),
+            'ok': expected == actual,
+        })
+    return results
+
+def benchmark_skill_matching(repeat=5, pages=(2, 20)):
+    """Compare the previous skill scan with the compiled single-pass skill matcher.
+
+    `legacy_seconds` is the previous plain substring loop and `speedup` is
+    measured against it; it is fast but produces false matches ('Go' in
+    'Google'). `per_skill_seconds` is the same loop with the word-boundary
+    checks the matcher applies, the cost of fixing the old code in place.
+    """
+    matcher = get_skill_matcher()
+    boundary_patterns = [
+        re.compile(r'(?<!\w)' + re.escape(skill.lower()) + (r'(?!\w)' if skill[-1].isalnum() else ''))
+        for skill in TECHNICAL_SKILLS + SOFT_SKILLS
+    ]
+    results = []
+    for page_count in pages:
+        text = synthetic_resume_text(page_count)
+        legacy = time_call(legacy_skill_scan, text, repeat=repeat)
+        per_skill = time_call(per_skill_boundary_scan, boundary_patterns, text, repeat=repeat)
+        compiled = time_call(matcher.find_skills, text, repeat=repeat)
+        results.append({
+            'name': f'skills/{page_count}-pages',
+            'chars': len(text),
+            'legacy_seconds': legacy,
+            'per_skill_seconds': per_skill,
+            'seconds': compiled,
+            'speedup': legacy / compiled if compiled else None,
+            'speedup_vs_per_skill': per_skill / compiled if compiled else None,
+            'false_matches_avoided': len(set(legacy_skill_scan(text)) - set(matcher.find_skills(text))),
+            'ok': set(matcher.find_skills(text)) == {match.skill for match in matcher.finditer(text)},
+        })
+    return results
+
+# Inputs that make backtracking patterns blow up, as functions of a size n
+ADVERSARIAL_CONTACT_INPUTS = {
+    'digit-run': lambda n: '9' * n,
+    'spaced-digits': lambda n: '1 ' * (n // 2),
+    'whitespace-run': lambda n: '5' + ' ' * n + '5',
+    'dotted-local-part': lambda n: 'a.' * (n // 2),
+    'at-signs': lambda n: 'a@' * (n // 2),
+    'dotted-domain': lambda n: 'x@' + 'a.' * (n // 2),
+    'table-dump': lambda n: ' '.join(['2019', '(12)', '3.5', '-', '100000']) * (n // 24),
+}
+
+# (text, expected phone) pairs for the contact layout checks
+CONTACT_LAYOUT_CASES = [
+    ('John Doe\n555-010-2030\n10 Main St', '555-010-2030'),
+    ('555-010-2030\n2019', '555-010-2030'),
+    ('DOB 12.03.1990 555-010-2030', '555-010-2030'),
+    ('Born 1990-03-12, +1 (555) 010-2030', '+1 (555) 010-2030'),
+    ('Phone:\t555 010 2030\nLinkedIn', '555 010 2030'),
+    ('06.12.34.56.78', '06.12.34.56.78'),
+    ('Experience 2015 - 2019\n2019 - 2023', None),
+]
+
+# Largest allowed time ratio between consecutive sizes that double the input;
+# a linear scan stays near 2, a quadratic one approaches 4
+LINEAR_GROWTH_LIMIT = 3.0
+
+def benchmark_contact_extraction(repeat=5, sizes=(25000, 50000, 100000, 200000), fuzz_cases=200):
+    """Show contact extraction stays linear on adversarial input and finds planted contacts"""
+    results = []
+    for name, build in ADVERSARIAL_CONTACT_INPUTS.items():
+        timings = [time_call(extract_contact_info, build(size), repeat=repeat) for size in sizes]
+        growth = max(later / earlier for earlier, later in zip(timings, timings[1:]) if earlier)
+        results.append({
+            'name': f'contact/{name}',
+            'chars': sizes[-1],
+            'seconds': timings[-1],
+            'max_growth': growth,
+            'ok': growth < LINEAR_GROWTH_LIMIT,
+        })
+    
+    # Fuzz: plant known contact details above random noise and check they come back
+    rng = random.Random(0)
+    alphabet = '0123456789     ()+-.@_abcXYZ\n\t'
+    failures = 0
+    slowest = 0.0
+    for _ in range(fuzz_cases):
+        noise = ''.join(rng.choice(alphabet) for _ in range(rng.randint(100, 5000)))
+        text = f"Jane Candidate\njane.candidate@example.com | +1 (555) 010-2030\nExperience\n{noise}"
+        start = time.perf_counter()
+        contact_info = extract_contact_info(text)
+        slowest = max(slowest, time.perf_counter() - start)
+        if (contact_info.get('email') != 'jane.candidate@example.com'
+                or contact_info.get('phone') != '+1 (555) 010-2030'):
+            failures += 1
+    
+    # Layouts where a phone number sits next to an address line or a date
+    layout_failures = [
+        text for text, phone in CONTACT_LAYOUT_CASES
+        if extract_contact_info(text).get('phone') != phone
+    ]
+    results.append({
+        'name': 'contact/layouts',
+        'cases': len(CONTACT_LAYOUT_CASES),
+        'failures': len(layout_failures),
+        'ok': not layout_failures,
+    })
+    results.append({
+        'name': 'contact/fuzz',
+        'cases': fuzz_cases,
+        'seconds': slowest,
+        'failures': failures,
+        'ok': failures == 0,
+    })
+    return results
+
+def benchmark_pdf_pages(repeat=3, pages=(2, 20, 40)):
+    """Compare serial and process-pool pdfplumber extraction on synthetic PDFs"""
+    workers = max(getattr(settings, 'RESUME_PDF_WORKERS', 2), 2)
+    results = []
+    for page_count in pages:
+        path = write_temp_file(synthetic_pdf_bytes(page_count), '.pdf')
+        try:
+            serial = lambda: pdf_extraction.extract_pdfplumber(path, page_count, 10 ** 9, page_count + 1, 1)[0]
+            parallel = lambda: pdf_extraction.extract_pdfplumber(path, page_count, 10 ** 9, 1, workers)[0]
+            # Warm the pool so process start-up is not counted against the first size
+            parallel()
+            results.append({
+                'name': f'pdf-pages/{page_count}-pages',
+                'workers': workers,
+                'serial_seconds': time_call(serial, repeat=repeat),
+                'seconds': time_call(parallel, repeat=repeat),
+                'ok': serial() == parallel(),
+            })
+        finally:
+            os.remove(path)
+    return results
+
+# (name, pages, columns) of the synthetic PDF fixtures used to compare strategies
+PDF_STRATEGY_CORPUS = [
+    ('single-column-2', 2, 1),
+    ('single-column-10', 10, 1),
+    ('two-column-2', 2, 2),
+    ('three-column-2', 2, 3),
+]
+
+def benchmark_pdf_strategies(repeat=3):
+    """Time the PyPDF2 and pdfplumber extractors and the auto-selected strategy"""
+    results = []
+    for name, pages, columns in PDF_STRATEGY_CORPUS:
+        path = write_temp_file(synthetic_pdf_bytes(pages, columns=columns), '.pdf')
+        try:
+            def run(strategy):
+                return pdf_extraction.extract_tiered(path, pages, 10 ** 9, pages + 1, 1, strategy=strategy)
+            
+            _, auto_info = run('auto')
+            results.append({
+                'name': f'pdf-strategy/{name}',
+                'chosen': auto_info['strategy'],
+                'pypdf2_seconds': time_call(run, 'fast', repeat=repeat),
+                'pdfplumber_seconds': time_call(run, 'pdfplumber', repeat=repeat),
+                'seconds': time_call(run, 'auto', repeat=repeat),
+            })
+        finally:
+            os.remove(path)
+    return results
+
+def peak_memory(func, *args):
+    """Peak traced Python allocation, in bytes, while running func(*args)"""
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def consume_streamed_pages(path):
+    for _ in pdf_extraction.stream_pdf_pages(path, 10 ** 6, 10 ** 12):
+        pass
+
+def consume_cached_pages(path):
+    """The previous access pattern: every page stays cached in pdf.pages"""
+    import pdfplumber
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages:
+            page.extract_text()
+
+# Peak memory of the largest document may exceed the smallest by this factor
+FLAT_MEMORY_LIMIT = 1.5
+
+def benchmark_pdf_memory(repeat=1, pages=(5, 20, 40)):
+    """Check with tracemalloc that streaming extraction memory stays flat as pages grow"""
+    results = []
+    baseline = None
+    for page_count in pages:
+        path = write_temp_file(synthetic_pdf_bytes(page_count), '.pdf')
+        try:
+            streamed = peak_memory(consume_streamed_pages, path)
+            cached = peak_memory(consume_cached_pages, path)
+        finally:
+            os.remove(path)
+        baseline = baseline or streamed
+        results.append({
+            'name': f'pdf-memory/{page_count}-pages',
+            'cached_peak_kb': cached // 1024,
+            'peak_kb': streamed // 1024,
+            'growth': streamed / baseline,
+            'ok': streamed <= baseline * FLAT_MEMORY_LIMIT,
+        })
+    return results
+
+DOCX_CORPUS = [
+    ('paragraphs-2', 2, 0),
+    ('paragraphs-20', 20, 0),
+    ('tables-20', 2, 20),
+    ('tables-200', 2, 200),
+]
+
+def sorted_lines(text):
+    """Lines of the text in sorted order; the streaming extractor keeps document
+    order, while python-docx listed every paragraph before every table"""
+    return sorted(text.split('\n'))
+
+def benchmark_docx(repeat=3):
+    """Check the streaming DOCX extractor against python-docx, then time both and trace peak memory"""
+    results = []
+    for name, pages, tables in DOCX_CORPUS:
+        path = write_temp_file(synthetic_docx_bytes(pages, tables=tables, seed=pages + tables), '.docx')
+        try:
+            streamed = docx_extraction.extract_docx_stream(path)
+            legacy = extract_docx_python_docx(path)
+            results.append({
+                'name': f'docx/{name}',
+                'equivalent': sorted_lines(streamed) == sorted_lines(legacy),
+                'python_docx_seconds': time_call(extract_docx_python_docx, path, repeat=repeat),
+                'seconds': time_call(docx_extraction.extract_docx_stream, path, repeat=repeat),
+                'python_docx_peak_kb': peak_memory(extract_docx_python_docx, path) // 1024,
+                'peak_kb': peak_memory(docx_extraction.extract_docx_stream, path) // 1024,
+            })
+            results[-1]['ok'] = results[-1]['equivalent']
+        finally:
+            os.remove(path)
+    return results
+
+def benchmark_parse(repeat=5, jobs=200):
+    """Time parse_resume_text over the regression corpus and one resume compared against many jobs"""
+    results = []
+    for name, text in regression_corpus():
+        results.append({
+            'name': f'parse/{name}',
+            'chars': len(text),
+            'seconds': time_call(parse_resume_text, text, repeat=repeat),
+        })
+    
+    resume_text = synthetic_resume_text(2, seed=1)
+    descriptions = [synthetic_resume_text(0.3, seed=seed) for seed in range(jobs)]
+    
+    def compare_all():
+        get_document.cache_clear()
+        return [calculate_simple_similarity(resume_text, description) for description in descriptions]
+    
+    results.append({
+        'name': f'parse/similarity-{jobs}-jobs',
+        'seconds': time_call(compare_all, repeat=repeat),
+    })
+    return results
+
+def benchmark_scoring(repeat=5, corpus_size=20000):
+    """Check the vectorized rubrics against the per-resume ones and time both over a large corpus"""
+    resumes = []
+    for name, text in regression_corpus():
+        parsed_data = parse_resume_text(text)
+        for filename in (f'{name}.pdf', f'{name}.txt'):
+            resumes.append(SimpleNamespace(extracted_text=text, parsed_data=parsed_data, original_filename=filename))
+    vectors = [resume_features(r.extracted_text, r.parsed_data, r.original_filename) for r in resumes]
+    matrix = feature_matrix(vectors)
+    expected = [(legacy_overall_score(r), legacy_ats_score(r)) for r in resumes]
+    actual = list(zip(overall_scores(matrix).tolist(), ats_scores(matrix).tolist()))
+
+    # A corpus-sized set of stored vectors, as rescore_resumes loads them
+    corpus = (resumes * (corpus_size // len(resumes) + 1))[:corpus_size]
+    corpus_vectors = (vectors * (corpus_size // len(vectors) + 1))[:corpus_size]
+
+    def score_loop():
+        return [(legacy_overall_score(r), legacy_ats_score(r)) for r in corpus]
+
+    def score_matrix():
+        matrix = feature_matrix(corpus_vectors)
+        return overall_scores(matrix), ats_scores(matrix)
+
+    return [{
+        'name': f'scoring/{corpus_size}-resumes',
+        'legacy_seconds': time_call(score_loop, repeat=repeat),
+        'seconds': time_call(score_matrix, repeat=repeat),
+        'ok': expected == actual,
+    }]
+
+# Fresh-interpreter `django.setup()` plus URLconf import must finish within this
+# many seconds, without importing any of the heavy modules below
+STARTUP_BUDGET_SECONDS = 1.5
+HEAVY_MODULES = ['nltk', 'pdfplumber', 'pdfminer', 'PyPDF2', 'docx', 'google.generativeai', 'numpy']
+
+STARTUP_SCRIPT = """
+import json, os, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+from django.conf import settings
+__import__(settings.ROOT_URLCONF)
+print(json.dumps({'seconds': time.perf_counter() - start, 'loaded': [name for name in sys.argv[1:] if name in sys.modules]}))
+"""
+
+def benchmark_startup(repeat=3):
+    """Time django.setup() plus the URLconf import in a fresh interpreter and check no heavy module loads"""
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'career_ai_backend.settings'))
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', STARTUP_SCRIPT, *HEAVY_MODULES],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, check=True
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    best = min(run['seconds'] for run in runs)
+    loaded = sorted(set(name for run in runs for name in run['loaded']))
+    return [{
+        'name': 'startup/setup-and-urls',
+        'budget_seconds': STARTUP_BUDGET_SECONDS,
+        'seconds': best,
+        'heavy_modules_loaded': ','.join(loaded) or 'none',
+        'ok': best <= STARTUP_BUDGET_SECONDS and not loaded,
+    }]
+
+# (name, suffix, generator arguments) of the synthetic pipeline corpus
+PIPELINE_CORPUS = [
+    ('pdf-1-page', '.pdf', {'pages': 1}),
+    ('pdf-10-pages', '.pdf', {'pages': 10}),
+    ('pdf-40-pages', '.pdf', {'pages': 40}),
+    ('pdf-2-columns-5-pages', '.pdf', {'pages': 5, 'columns': 2}),
+    ('pdf-2-columns-40-pages', '.pdf', {'pages': 40, 'columns': 2}),
+    ('pdf-3-columns-2-pages', '.pdf', {'pages': 2, 'columns': 3}),
+    ('pdf-long-skills-2-pages', '.pdf', {'pages': 2, 'skill_lines': 80}),
+    ('docx-1-page', '.docx', {'pages': 1}),
+    ('docx-20-pages', '.docx', {'pages': 20}),
+    ('docx-tables-100', '.docx', {'pages': 2, 'tables': 100}),
+    ('docx-long-skills', '.docx', {'pages': 2, 'skill_lines': 80}),
+]
+
+def synthetic_corpus():
+    """Yield (name, suffix, bytes) for every document of the pipeline corpus, deterministically"""
+    for index, (name, suffix, arguments) in enumerate(PIPELINE_CORPUS):
+        generate = synthetic_pdf_bytes if suffix == '.pdf' else synthetic_docx_bytes
+        yield name, suffix, generate(seed=index, **arguments)
+
+def time_parse_stages(text, repeat=5):
+    """Best time of each parse_resume_text stage, sharing one document per run like the parser does"""
+    best = {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        document = ResumeDocument(text)
+        document.segments
+        timings = {'segment': time.perf_counter() - start}
+        for field, extractor in PARSE_STAGES:
+            start = time.perf_counter()
+            extractor(text, document)
+            timings[field] = time.perf_counter() - start
+        for stage, elapsed in timings.items():
+            best[stage] = min(best.get(stage, elapsed), elapsed)
+    return best
+
+def benchmark_pipeline(repeat=5):
+    """Time text extraction and every parse stage on the synthetic corpus and trace peak memory.
+
+    The memory peak covers this process only; PDF pages extracted by the
+    parallel page-range workers are not traced.
+    """
+    # Build the skill matchers up front so their one-off cost is not charged to a document
+    get_skill_matcher()
+    results = []
+    for name, suffix, data in synthetic_corpus():
+        path = write_temp_file(data, suffix)
+        try:
+            extract = extract_text_from_pdf if suffix == '.pdf' else extract_text_from_docx
+            text = extract(path)
+            result = {
+                'name': f'pipeline/{name}',
+                'bytes': len(data),
+                'chars': len(text),
+                'extract_seconds': time_call(extract, path, repeat=repeat),
+            }
+            stages = time_parse_stages(text, repeat=repeat)
+            for stage, elapsed in stages.items():
+                result[f'{stage}_seconds'] = elapsed
+            result['parse_seconds'] = sum(stages.values())
+            result['peak_kb'] = peak_memory(parse_resume, path) // 1024
+            results.append(result)
+        finally:
+            os.remove(path)
+    return results
+
+# Differences below these floors are noise, not regressions
+NOISE_FLOOR_SECONDS = 0.002
+NOISE_FLOOR_KB = 256
+
+def compare_results(results, baseline, threshold):
+    """List the timings and memory peaks that grew by more than `threshold` (e.g. 1.25) over the baseline.
+
+    Both arguments map suite names to result lists as written by
+    `benchmark_resumes --json`; results are matched by name.
+    """
+    regressions = []
+    for suite, suite_results in results.items():
+        previous = {result['name']: result for result in baseline.get(suite, [])}
+        for result in suite_results:
+            old = previous.get(result['name'])
+            if not old:
+                continue
+            for key, value in result.items():
+                if not (key.endswith('seconds') or key.endswith('_kb')) or key.startswith('budget'):
+                    continue
+                old_value = old.get(key)
+                if not isinstance(old_value, (int, float)) or not isinstance(value, (int, float)):
+                    continue
+                floor = NOISE_FLOOR_SECONDS if key.endswith('seconds') else NOISE_FLOOR_KB
+                if value > old_value * threshold and value - old_value > floor:
+                    regressions.append(f"{result['name']} {key}: {old_value:.6g} -> {value:.6g}")
+    return regressions
+
+SUITES = {
+    'skills': benchmark_skill_matching,
+    'skill-tokens': benchmark_skill_tokens,
+    'contact': benchmark_contact_extraction,
+    'pdf-pages': benchmark_pdf_pages,
+    'pdf-strategy': benchmark_pdf_strategies,
+    'pdf-memory': benchmark_pdf_memory,
+    'docx': benchmark_docx,
+    'startup': benchmark_startup,
+    'parse': benchmark_parse,
+    'pipeline': benchmark_pipeline,
+    'scoring': benchmark_scoring,
+}
@@ -0,0 +1,90 @@
+"""Resume sources the extractors can read: a filesystem path or an in-memory buffer.
+
+Like the extractors, this module does not import Django.
+"""
+import io
+import mmap
+import os
+from contextlib import nullcontext
+
+class BufferReader(io.RawIOBase):
+    """Read-only, seekable stream over a buffer such as an mmap, without copying it.
+
+    An mmap has read() and seek() but not the full io interface zipfile and
+    python-docx expect, and wrapping it in a BytesIO would copy the file.
+    """
+
+    def __init__(self, buffer):
+        self.view = memoryview(buffer)
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, target):
+        chunk = self.view[self.position:self.position + len(target)]
+        target[:len(chunk)] = chunk
+        self.position += len(chunk)
+        return len(chunk)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.view)
+        self.position = max(offset, 0)
+        return self.position
+
+    def tell(self):
+        return self.position
+
+    def close(self):
+        self.view.release()
+        super().close()
+
+def open_source(source):
+    """Open a resume source as a binary stream, for use in a `with` block.
+
+    Paths are opened from disk. Bytes are wrapped in a BytesIO, which shares
+    the buffer instead of copying it; memoryviews and mmaps are read through a
+    BufferReader. Any other binary file object is rewound and used as is, and
+    is not closed on exit.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, 'rb')
+    if isinstance(source, bytes):
+        return io.BytesIO(source)
+    if isinstance(source, (bytearray, memoryview, mmap.mmap)):
+        return BufferReader(source)
+    source.seek(0)
+    return nullcontext(source)
+
+def picklable_source(source):
+    """A path or bytes copy of the source that can be sent to worker processes"""
+    if isinstance(source, (str, os.PathLike, bytes)):
+        return source
+    if isinstance(source, (bytearray, memoryview, mmap.mmap)):
+        return bytes(source)
+    source.seek(0)
+    return source.read()
+
+def source_name(source, filename=None):
+    """The file name used to pick an extractor for the source"""
+    if filename:
+        return filename
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    return getattr(source, 'name', '') or ''
+
+def source_size(source):
+    """Size of the source in bytes, or None when it cannot be told without reading it"""
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    if isinstance(source, memoryview):
+        return source.nbytes
+    if isinstance(source, (bytes, bytearray, mmap.mmap)):
+        return len(source)
+    return getattr(source, 'size', None)
@@ -0,0 +1,144 @@
+"""DOCX text extraction.
+
+Reads `word/document.xml` straight out of the zip archive with an incremental
+XML parser instead of building the python-docx object model, so memory stays
+bounded by the largest paragraph or table rather than the whole document.
+"""
+import zipfile
+from xml.etree.ElementTree import iterparse
+from .buffers import open_source
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+PARAGRAPH = W + 'p'
+RUN = W + 'r'
+HYPERLINK = W + 'hyperlink'
+TABLE = W + 'tbl'
+TABLE_GRID = W + 'tblGrid'
+GRID_COLUMN = W + 'gridCol'
+ROW = W + 'tr'
+CELL = W + 'tc'
+CELL_PROPERTIES = W + 'tcPr'
+GRID_SPAN = W + 'gridSpan'
+VERTICAL_MERGE = W + 'vMerge'
+VALUE = W + 'val'
+BODY = W + 'body'
+TEXT = W + 't'
+BREAK = W + 'br'
+BREAK_TYPE = W + 'type'
+
+# Run content rendered the way python-docx renders it in Paragraph.text
+RUN_CONTENT = {
+    W + 'tab': '\t',
+    W + 'ptab': '\t',
+    W + 'cr': '\n',
+    W + 'noBreakHyphen': '-',
+}
+
+def paragraph_text(paragraph):
+    """Text of a <w:p> element, with tabs and line breaks as characters.
+
+    Like python-docx, only runs directly in the paragraph or in a hyperlink
+    count; text boxes and tracked changes are skipped.
+    """
+    parts = []
+    for child in paragraph:
+        if child.tag == RUN:
+            runs = (child,)
+        elif child.tag == HYPERLINK:
+            runs = child.iterfind(RUN)
+        else:
+            continue
+        for run in runs:
+            for element in run:
+                tag = element.tag
+                if tag == TEXT:
+                    parts.append(element.text or '')
+                elif tag == BREAK:
+                    # Page and column breaks have no text equivalent
+                    if element.get(BREAK_TYPE, 'textWrapping') == 'textWrapping':
+                        parts.append('\n')
+                elif tag in RUN_CONTENT:
+                    parts.append(RUN_CONTENT[tag])
+    return ''.join(parts)
+
+def cell_layout(cell):
+    """Grid columns a <w:tc> spans and whether it continues a vertical merge"""
+    properties = cell.find(CELL_PROPERTIES)
+    if properties is None:
+        return 1, False
+    span = properties.find(GRID_SPAN)
+    merge = properties.find(VERTICAL_MERGE)
+    columns = int(span.get(VALUE, 1)) if span is not None else 1
+    return columns, merge is not None and merge.get(VALUE, 'continue') == 'continue'
+
+def row_line(cells):
+    return ''.join(cell_text + ' ' for cell_text in cells) + '\n'
+
+def iter_docx_lines(source):
+    """Yield the text of a DOCX document in document order.
+
+    Each body paragraph yields its text plus a newline and each table row
+    yields its cell texts, each followed by a space, plus a newline - the same
+    line format extract_text_from_docx has always produced. Cells are read the
+    way python-docx reads them: a cell's text joins its own paragraphs (not
+    those of nested tables) with newlines, a merged cell repeats its text for
+    every grid column it covers, and rows are cut from that grid by column
+    count. Elements are cleared as soon as they have been read.
+    """
+    with open_source(source) as stream, zipfile.ZipFile(stream) as archive, archive.open('word/document.xml') as xml:
+        body = None
+        path = []
+        column_count = 0
+        grid = []
+        rows = emitted = 0
+        cell = []
+        for event, element in iterparse(xml, events=('start', 'end')):
+            tag = element.tag
+            if event == 'start':
+                path.append(tag)
+                if tag == BODY:
+                    body = element
+                elif tag == TABLE and path[-2:-1] == [BODY]:
+                    column_count = 0
+                    grid = []
+                    rows = emitted = 0
+                continue
+
+            path.pop()
+            parent = path[-1] if path else None
+            if tag == PARAGRAPH and parent == BODY:
+                yield paragraph_text(element) + '\n'
+                element.clear()
+            elif tag == PARAGRAPH and path[-4:] == [BODY, TABLE, ROW, CELL]:
+                cell.append(paragraph_text(element))
+                element.clear()
+            elif tag == TABLE_GRID and path[-2:] == [BODY, TABLE]:
+                column_count = len(element.findall(GRID_COLUMN))
+            elif tag == CELL and path[-3:] == [BODY, TABLE, ROW]:
+                columns, continued = cell_layout(element)
+                for index in range(columns):
+                    if continued:
+                        grid.append(grid[-column_count] if column_count and len(grid) >= column_count else '')
+                    elif index:
+                        grid.append(grid[-1])
+                    else:
+                        grid.append('\n'.join(cell))
+                cell = []
+            elif tag == ROW and path[-2:] == [BODY, TABLE]:
+                rows += 1
+                while emitted < rows and len(grid) >= (emitted + 1) * column_count:
+                    yield row_line(grid[emitted * column_count:(emitted + 1) * column_count])
+                    emitted += 1
+            elif tag == TABLE and parent == BODY:
+                for index in range(emitted, rows):
+                    yield row_line(grid[index * column_count:(index + 1) * column_count])
+                grid = []
+
+            # Drop finished top-level blocks so the tree never holds the document
+            if body is not None and parent == BODY and tag in (PARAGRAPH, TABLE):
+                body.clear()
+
+def extract_docx_stream(source):
+    """Extract DOCX text in a single streaming pass over the document XML"""
+    return ''.join(iter_docx_lines(source))
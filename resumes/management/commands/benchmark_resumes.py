@@ -0,0 +1,63 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from resumes.benchmarks import SUITES, compare_results
+
+class Command(BaseCommand):
+    help = 'Benchmark the resume parsing pipeline'
+    suites = SUITES
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--suite',
+            action='append',
+            choices=sorted(self.suites),
+            help='Suite to run (repeatable, default: all)'
+        )
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement; the best is kept')
+        parser.add_argument('--json', dest='json_path', help='Write the results to this JSON file')
+        parser.add_argument('--baseline', help='JSON results of an earlier run to check for regressions')
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=1.25,
+            help='Fail when a timing or memory peak exceeds the baseline by this factor'
+        )
+
+    def handle(self, *args, **options):
+        suites = options['suite'] or sorted(self.suites)
+        failures = []
+        results = {}
+        for suite in suites:
+            self.stdout.write(self.style.MIGRATE_HEADING(f'Suite: {suite}'))
+            results[suite] = []
+            for result in self.suites[suite](repeat=options['repeat']):
+                results[suite].append(result)
+                self.stdout.write(self.format_result(result))
+                if result.get('ok') is False:
+                    failures.append(result['name'])
+
+        if options['json_path']:
+            with open(options['json_path'], 'w') as file:
+                json.dump(results, file, indent=2)
+            self.stdout.write(f"Results written to {options['json_path']}")
+
+        if options['baseline']:
+            with open(options['baseline']) as file:
+                baseline = json.load(file)
+            regressions = compare_results(results, baseline, options['threshold'])
+            for regression in regressions:
+                self.stdout.write(self.style.ERROR(f'  Regression: {regression}'))
+            failures.extend(regressions)
+
+        if failures:
+            raise CommandError(f"Checks failed: {', '.join(failures)}")
+
+    def format_result(self, result):
+        values = []
+        for key, value in result.items():
+            if key == 'name':
+                continue
+            if isinstance(value, float):
+                value = f'{value:.6f}' if key.endswith('seconds') else f'{value:.2f}'
+            values.append(f'{key}={value}')
+        return f"  {result['name']}: {' '.join(values)}"
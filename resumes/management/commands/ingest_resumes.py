@@ -0,0 +1,194 @@
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from resumes.models import Resume
+from resumes.utils import parse_resume, set_resume_scores
+
+User = get_user_model()
+
+RESUME_EXTENSIONS = ('.pdf', '.docx')
+
+def init_worker():
+    """Ingestion already runs one file per process; don't start page pools inside workers"""
+    settings.RESUME_PDF_WORKERS = 1
+
+def parse_file(path):
+    """Parse one resume file in a worker process; failures are returned, not raised"""
+    try:
+        with open(path, 'rb') as file:
+            data = file.read()
+        extracted_text, parsed_data = parse_resume(data, path)
+        return {
+            'path': path,
+            'content_hash': hashlib.sha256(data).hexdigest(),
+            'extracted_text': extracted_text,
+            'parsed_data': parsed_data,
+        }
+    except Exception as e:
+        return {'path': path, 'error': str(e)}
+
+class Command(BaseCommand):
+    help = 'Parse a directory of resumes in parallel and create a candidate account and Resume for each'
+
+    def add_arguments(self, parser):
+        parser.add_argument('directory', help='Directory searched recursively for PDF and DOCX files')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Parser processes')
+        parser.add_argument('--chunk-size', type=int, default=200, help='Resumes written per bulk insert')
+        parser.add_argument(
+            '--checkpoint',
+            help='Checkpoint file (default: .ingest_checkpoint.json in the directory)'
+        )
+        parser.add_argument('--retry-failed', action='store_true', help='Parse files that failed in an earlier run again')
+        parser.add_argument('--restart', action='store_true', help='Ignore an existing checkpoint')
+
+    def handle(self, *args, **options):
+        directory = os.path.abspath(options['directory'])
+        if not os.path.isdir(directory):
+            raise CommandError(f'{directory} is not a directory')
+
+        checkpoint_path = options['checkpoint'] or os.path.join(directory, '.ingest_checkpoint.json')
+        checkpoint = {'done': [], 'failed': {}}
+        if os.path.exists(checkpoint_path) and not options['restart']:
+            with open(checkpoint_path) as file:
+                checkpoint = json.load(file)
+        done = set(checkpoint['done'])
+        failed = checkpoint['failed']
+
+        skip = done if options['retry_failed'] else done | set(failed)
+        paths = [
+            path for path in self.find_resumes(directory)
+            if os.path.relpath(path, directory) not in skip
+        ]
+        self.stdout.write(f'{len(paths)} files to ingest ({len(done)} already done)')
+        if not paths:
+            return
+
+        # Workers are forked; they must not inherit open database connections
+        connections.close_all()
+        start = time.perf_counter()
+        created = skipped = errors = 0
+        batch = []
+
+        def flush():
+            nonlocal created, skipped
+            new, duplicates = self.write_batch(batch)
+            created += new
+            skipped += duplicates
+            done.update(os.path.relpath(result['path'], directory) for result in batch)
+            for result in batch:
+                failed.pop(os.path.relpath(result['path'], directory), None)
+            self.save_checkpoint(checkpoint_path, done, failed)
+            batch.clear()
+
+        with ProcessPoolExecutor(max_workers=options['workers'], initializer=init_worker) as pool:
+            for index, result in enumerate(pool.map(parse_file, paths, chunksize=4), start=1):
+                relative_path = os.path.relpath(result['path'], directory)
+                if 'error' in result:
+                    errors += 1
+                    failed[relative_path] = result['error']
+                    self.stderr.write(f'Failed: {relative_path}: {result["error"]}')
+                else:
+                    batch.append(result)
+
+                if len(batch) >= options['chunk_size']:
+                    flush()
+                if index % options['chunk_size'] == 0:
+                    elapsed = time.perf_counter() - start
+                    self.stdout.write(f'{index}/{len(paths)} files, {index / elapsed:.1f} files/sec')
+            if batch:
+                flush()
+            else:
+                self.save_checkpoint(checkpoint_path, done, failed)
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(
+            f'Ingested {len(paths)} files in {elapsed:.1f}s ({len(paths) / elapsed:.1f} files/sec): '
+            f'{created} created, {skipped} duplicates skipped, {errors} failed'
+        ))
+        if errors:
+            self.stdout.write(f'Failures are listed in {checkpoint_path}; rerun with --retry-failed to try them again')
+
+    def find_resumes(self, directory):
+        paths = []
+        for root, _, files in os.walk(directory):
+            for name in files:
+                if name.lower().endswith(RESUME_EXTENSIONS):
+                    paths.append(os.path.join(root, name))
+        return sorted(paths)
+
+    def write_batch(self, batch):
+        """Create a user and a Resume per parsed file, skipping content already stored"""
+        hashes = [result['content_hash'] for result in batch]
+        existing_hashes = set(
+            Resume.objects.filter(content_hash__in=hashes).values_list('content_hash', flat=True)
+        )
+        usernames = {}
+        for result in batch:
+            if result['content_hash'] in existing_hashes:
+                continue
+            email = (result['parsed_data'].get('contact_info') or {}).get('email') or ''
+            usernames[result['content_hash']] = (email.lower(), email or f"resume-{result['content_hash'][:16]}")
+        taken = set(User.objects.filter(
+            username__in=[username for _, username in usernames.values()]
+        ).values_list('username', flat=True))
+
+        users = []
+        resumes = []
+        for result in batch:
+            content_hash = result['content_hash']
+            if content_hash not in usernames:
+                continue
+            email, username = usernames.pop(content_hash)
+            if username in taken:
+                # Same candidate address, different file: keep both under distinct accounts
+                username = f'resume-{content_hash[:16]}'
+            if username in taken:
+                continue
+            taken.add(username)
+
+            user = User(username=username, email=email, role='job_seeker', resume_uploaded=True)
+            user.set_unusable_password()
+            users.append(user)
+            resume = Resume(
+                user=user,
+                original_filename=os.path.basename(result['path']),
+                content_hash=content_hash,
+                extracted_text=result['extracted_text'],
+                parsed_data=result['parsed_data'],
+            )
+            resumes.append((resume, result['path']))
+        if resumes:
+            set_resume_scores(*[resume for resume, _ in resumes])
+
+        # Files are stored right before the insert; if it fails no row refers to them
+        stored_files = []
+        try:
+            for resume, path in resumes:
+                with open(path, 'rb') as file:
+                    resume.file = default_storage.save(f"resumes/{os.path.basename(path)}", File(file))
+                stored_files.append(resume.file.name)
+            with transaction.atomic():
+                User.objects.bulk_create(users)
+                for resume, _ in resumes:
+                    resume.user_id = resume.user.id
+                Resume.objects.bulk_create([resume for resume, _ in resumes])
+        except Exception:
+            for name in stored_files:
+                default_storage.delete(name)
+            raise
+        return len(resumes), len(batch) - len(resumes)
+
+    def save_checkpoint(self, path, done, failed):
+        """Write the checkpoint atomically so an interrupted run never leaves it half written"""
+        temp_path = f'{path}.tmp'
+        with open(temp_path, 'w') as file:
+            json.dump({'done': sorted(done), 'failed': failed}, file)
+        os.replace(temp_path, path)
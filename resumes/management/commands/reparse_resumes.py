@@ -0,0 +1,105 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from django.core.management.base import BaseCommand
+from django.db import connections, transaction
+from django.db.models import Q
+from resumes.models import Resume
+from resumes.utils import PARSER_VERSION, reparse_parsed_data, set_resume_scores
+
+def stale_resumes():
+    """Resumes whose parsed_data was produced by an older parser, or carries no version"""
+    return Resume.objects.filter(
+        Q(parsed_data___meta__parser_version__lt=PARSER_VERSION)
+        | Q(parsed_data___meta__parser_version__isnull=True)
+    )
+
+def reparse_row(row):
+    """Re-parse one (id, extracted_text, parsed_data, original_filename) row in a worker process"""
+    resume_id, extracted_text, parsed_data, original_filename = row
+    try:
+        resume = Resume(
+            id=resume_id,
+            extracted_text=extracted_text,
+            parsed_data=reparse_parsed_data(extracted_text, parsed_data),
+            original_filename=original_filename
+        )
+        return resume, None
+    except Exception as e:
+        return resume_id, str(e)
+
+class Command(BaseCommand):
+    help = f'Re-parse stored resume text for resumes parsed by a parser older than version {PARSER_VERSION}'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=200, help='Resumes re-parsed and written per batch')
+        parser.add_argument('--workers', type=int, default=2, help='Parser processes')
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=0,
+            help='Seconds to pause between batches, to limit load when running next to production traffic'
+        )
+        parser.add_argument('--dry-run', action='store_true', help='Only count the stale resumes')
+
+    def handle(self, *args, **options):
+        total = stale_resumes().count()
+        self.stdout.write(f'{total} resumes parsed by a parser older than version {PARSER_VERSION}')
+        if options['dry_run'] or not total:
+            return
+
+        # Workers are forked; they must not inherit open database connections
+        connections.close_all()
+        start = time.perf_counter()
+        last_id = 0
+        updated = changed = failed = 0
+
+        with ProcessPoolExecutor(max_workers=options['workers']) as pool:
+            while True:
+                # Walk the table by primary key so each batch is a cheap index range
+                # and rows written by an earlier batch are never selected again
+                rows = list(
+                    stale_resumes()
+                    .filter(id__gt=last_id)
+                    .order_by('id')
+                    .values_list(
+                        'id', 'extracted_text', 'parsed_data', 'original_filename', 'content_hash', 'updated_at'
+                    )[:options['batch_size']]
+                )
+                if not rows:
+                    break
+                last_id = rows[-1][0]
+                versions = {row[0]: row[4:] for row in rows}
+
+                resumes = []
+                for resume, error in pool.map(reparse_row, [row[:4] for row in rows], chunksize=8):
+                    if error:
+                        failed += 1
+                        self.stderr.write(f'Failed to re-parse resume {resume}: {error}')
+                        continue
+                    resumes.append(resume)
+                if resumes:
+                    set_resume_scores(*resumes)
+                with transaction.atomic():
+                    # A resume re-uploaded while its batch was being parsed keeps the
+                    # new upload: only rows still as they were read are written
+                    current = {
+                        resume_id: (content_hash, updated_at)
+                        for resume_id, content_hash, updated_at in Resume.objects.select_for_update().filter(
+                            id__in=[resume.id for resume in resumes]
+                        ).values_list('id', 'content_hash', 'updated_at')
+                    }
+                    unchanged = [resume for resume in resumes if current.get(resume.id) == versions[resume.id]]
+                    Resume.objects.bulk_update(unchanged, ['parsed_data', 'features', 'overall_score', 'ats_score'])
+                updated += len(unchanged)
+                changed += len(resumes) - len(unchanged)
+
+                processed = updated + changed + failed
+                elapsed = time.perf_counter() - start
+                self.stdout.write(f'{processed}/{total} resumes, {processed / elapsed:.1f} resumes/sec')
+                if options['sleep']:
+                    time.sleep(options['sleep'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Re-parsed {updated} resumes in {time.perf_counter() - start:.1f}s '
+            f'({failed} failed, {changed} changed during the run and left as they are)'
+        ))
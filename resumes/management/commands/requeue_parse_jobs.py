@@ -0,0 +1,44 @@
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from resumes.models import ResumeParseJob
+from resumes.tasks import run_parse_job
+
+class Command(BaseCommand):
+    help = (
+        'Run parse jobs again that are still queued or running long after their upload, '
+        'e.g. because the worker holding them was restarted'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than',
+            type=int,
+            default=30,
+            help='Minutes since the upload after which a queued or running job counts as lost'
+        )
+        parser.add_argument('--dry-run', action='store_true', help='Only count the lost jobs')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(minutes=options['older_than'])
+        # Oldest first, so a user's newest upload is the one published last
+        job_ids = list(
+            ResumeParseJob.objects
+            .filter(status__in=['queued', 'running'], created_at__lt=cutoff)
+            .order_by('created_at', 'id')
+            .values_list('id', flat=True)
+        )
+        self.stdout.write(f'{len(job_ids)} parse jobs queued or running for more than {options["older_than"]} minutes')
+        if options['dry_run'] or not job_ids:
+            return
+
+        start = time.perf_counter()
+        for job_id in job_ids:
+            # Parsed from the stored file, since the in-memory upload went with the worker
+            run_parse_job(job_id)
+        done = ResumeParseJob.objects.filter(id__in=job_ids, status='done').count()
+        self.stdout.write(self.style.SUCCESS(
+            f'Ran {len(job_ids)} parse jobs in {time.perf_counter() - start:.1f}s '
+            f'({done} done, {len(job_ids) - done} failed)'
+        ))
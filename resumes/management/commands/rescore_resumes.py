@@ -0,0 +1,77 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from resumes.models import Resume
+from resumes.scoring import FEATURES, ats_scores, feature_matrix, overall_scores, resume_features
+
+class Command(BaseCommand):
+    help = 'Recompute the overall and ATS score of every stored resume from its feature vector'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000, help='Resumes scored and written per batch')
+        parser.add_argument(
+            '--refresh-features',
+            action='store_true',
+            help='Rebuild every feature vector from the stored parse result, not only missing or outdated ones'
+        )
+
+    def handle(self, *args, **options):
+        total = Resume.objects.count()
+        start = time.perf_counter()
+        last_id = 0
+        rescored = refreshed = changed = 0
+
+        while True:
+            rows = list(
+                Resume.objects
+                .filter(id__gt=last_id)
+                .order_by('id')
+                .values_list('id', 'features', 'content_hash', 'updated_at')[:options['batch_size']]
+            )
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            versions = {row[0]: row[2:] for row in rows}
+            rows = [row[:2] for row in rows]
+
+            # Vectors written before a feature was added are rebuilt from the parse result
+            stale_ids = [
+                resume_id for resume_id, features in rows
+                if options['refresh_features'] or len(features or []) != len(FEATURES)
+            ]
+            features_by_id = dict(rows)
+            if stale_ids:
+                for resume_id, extracted_text, parsed_data, original_filename in Resume.objects.filter(
+                    id__in=stale_ids
+                ).values_list('id', 'extracted_text', 'parsed_data', 'original_filename'):
+                    features_by_id[resume_id] = resume_features(extracted_text, parsed_data, original_filename)
+                refreshed += len(stale_ids)
+
+            ids = [resume_id for resume_id, _ in rows]
+            matrix = feature_matrix([features_by_id[resume_id] for resume_id in ids])
+            resumes = [
+                Resume(id=resume_id, features=features_by_id[resume_id], overall_score=float(overall), ats_score=float(ats))
+                for resume_id, overall, ats in zip(ids, overall_scores(matrix), ats_scores(matrix))
+            ]
+            with transaction.atomic():
+                # A resume re-uploaded while its batch was being scored keeps the
+                # new upload's scores: only rows still as they were read are written
+                current = {
+                    resume_id: (content_hash, updated_at)
+                    for resume_id, content_hash, updated_at in Resume.objects.select_for_update().filter(
+                        id__in=ids
+                    ).values_list('id', 'content_hash', 'updated_at')
+                }
+                unchanged = [resume for resume in resumes if current.get(resume.id) == versions[resume.id]]
+                Resume.objects.bulk_update(unchanged, ['features', 'overall_score', 'ats_score'], batch_size=1000)
+            rescored += len(unchanged)
+            changed += len(resumes) - len(unchanged)
+
+            processed = rescored + changed
+            elapsed = time.perf_counter() - start
+            self.stdout.write(f'{processed}/{total} resumes, {processed / elapsed:.1f} resumes/sec')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Rescored {rescored} resumes in {time.perf_counter() - start:.1f}s ({refreshed} feature vectors rebuilt, '
+            f'{changed} changed during the run and left as they are)'
+        ))
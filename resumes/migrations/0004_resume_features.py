@@ -0,0 +1,28 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0003_parsedresumecache'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='ats_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='features',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='overall_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0004_resume_features'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumeanalysis',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='resumeanalysis',
+            name='job_updated_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='resumeanalysis',
+            name='parser_version',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='resumeanalysis',
+            name='scorer_version',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='resumeanalysis',
+            index=models.Index(fields=['resume', 'job', 'content_hash', 'job_updated_at', 'scorer_version', 'parser_version'], name='resume_analysis_memo_idx'),
+        ),
+    ]
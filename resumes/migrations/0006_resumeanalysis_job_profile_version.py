@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 07:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resumes', '0005_resumeanalysis_memo'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumeanalysis',
+            name='job_profile_version',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+    ]
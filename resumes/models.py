@@ -9,12 +9,60 @@ class Resume(models.Model):
     original_filename = models.CharField(max_length=255)
     extracted_text = models.TextField(blank=True)
     parsed_data = models.JSONField(default=dict, blank=True)
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True)
+    # Numeric feature vector (see scoring.FEATURES) and the scores derived from it
+    features = models.JSONField(default=list, blank=True)
+    overall_score = models.FloatField(null=True, blank=True)
+    ats_score = models.FloatField(null=True, blank=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     def __str__(self):
         return f"{self.user.username}'s Resume"
 
+class ResumeParseJob(models.Model):
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+    
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='resume_parse_jobs')
+    resume = models.ForeignKey(Resume, on_delete=models.SET_NULL, null=True, blank=True, related_name='parse_jobs')
+    file = models.FileField(upload_to='resumes/')
+    original_filename = models.CharField(max_length=255)
+    content_hash = models.CharField(max_length=64, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='queued')
+    parsed_data = models.JSONField(default=dict, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"Parse job {self.id} for {self.user.username} ({self.status})"
+
+class ParsedResumeCache(models.Model):
+    """Extraction and parse results keyed by the SHA-256 of the uploaded bytes"""
+    content_hash = models.CharField(max_length=64)
+    parser_version = models.IntegerField()
+    extracted_text = models.TextField(blank=True)
+    parsed_data = models.JSONField(default=dict, blank=True)
+    size_bytes = models.IntegerField(default=0)
+    hit_count = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    
+    class Meta:
+        unique_together = ['content_hash', 'parser_version']
+    
+    def __str__(self):
+        return f"Parse cache {self.content_hash[:12]} (v{self.parser_version})"
+
 class ResumeAnalysis(models.Model):
     resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name='analyses')
     job = models.ForeignKey('jobs.Job', on_delete=models.CASCADE, null=True, blank=True)
@@ -24,8 +72,22 @@ class ResumeAnalysis(models.Model):
     improvements = models.JSONField(default=list)
     missing_keywords = models.JSONField(default=list)
     section_scores = models.JSONField(default=dict)
+    # What the analysis was computed from; an identical request reuses the row
+    content_hash = models.CharField(max_length=64, blank=True)
+    parser_version = models.IntegerField(default=0)
+    job_updated_at = models.DateTimeField(null=True, blank=True)
+    job_profile_version = models.IntegerField(null=True, blank=True)
+    scorer_version = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['resume', 'job', 'content_hash', 'job_updated_at', 'scorer_version', 'parser_version'],
+                name='resume_analysis_memo_idx'
+            ),
+        ]
+    
     def __str__(self):
         return f"Analysis for {self.resume.user.username}'s Resume"
 
@@ -0,0 +1,270 @@
+"""PDF text extraction.
+
+This module does not import Django so its functions can run in worker processes
+started with the 'spawn' method, which is safe to use from threaded servers.
+Every extractor takes a `source`: a path or an in-memory buffer (see buffers.py).
+"""
+import itertools
+import math
+import multiprocessing
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import PyPDF2
+import pdfplumber
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdftypes import resolve1
+from pdfplumber.page import Page
+from .buffers import open_source, picklable_source
+
+# A text layer is "good enough" for the fast PyPDF2 path when the probed pages
+# are laid out in a single column, have at least this many characters per page,
+# are mostly letters, and have few of the wide gaps or very short lines that
+# table layouts produce
+PROBE_PAGES = 2
+MIN_CHARS_PER_PAGE = 200
+MIN_ALPHA_RATIO = 0.6
+MAX_GAP_LINE_RATIO = 0.15
+MAX_SHORT_LINE_RATIO = 0.5
+
+# Text runs are bucketed by start position into COLUMN_BINS bins across the page;
+# a column is a bin holding MIN_COLUMN_SHARE of the runs, at least
+# MIN_COLUMN_DISTANCE_BINS bins away from the previous column
+COLUMN_BINS = 20
+MIN_COLUMN_SHARE = 0.15
+MIN_COLUMN_DISTANCE_BINS = 5
+
+_COLUMN_GAP = re.compile(r'\S {3,}\S')
+
+_page_pool = None
+_page_pool_workers = None
+_page_pool_lock = threading.Lock()
+
+def get_page_pool(workers):
+    """Return the process pool used for per-page extraction, created on first use"""
+    global _page_pool, _page_pool_workers
+    with _page_pool_lock:
+        if _page_pool is None or _page_pool_workers != workers:
+            if _page_pool is not None:
+                _page_pool.shutdown(wait=False)
+            _page_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            _page_pool_workers = workers
+        return _page_pool
+
+def reset_page_pool(pool):
+    """Drop a broken pool so the next get_page_pool() starts a new one.
+
+    A worker that dies (killed for memory, segfault in a parser) breaks the
+    whole pool, and every later submit() would fail with BrokenProcessPool.
+    """
+    global _page_pool, _page_pool_workers
+    with _page_pool_lock:
+        if _page_pool is pool:
+            _page_pool = None
+            _page_pool_workers = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def join_pages(page_texts, max_chars):
+    """Join page texts in order, stopping once `max_chars` characters are collected"""
+    parts = []
+    size = 0
+    for page_text in page_texts:
+        if not page_text:
+            continue
+        if size + len(page_text) + 1 > max_chars:
+            parts.append(page_text[:max(max_chars - size, 0)])
+            break
+        parts.append(page_text + "\n")
+        size += len(page_text) + 1
+    return ''.join(parts)
+
+def count_pages(pdf):
+    """Page count from the document catalog, without building pdfplumber Page objects"""
+    try:
+        return int(resolve1(resolve1(pdf.doc.catalog['Pages'])['Count']))
+    except Exception:
+        return len(pdf.pages)
+
+def stream_pdf_pages(source, max_pages, max_chars, first_page=1, last_page=None):
+    """Yield the text of each page with pdfplumber while holding one page in memory.
+
+    `pdf.pages` keeps every Page, and with it every page's layout objects and
+    text map, alive until the document is closed. Pages are created one at a
+    time here instead, and each one's caches are released before moving on.
+    Extraction stops after `max_pages` pages or once `max_chars` characters
+    have been yielded, truncating the last page; `max_chars=None` means no limit.
+    """
+    last_page = min(last_page or max_pages, max_pages)
+    remaining = max_chars if max_chars is not None else math.inf
+    with open_source(source) as stream, pdfplumber.open(stream) as pdf:
+        doctop = 0
+        for page_number, page_obj in enumerate(PDFPage.create_pages(pdf.doc), start=1):
+            if page_number > last_page or remaining <= 0:
+                break
+            page = Page(pdf, page_obj, page_number=page_number, initial_doctop=doctop)
+            doctop += page.height
+            if page_number < first_page:
+                continue
+            page_text = page.extract_text() or ''
+            if len(page_text) > remaining:
+                page_text = page_text[:remaining]
+            page.get_textmap.cache_clear()
+            page.flush_cache()
+            del page
+            remaining -= len(page_text)
+            yield page_text
+
+def extract_page_range(source, first_page, last_page, max_chars=None):
+    """Extract the text of pages first_page..last_page (1-based, inclusive) with pdfplumber"""
+    return list(stream_pdf_pages(source, last_page, max_chars, first_page, last_page))
+
+def page_ranges(page_count, chunks):
+    """Split 1..page_count into at most `chunks` contiguous ranges"""
+    size = math.ceil(page_count / max(chunks, 1))
+    return [(first, min(first + size - 1, page_count)) for first in range(1, page_count + 1, size)]
+
+def extract_pdfplumber(source, max_pages, max_chars, parallel_min_pages, workers):
+    """Extract text with pdfplumber, spreading large documents over a process pool.
+
+    Returns the text and a dict with the strategy used and the page count.
+    """
+    with open_source(source) as stream, pdfplumber.open(stream) as pdf:
+        page_count = min(count_pages(pdf), max_pages)
+    info = {'strategy': 'pdfplumber', 'pages': page_count}
+    if page_count < parallel_min_pages or workers <= 1:
+        return join_pages(stream_pdf_pages(source, max_pages, max_chars), max_chars), info
+
+    # Each worker opens the file (or its own copy of an in-memory buffer) and
+    # extracts one contiguous page range; a dead worker breaks the pool, which
+    # is replaced and tried once more before falling back to this process
+    ranges = page_ranges(page_count, workers)
+    payload = picklable_source(source)
+    for attempt in range(2):
+        pool = get_page_pool(workers)
+        try:
+            page_texts = extract_ranges(pool, payload, ranges, max_chars)
+        except BrokenProcessPool as e:
+            reset_page_pool(pool)
+            info['pool_error'] = str(e)
+            continue
+        info['strategy'] = 'pdfplumber-parallel'
+        return join_pages(page_texts, max_chars), info
+    return join_pages(stream_pdf_pages(source, max_pages, max_chars), max_chars), info
+
+def extract_ranges(pool, source, ranges, max_chars):
+    """Page texts of `ranges` extracted in the pool, in page order.
+
+    No range can contribute more than `max_chars`, so that is each worker's
+    budget; once the ranges collected so far reach it, the rest are cancelled.
+    """
+    futures = [pool.submit(extract_page_range, source, first, last, max_chars) for first, last in ranges]
+    page_texts = []
+    size = 0
+    try:
+        for future in futures:
+            chunk = future.result()
+            page_texts.extend(chunk)
+            size += sum(len(page_text) + 1 for page_text in chunk if page_text)
+            if max_chars is not None and size >= max_chars:
+                break
+    finally:
+        for future in futures:
+            future.cancel()
+    return page_texts
+
+def extract_pypdf2(source, max_pages, max_chars):
+    """Extract text with PyPDF2"""
+    with open_source(source) as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        pages = pdf_reader.pages[:max_pages]
+        return join_pages((page.extract_text() or '' for page in pages), max_chars)
+
+def extract_with_line_starts(page):
+    """PyPDF2 page text plus the horizontal position of each text run, as a page-width fraction"""
+    width = float(page.mediabox.width) or 1.0
+    starts = []
+    
+    def visitor(text, cm, tm, font_dict, font_size):
+        if text.strip():
+            starts.append((tm[4] * cm[0] + cm[4]) / width)
+    
+    return page.extract_text(visitor_text=visitor) or '', starts
+
+def count_columns(line_starts):
+    """Count clusters of text-run start positions that each hold a real share of the runs"""
+    if not line_starts:
+        return 1
+    bins = Counter(min(int(start * COLUMN_BINS), COLUMN_BINS - 1) for start in line_starts if 0 <= start <= 1)
+    busy = sorted(bin_index for bin_index, count in bins.items() if count >= MIN_COLUMN_SHARE * len(line_starts))
+    columns = 1
+    for previous, current in zip(busy, busy[1:]):
+        if current - previous >= MIN_COLUMN_DISTANCE_BINS:
+            columns += 1
+    return columns
+
+def probe_text_layer(page_texts, line_starts=()):
+    """Measure how usable PyPDF2 text is for the given sample pages"""
+    text = '\n'.join(page_texts)
+    lines = [line for line in text.split('\n') if line.strip()]
+    visible = [char for char in text if not char.isspace()]
+    probe = {
+        'pages': len(page_texts),
+        'chars_per_page': len(text) / max(len(page_texts), 1),
+        'alpha_ratio': sum(char.isalpha() for char in visible) / max(len(visible), 1),
+        'gap_line_ratio': sum(bool(_COLUMN_GAP.search(line)) for line in lines) / max(len(lines), 1),
+        'short_line_ratio': sum(len(line.split()) < 3 for line in lines) / max(len(lines), 1),
+        'columns': count_columns(line_starts),
+    }
+    probe['simple_layout'] = (
+        probe['columns'] == 1
+        and probe['chars_per_page'] >= MIN_CHARS_PER_PAGE
+        and probe['alpha_ratio'] >= MIN_ALPHA_RATIO
+        and probe['gap_line_ratio'] <= MAX_GAP_LINE_RATIO
+        and probe['short_line_ratio'] <= MAX_SHORT_LINE_RATIO
+    )
+    return probe
+
+def extract_tiered(source, max_pages, max_chars, parallel_min_pages, workers, strategy='auto'):
+    """Extract PDF text with the cheapest extractor that handles the layout.
+
+    PyPDF2 reads the first pages as a probe. Simple single-column text layers
+    are extracted with PyPDF2, reusing the probed pages; everything else, and
+    any PyPDF2 failure, escalates to pdfplumber. Returns the text and a dict
+    describing the strategy used.
+    """
+    start = time.perf_counter()
+    info = {'strategy': 'pdfplumber'}
+    
+    if strategy != 'pdfplumber':
+        try:
+            with open_source(source) as file:
+                pages = PyPDF2.PdfReader(file).pages
+                page_count = min(len(pages), max_pages)
+                sample = []
+                line_starts = []
+                for index in range(min(PROBE_PAGES, page_count)):
+                    page_text, starts = extract_with_line_starts(pages[index])
+                    sample.append(page_text)
+                    line_starts.extend(starts)
+                probe = probe_text_layer(sample, line_starts)
+                info['probe'] = {key: round(value, 3) if isinstance(value, float) else value for key, value in probe.items()}
+                info['pages'] = page_count
+                if probe['simple_layout'] or strategy == 'fast':
+                    rest = (pages[index].extract_text() or '' for index in range(len(sample), page_count))
+                    text = join_pages(itertools.chain(sample, rest), max_chars)
+                    info['strategy'] = 'pypdf2'
+                    info['seconds'] = round(time.perf_counter() - start, 4)
+                    return text, info
+        except Exception as e:
+            info['probe_error'] = str(e)
+    
+    text, pdfplumber_info = extract_pdfplumber(source, max_pages, max_chars, parallel_min_pages, workers)
+    info.update(pdfplumber_info)
+    info['seconds'] = round(time.perf_counter() - start, 4)
+    return text, info
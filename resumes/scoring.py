@@ -0,0 +1,110 @@
+"""Resume scoring from precomputed feature vectors.
+
+`resume_features` turns a parse result into a short numeric vector once, when
+the result is published. The overall and ATS rubrics are written as NumPy
+expressions over a matrix with one row per resume, so a single resume and the
+whole corpus are scored by the same code; `manage.py rescore_resumes` rescores
+every stored resume in one vectorized pass after a rubric change.
+"""
+import re
+
+# Column order of a feature vector; append new features at the end
+FEATURES = [
+    'has_contact',
+    'has_summary',
+    'has_experience',
+    'has_education',
+    'has_skills',
+    'has_projects',
+    'has_certifications',
+    'skill_count',
+    'experience_count',
+    'keyword_count',
+    'text_length',
+    'non_empty_lines',
+    'has_email',
+    'has_phone',
+    'has_linkedin',
+    'supported_format',
+]
+COLUMN = {name: index for index, name in enumerate(FEATURES)}
+
+SECTION_FEATURES = ['contact', 'summary', 'experience', 'education', 'skills', 'projects', 'certifications']
+
+def resume_features(extracted_text, parsed_data, filename=''):
+    """Numeric feature vector of a parsed resume, in FEATURES order"""
+    parsed_data = parsed_data or {}
+    extracted_text = extracted_text or ''
+    sections = parsed_data.get('sections', {})
+    contact_info = parsed_data.get('contact_info', {})
+
+    features = [float(bool(sections.get(section))) for section in SECTION_FEATURES]
+    features += [
+        float(len(parsed_data.get('skills', []))),
+        float(len(parsed_data.get('experience', []))),
+        float(len(parsed_data.get('keywords', []))),
+        float(len(extracted_text)),
+        float(sum(1 for line in extracted_text.split('\n') if line.strip())),
+        float(bool(contact_info.get('email'))),
+        float(bool(contact_info.get('phone'))),
+        float(bool(contact_info.get('linkedin'))),
+        float(bool(re.search(r'\.(pdf|docx)$', (filename or '').lower()))),
+    ]
+    return features
+
+def tiers(values, steps):
+    """Points for the first (threshold, points) step that `values` reach, else 0"""
+    import numpy as np
+
+    return np.select([values >= threshold for threshold, _ in steps], [points for _, points in steps], 0)
+
+def overall_scores(matrix):
+    """Overall resume score (0-100) for every row of a feature matrix"""
+    import numpy as np
+
+    column = lambda name: matrix[:, COLUMN[name]]
+    score = (
+        # Section completeness
+        column('has_contact') * 10
+        + column('has_experience') * 15
+        + column('has_education') * 10
+        + column('has_skills') * 5
+        # Content quality
+        + tiers(column('skill_count'), [(10, 20), (5, 15), (3, 10), (1, 5)])
+        + tiers(column('experience_count'), [(3, 10), (1, 5)])
+        # Text quality and structure
+        + tiers(column('text_length'), [(2000, 15), (1000, 12), (500, 8), (200, 5)])
+        # Keywords and relevance
+        + tiers(column('keyword_count'), [(15, 10), (10, 7), (5, 5)])
+        # Contact info bonus
+        + column('has_email') * 3
+        + column('has_phone') * 2
+    )
+    return np.minimum(score, 100)
+
+def ats_scores(matrix):
+    """ATS compatibility score (0-100) for every row of a feature matrix"""
+    import numpy as np
+
+    column = lambda name: matrix[:, COLUMN[name]]
+    score = (
+        column('supported_format') * 20
+        # Section headers
+        + (column('has_contact') + column('has_experience') + column('has_skills')) * 10
+        # Skills and keywords
+        + tiers(column('skill_count'), [(8, 30), (5, 20), (3, 15), (1, 10)])
+        # Text structure and readability
+        + tiers(column('non_empty_lines'), [(20, 20), (15, 15), (10, 10), (5, 5)])
+    )
+    return np.minimum(score, 100)
+
+def feature_matrix(vectors):
+    """Stack feature vectors into a float matrix with one row per resume"""
+    import numpy as np
+
+    return np.asarray(vectors, dtype=np.float64).reshape(-1, len(FEATURES))
+
+def score_features(features):
+    """(overall score, ATS score) of a single feature vector"""
+    matrix = feature_matrix([features])
+    return float(overall_scores(matrix)[0]), float(ats_scores(matrix)[0])
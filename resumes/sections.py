@@ -0,0 +1,90 @@
+import re
+from collections import namedtuple
+
+SectionSpan = namedtuple('SectionSpan', ['name', 'header', 'start', 'end', 'text'])
+
+# Header keywords per section, in priority order ('Career Objective' is a summary)
+SECTION_KEYWORDS = {
+    'summary': ['summary', 'objective', 'profile', 'about'],
+    'experience': ['experience', 'work history', 'employment', 'career'],
+    'education': ['education', 'academic', 'qualification', 'degree', 'university', 'college', 'school'],
+    'skills': ['skills', 'competencies', 'technologies', 'expertise'],
+    'projects': ['projects', 'portfolio', 'work samples'],
+    'certifications': ['certifications', 'certificates', 'licenses'],
+}
+
+# Headers are short lines without dates, e.g. 'PROFESSIONAL EXPERIENCE' or 'Skills & Tools:'
+MAX_HEADER_WORDS = 4
+_DIGIT = re.compile(r'\d')
+
+def header_section(line_lower):
+    """Return the section a stripped, lowercased line is a header for, if any"""
+    if not line_lower or len(line_lower.split()) > MAX_HEADER_WORDS or _DIGIT.search(line_lower):
+        return None
+    for section, keywords in SECTION_KEYWORDS.items():
+        if any(keyword in line_lower for keyword in keywords):
+            return section
+    return None
+
+class ResumeSegments:
+    """Lines of a resume split into section spans in a single pass.
+
+    `lines` holds the stripped lines and `lower_lines` their lowercase form.
+    Lines before the first header form the 'header' span, which normally holds
+    the name and contact details. Every span covers the body lines between its
+    header and the next one; `text` is the lowercased body.
+    """
+
+    def __init__(self, text):
+        self.lines = []
+        self.lower_lines = []
+        self.sections = []
+
+        name, header, start = 'header', '', 0
+        for index, raw_line in enumerate(text.split('\n')):
+            line = raw_line.strip()
+            line_lower = line.lower()
+            self.lines.append(line)
+            self.lower_lines.append(line_lower)
+
+            section = header_section(line_lower.rstrip(':'))
+            if section:
+                self._close(name, header, start, index)
+                name, header, start = section, line, index + 1
+        self._close(name, header, start, len(self.lines))
+
+        self.lower_text = '\n'.join(self.lower_lines)
+
+    def _close(self, name, header, start, end):
+        if name == 'header' and start == end:
+            return
+        text = '\n'.join(self.lower_lines[start:end])
+        self.sections.append(SectionSpan(name, header, start, end, text))
+
+    @property
+    def has_headers(self):
+        return any(span.name != 'header' for span in self.sections)
+
+    def spans(self, name):
+        return [span for span in self.sections if span.name == name]
+
+    def has(self, name):
+        return any(span.name == name for span in self.sections)
+
+    def body_lines(self, name):
+        """Yield (line, lowercase line) for the non-empty body lines of a section"""
+        for span in self.spans(name):
+            for index in range(span.start, span.end):
+                if self.lines[index]:
+                    yield self.lines[index], self.lower_lines[index]
+
+    def split_preamble(self):
+        """Return the text before the first section header and the text after it"""
+        split_at = 0
+        if self.sections and self.sections[0].name == 'header':
+            split_at = self.sections[0].end
+        parts = ['\n'.join(self.lines[:split_at]), '\n'.join(self.lines[split_at:])]
+        return [part for part in parts if part]
+
+def segment_resume(text):
+    return ResumeSegments(text or '')
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import Resume, ResumeAnalysis, SkillExtraction
+from .models import Resume, ResumeAnalysis, ResumeParseJob, SkillExtraction
 
 class ResumeSerializer(serializers.ModelSerializer):
     class Meta:
@@ -7,6 +7,13 @@ class ResumeSerializer(serializers.ModelSerializer):
         fields = '__all__'
         read_only_fields = ('user', 'uploaded_at', 'updated_at')
 
+class ResumeParseJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ResumeParseJob
+        fields = ['id', 'status', 'original_filename', 'parsed_data', 'error', 'resume',
+                  'created_at', 'started_at', 'finished_at']
+        read_only_fields = fields
+
 class ResumeAnalysisSerializer(serializers.ModelSerializer):
     class Meta:
         model = ResumeAnalysis
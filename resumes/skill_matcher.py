@@ -0,0 +1,207 @@
+import re
+from collections import namedtuple
+
+SkillMatch = namedtuple('SkillMatch', ['start', 'end', 'skill'])
+
+_WHITESPACE = re.compile(r'\s+')
+
+# `find_skills` collects the distinct tokens of this many characters at a time
+VOCABULARY_CHUNK = 20000
+# and searches for the single-word skills still missing once fewer than this
+# many are left, rather than tokenizing the rest of the text for them
+SEARCH_BELOW = 15
+
+def normalize_phrase(text):
+    """Lowercase a skill phrase and collapse its internal whitespace"""
+    return _WHITESPACE.sub(' ', text.strip().lower())
+
+class SkillMatcher:
+    """Multi-pattern matcher that finds every skill in a single pass over the text.
+
+    The patterns are merged into a character trie and compiled into one regular
+    expression, so the scan runs inside the `re` engine instead of once per skill
+    in Python. Matches respect word boundaries ('Go' does not match inside
+    'Google', 'Java' does not match inside 'JavaScript') and whitespace inside a
+    pattern matches any whitespace run, including line breaks.
+
+    `find_skills` does not need offsets: it matches single-word skills against
+    the distinct tokens of the text, so each repeated word is checked once, and
+    looks for the few skills still missing, and for phrases, with substring
+    searches that the `re` engine does not have to run at every character.
+    """
+
+    def __init__(self, skills):
+        # `skills` is either an iterable of names or a mapping of alias -> name
+        if not hasattr(skills, 'items'):
+            skills = {skill: skill for skill in skills}
+
+        self.canonical = {}
+        for alias, skill in skills.items():
+            key = normalize_phrase(alias)
+            if key:
+                self.canonical.setdefault(key, skill)
+
+        regex = self._build_regex(self.canonical)
+        # Scanning lowercased text is markedly faster than re.IGNORECASE; the
+        # case-insensitive pattern is only needed when lowercasing changes offsets
+        self.pattern = re.compile(regex)
+        self.pattern_ignorecase = re.compile(regex, re.IGNORECASE)
+        self.nested = self._build_nested()
+        self.words = [key for key in self.canonical if ' ' not in key]
+        self.phrases = [key for key in self.canonical if ' ' in key]
+        self.phrase_words = {key: key.split(' ') for key in self.phrases}
+        self.word_pattern = re.compile(self._build_regex(self.words))
+        self.searches = {key: re.compile(self._build_search_regex(key)) for key in self.canonical}
+
+    @staticmethod
+    def _build_regex(patterns):
+        trie = {}
+        for pattern in patterns:
+            node = trie
+            for char in pattern:
+                node = node.setdefault(char, {})
+            node[''] = pattern
+
+        def char_regex(char):
+            return r'\s+' if char == ' ' else re.escape(char)
+
+        def node_regex(node):
+            branches = []
+            for char in sorted(key for key in node if key):
+                branches.append(char_regex(char) + node_regex(node[char]))
+            if '' in node:
+                # Terminal: require a word boundary only if the pattern ends in a
+                # word character, so 'C++' and 'C#' still match before punctuation
+                branches.append(r'(?!\w)' if re.match(r'\w', node[''][-1]) else '')
+            if len(branches) == 1:
+                return branches[0]
+            return '(?:' + '|'.join(branches) + ')'
+
+        word_start = {char: child for char, child in trie.items() if re.match(r'\w', char)}
+        other_start = {char: child for char, child in trie.items() if not re.match(r'\w', char)}
+        alternatives = []
+        if word_start:
+            alternatives.append(r'(?<!\w)' + node_regex(word_start))
+        if other_start:
+            alternatives.append(node_regex(other_start))
+        return '|'.join(alternatives) or r'(?!)'
+
+    @staticmethod
+    def _build_search_regex(key):
+        """Pattern for a single skill that starts with a literal.
+
+        The word-boundary check before the skill is a lookbehind placed after
+        its first word, since a leading assertion would stop `re` from using
+        the literal prefix to skip ahead.
+        """
+        words = [re.escape(word) for word in key.split(' ')]
+        regex = words[0]
+        if re.match(r'\w', key[0]):
+            regex += r'(?<!\w' + words[0] + ')'
+        regex += ''.join(r'\s+' + word for word in words[1:])
+        if re.match(r'\w', key[-1]):
+            regex += r'(?!\w)'
+        return regex
+
+    def _build_nested(self):
+        """Map each pattern to the shorter patterns found inside it.
+
+        The scan reports the longest match at each position, so 'React Native'
+        hides 'React'; these offsets restore the nested skills without rescanning.
+        """
+        nested = {}
+        for outer in self.canonical:
+            inner_matches = []
+            for inner in self.canonical:
+                if inner == outer or len(inner) >= len(outer):
+                    continue
+                start = outer.find(inner)
+                while start != -1:
+                    end = start + len(inner)
+                    before_ok = start == 0 or not (outer[start - 1].isalnum() and inner[0].isalnum())
+                    after_ok = end == len(outer) or not (outer[end].isalnum() and inner[-1].isalnum())
+                    if before_ok and after_ok:
+                        inner_matches.append((start, end, inner))
+                        break
+                    start = outer.find(inner, start + 1)
+            if inner_matches:
+                nested[outer] = inner_matches
+        return nested
+
+    def _scan(self, text):
+        """Yield (start, end, pattern) for the longest skill at each match of the trie"""
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            matches = self.pattern.finditer(lowered)
+        else:
+            matches = self.pattern_ignorecase.finditer(text)
+        for match in matches:
+            key = match.group().lower()
+            # Only matches spanning a whitespace run other than one space need normalizing
+            if key not in self.canonical:
+                key = normalize_phrase(key)
+                if key not in self.canonical:
+                    continue
+            yield match.start(), match.end(), key
+
+    def finditer(self, text):
+        """Yield a SkillMatch (start, end, skill) for every skill in the text"""
+        for match_start, match_end, key in self._scan(text):
+            yield SkillMatch(match_start, match_end, self.canonical[key])
+            for start, end, inner in self.nested.get(key, ()):
+                # Offsets are exact unless the matched text had collapsed whitespace
+                yield SkillMatch(match_start + start, match_start + end, self.canonical[inner])
+
+    def _occurs(self, lowered, key, pos=0):
+        """Whether a skill occurs in the lowercased text at or after `pos`"""
+        pattern = self.searches[key]
+        if len(key) < 3:
+            # Too common as a substring to skip ahead with: 'r', 'c', 'go'
+            return pattern.search(lowered, pos) is not None
+        start = lowered.find(key, pos)
+        while start != -1:
+            if pattern.match(lowered, start):
+                return True
+            start = lowered.find(key, start + 1)
+        # The words of a phrase may be separated by a line break or several spaces
+        return ' ' in key and pattern.search(lowered, pos) is not None
+
+    def find_skills(self, text):
+        """Return the distinct skills in the text, in the order they were given"""
+        lowered = text.lower()
+        found = set()
+        if len(lowered) != len(text):
+            # Lowercasing changed the offsets; scan the original text instead
+            for start, end, key in self._scan(text):
+                if key not in found:
+                    found.add(key)
+                    found.update(inner for _, _, inner in self.nested.get(key, ()))
+        else:
+            missing = set(self.words)
+            vocabularies = []
+            pos = 0
+            while pos < len(lowered) and missing:
+                if len(missing) < SEARCH_BELOW:
+                    found.update(key for key in missing if self._occurs(lowered, key, pos))
+                    break
+                end = pos + VOCABULARY_CHUNK
+                while end < len(lowered) and not lowered[end].isspace():
+                    end += 1
+                # Whitespace is never part of a skill word, so a single-word skill
+                # occurs in the chunk exactly when it occurs in one of its tokens
+                vocabulary = '\n'.join(set(lowered[pos:end].split()))
+                vocabularies.append(vocabulary)
+                for match in self.word_pattern.finditer(vocabulary):
+                    key = match.group()
+                    if key not in found:
+                        found.add(key)
+                        found.update(inner for _, _, inner in self.nested.get(key, ()))
+                missing -= found
+                pos = end
+            phrases = self.phrases
+            if pos >= len(lowered):
+                # Every token was seen, so a phrase with a word not among them is absent
+                vocabulary = '\n'.join(vocabularies)
+                phrases = [key for key in phrases if all(word in vocabulary for word in self.phrase_words[key])]
+            found.update(key for key in phrases if self._occurs(lowered, key))
+        return list(dict.fromkeys(skill for key, skill in self.canonical.items() if key in found))
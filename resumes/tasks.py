@@ -0,0 +1,154 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+from .models import Resume, ResumeParseJob
+from .utils import close_upload, get_cached_parse, parse_resume, set_resume_scores, store_parse_cache
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_executor():
+    """Return the process-wide background pool, created on first use"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, 'RESUME_PARSE_WORKERS', 2),
+                    thread_name_prefix='resume-parse'
+                )
+    return _executor
+
+def start_parse(source, filename):
+    """Start parsing an upload straight from memory while the request is still storing it.
+
+    The source is closed with close_upload once the parse has finished.
+    """
+    pending = get_executor().submit(parse_resume, source, filename)
+    pending.add_done_callback(lambda future: close_upload(source))
+    return pending
+
+def enqueue_parse_job(job, pending=None):
+    """Schedule a parse job once the surrounding transaction has committed.
+
+    With a pending in-memory parse the job is only submitted when that parse
+    has finished, so no pool thread sits waiting on another one.
+    """
+    def submit():
+        if pending is None:
+            get_executor().submit(run_parse_job, job.id)
+        else:
+            pending.add_done_callback(lambda future: get_executor().submit(run_parse_job, job.id, future))
+    transaction.on_commit(submit)
+
+def parse_job_file(job, pending=None):
+    """Parse result for a job: cached, from the in-memory parse, or from storage"""
+    cached = get_cached_parse(job.content_hash) if job.content_hash else None
+    if cached:
+        return cached
+    
+    if pending is None:
+        # Not parsed while uploading (a cache hit that has since been evicted,
+        # or a job run again by requeue_parse_jobs); read the stored file
+        # through the storage API so this also works on non-filesystem storage
+        with job.file.open('rb') as file:
+            data = file.read()
+        extracted_text, parsed_data = parse_resume(data, job.original_filename)
+    else:
+        # Already finished: run_parse_job is submitted from its done callback
+        extracted_text, parsed_data = pending.result()
+    if job.content_hash:
+        store_parse_cache(job.content_hash, extracted_text, parsed_data)
+    return extracted_text, parsed_data
+
+def run_parse_job(job_id, pending=None):
+    """Parse the uploaded file of a job and publish the result to the user's Resume"""
+    close_old_connections()
+    try:
+        try:
+            job = ResumeParseJob.objects.select_related('user').get(id=job_id)
+        except ResumeParseJob.DoesNotExist:
+            logger.warning(f"Resume parse job {job_id} no longer exists")
+            return
+
+        job.status = 'running'
+        job.started_at = timezone.now()
+        job.save(update_fields=['status', 'started_at'])
+
+        try:
+            extracted_text, parsed_data = parse_job_file(job, pending)
+        except Exception as e:
+            logger.error(f"Resume parse job {job_id} failed: {str(e)}")
+            fail_parse_job(job, str(e))
+            return
+
+        publish_parse_result(job, extracted_text, parsed_data)
+    except Exception as e:
+        logger.exception(f"Unexpected error in resume parse job {job_id}: {str(e)}")
+        job = ResumeParseJob.objects.filter(id=job_id).first()
+        if job is not None:
+            fail_parse_job(job, str(e))
+    finally:
+        close_old_connections()
+
+def fail_parse_job(job, error):
+    """Mark a job failed and delete its stored upload, which no Resume refers to"""
+    if job.file:
+        stored_file = job.file.name
+        transaction.on_commit(lambda: default_storage.delete(stored_file))
+        job.file = ''
+    job.status = 'failed'
+    job.error = error
+    job.finished_at = timezone.now()
+    job.save(update_fields=['file', 'status', 'error', 'finished_at'])
+
+def newer_published_job_exists(job):
+    """Whether a later upload of the same user has already been published to the Resume"""
+    return ResumeParseJob.objects.filter(user_id=job.user_id, status='done').filter(
+        Q(created_at__gt=job.created_at) | Q(created_at=job.created_at, id__gt=job.id)
+    ).exists()
+
+def publish_parse_result(job, extracted_text, parsed_data):
+    """Update (or create) the user's Resume with a successful parse result.
+
+    A result that finishes after a newer upload has been published is
+    discarded instead of overwriting the newer Resume; returns None then.
+    """
+    with transaction.atomic():
+        resume = Resume.objects.select_for_update().filter(user=job.user).first()
+        if newer_published_job_exists(job):
+            logger.info(f"Resume parse job {job.id} superseded by a newer upload")
+            fail_parse_job(job, 'Superseded by a newer upload')
+            return None
+        previous_file = resume.file.name if resume else None
+        if resume is None:
+            resume = Resume(user=job.user)
+
+        resume.file = job.file.name
+        resume.original_filename = job.original_filename
+        resume.content_hash = job.content_hash
+        resume.extracted_text = extracted_text
+        resume.parsed_data = parsed_data
+        set_resume_scores(resume)
+        resume.save()
+
+        job.user.resume_uploaded = True
+        job.user.save(update_fields=['resume_uploaded'])
+
+        job.resume = resume
+        job.parsed_data = parsed_data
+        job.status = 'done'
+        job.finished_at = timezone.now()
+        job.save(update_fields=['resume', 'parsed_data', 'status', 'finished_at'])
+
+        if previous_file and previous_file != job.file.name:
+            transaction.on_commit(lambda: default_storage.delete(previous_file))
+
+    return resume
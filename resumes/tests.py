@@ -0,0 +1,134 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+from django.conf import settings
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.test import TestCase
+from . import docx_extraction, pdf_extraction
+from .tasks import start_parse
+from .utils import read_upload
+from .benchmarks import FLAT_MEMORY_LIMIT, HEAVY_MODULES, peak_memory, synthetic_docx_bytes, synthetic_pdf_bytes, write_temp_file
+
+class PdfStreamingMemoryTests(TestCase):
+    """Streaming pdfplumber extraction holds one page at a time"""
+
+    def extract_peak(self, pages):
+        path = write_temp_file(synthetic_pdf_bytes(pages), '.pdf')
+        counted = []
+
+        def extract():
+            # Count the pages rather than keep their text, which grows with them
+            counted.append(sum(1 for _ in pdf_extraction.stream_pdf_pages(path, 10 ** 6, None)))
+
+        try:
+            peak = peak_memory(extract)
+        finally:
+            os.remove(path)
+        self.assertGreaterEqual(counted[0], pages)
+        return peak
+
+    def test_peak_memory_does_not_grow_with_page_count(self):
+        small = self.extract_peak(4)
+        large = self.extract_peak(16)
+        self.assertLessEqual(large, small * FLAT_MEMORY_LIMIT)
+
+
+def python_docx_text(data):
+    """python-docx rendering of every body paragraph and table row, in document order"""
+    from docx import Document
+    from docx.oxml.ns import qn
+    from docx.table import Table
+    from docx.text.paragraph import Paragraph
+
+    document = Document(io.BytesIO(data))
+    lines = []
+    for block in document.element.body.iterchildren():
+        if block.tag == qn('w:p'):
+            lines.append(Paragraph(block, document).text + '\n')
+        elif block.tag == qn('w:tbl'):
+            for row in Table(block, document).rows:
+                lines.append(''.join(cell.text + ' ' for cell in row.cells) + '\n')
+    return ''.join(lines)
+
+class DocxStreamingTests(TestCase):
+    """The iterparse extractor renders text exactly as python-docx does"""
+
+    def build(self):
+        from docx import Document
+
+        document = Document()
+        document.sections[0].header.paragraphs[0].text = 'Page header, not body text'
+        document.add_heading('Jane Candidate', 0)
+        document.add_heading('Experience', 1)
+        for _ in range(3):
+            document.add_paragraph('Built data pipelines in Python')
+        paragraph = document.add_paragraph('Remote')
+        paragraph.add_run('\tFull time')
+        paragraph.add_run().add_break()
+        paragraph.add_run('2019 - 2024')
+
+        table = document.add_table(rows=3, cols=3)
+        for row in table.rows:
+            for cell in row.cells:
+                cell.text = 'SQL'
+        table.cell(0, 0).add_paragraph('5 years')
+        table.cell(1, 0).merge(table.cell(1, 1)).text = 'Spans two columns'
+        table.cell(1, 2).merge(table.cell(2, 2)).text = 'Spans two rows'
+        table.cell(0, 2).add_table(rows=1, cols=2).cell(0, 0).text = 'Nested'
+        document.add_paragraph('Built data pipelines in Python')
+
+        output = io.BytesIO()
+        document.save(output)
+        return output.getvalue()
+
+    def test_matches_python_docx(self):
+        data = self.build()
+        self.assertEqual(docx_extraction.extract_docx_stream(data), python_docx_text(data))
+
+    def test_matches_python_docx_on_generated_resumes(self):
+        for pages, tables in [(2, 0), (2, 20)]:
+            data = synthetic_docx_bytes(pages, tables=tables, seed=pages + tables)
+            with self.subTest(pages=pages, tables=tables):
+                self.assertEqual(docx_extraction.extract_docx_stream(data), python_docx_text(data))
+
+
+class UploadSourceTests(TestCase):
+    """Spooled uploads are memory-mapped and unmapped once parsed"""
+
+    def test_mapped_upload_is_closed_after_parse(self):
+        data = synthetic_docx_bytes(2)
+        with TemporaryUploadedFile('resume.docx', 'application/octet-stream', len(data), None) as upload:
+            upload.write(data)
+            upload.flush()
+            source = read_upload(upload)
+            self.assertEqual(bytes(source), data)
+            pending = start_parse(source, upload.name)
+            # Callbacks run in the order they were added, after result() returns
+            finished = threading.Event()
+            pending.add_done_callback(lambda future: finished.set())
+            self.assertTrue(finished.wait(timeout=60))
+        self.assertTrue(pending.result()[0])
+        self.assertTrue(source.closed)
+
+
+IMPORT_SCRIPT = """
+import json, sys
+import django
+django.setup()
+import resumes.utils, resumes.views, jobs.views
+print(json.dumps([name for name in sys.argv[1:] if name in sys.modules]))
+"""
+
+class LazyImportTests(TestCase):
+    """Parsing and generation libraries are only imported when first used"""
+
+    def test_views_and_utils_import_no_heavy_modules(self):
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings.SETTINGS_MODULE)
+        output = subprocess.run(
+            [sys.executable, '-c', IMPORT_SCRIPT, *HEAVY_MODULES],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(json.loads(output.strip().splitlines()[-1]), [])
@@ -3,8 +3,10 @@ from . import views
 
 urlpatterns = [
     path('upload/', views.upload_resume, name='upload-resume'),
+    path('parse-status/<int:job_id>/', views.parse_status, name='resume-parse-status'),
     path('', views.get_resume, name='get-resume'),
     path('analyze/', views.analyze_resume_view, name='analyze-resume'),
+    path('analyze-batch/', views.analyze_resume_batch_view, name='analyze-resume-batch'),
     path('analyses/', views.resume_analyses, name='resume-analyses'),
     path('generate-cover-letter/', views.generate_cover_letter, name='generate-cover-letter'),
 ]
\ No newline at end of file
@@ -1,73 +1,385 @@
-import os
-import PyPDF2
-import pdfplumber
-from docx import Document
+import hashlib
+import mmap
+import json
+import logging
 import re
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
 from collections import Counter
-import math
-import numpy as np
-from .models import ResumeAnalysis
-from jobs.models import Job
+from functools import cached_property, lru_cache
+import time
+from django.conf import settings
+from django.db import IntegrityError
+from django.db.models import F, Sum
+from django.utils import timezone
+from . import docx_extraction
+from .buffers import open_source, source_name, source_size
+from .models import ParsedResumeCache, Resume, ResumeAnalysis
+from .sections import SECTION_KEYWORDS, segment_resume
+from .scoring import FEATURES, ats_scores, feature_matrix, overall_scores, resume_features, score_features
+from .skill_matcher import SkillMatcher, normalize_phrase
+from jobs.models import Job, JobProfile
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
+# Bump whenever the extraction or parsing output changes so cached results
+# produced by older code are no longer reused. Every parse result records the
+# version in parsed_data['_meta']; `manage.py reparse_resumes` brings stored
+# resumes up to date from their extracted text.
+PARSER_VERSION = 9
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+# Bump whenever the scores, strengths, improvements or missing keywords of an
+# analysis change. Stored analyses are reused only while the resume content,
+# the job and both versions are unchanged.
+SCORER_VERSION = 1
 
-def parse_resume(file_path):
-    """Extract text and parse data from resume file"""
+# Bump whenever build_job_profile output changes; `manage.py backfill_job_profiles`
+# rebuilds the stored profiles and older ones are recomputed on read until then.
+JOB_PROFILE_VERSION = 1
+
+# Contact patterns are compiled once. Every repetition is bounded and each one
+# starts only where the previous character cannot continue it, so a scan is
+# linear in the text length even on long digit runs or whitespace dumps.
+EMAIL_PATTERN = re.compile(
+    r'(?<![A-Za-z0-9._%+-])[A-Za-z0-9._%+-]{1,64}'
+    r'@(?:[A-Za-z0-9-]{1,63}\.){1,8}[A-Za-z]{2,63}\b'
+)
+# Separators stay on one line, so a number never runs into the address or dates below it
+PHONE_PATTERN = re.compile(r'(?<![\w+])[+(]?\d[\d \t().-]{6,20}\d(?!\d)')
+# dd.mm.yyyy and yyyy-mm-dd dates, masked before the phone scan so they are not read as part of a number
+DATE_PATTERN = re.compile(r'(?<![\d.-])(?:\d{1,2}[./-]\d{1,2}[./-]\d{4}|\d{4}[./-]\d{1,2}[./-]\d{1,2})(?![\d.-]?\d)')
+LINKEDIN_PATTERN = re.compile(r'linkedin\.com/in/[\w-]{1,100}', re.IGNORECASE)
+GITHUB_PATTERN = re.compile(r'github\.com/[\w-]{1,100}', re.IGNORECASE)
+SECTION_PHONE_PATTERN = re.compile(r'(?<!\d)\d{3}[-.\s]?\d{3}[-.\s]?\d{4}')
+
+# One structured line per parsed resume with its per-stage timings
+metrics_logger = logging.getLogger('resumes.metrics')
+
+# Hit/miss/insert counters of the parse cache for this process
+parse_cache_stats = Counter()
+
+@lru_cache(maxsize=None)
+def get_nltk():
+    """Import NLTK on first use and point it at the data shipped with the deployment.
+
+    NLTK, pdfplumber/PyPDF2 and python-docx are imported where they are used so
+    that importing this module (which jobs.views does) stays cheap; the NLTK
+    data is installed by build.sh and never downloaded at runtime.
+    """
+    import nltk
+    data_dir = getattr(settings, 'NLTK_DATA_DIR', None)
+    if data_dir and data_dir not in nltk.data.path:
+        nltk.data.path.insert(0, data_dir)
+    return nltk
+
+# Comprehensive skill database
+TECHNICAL_SKILLS = [
+    # Programming Languages
+    'Python', 'JavaScript', 'Java', 'C++', 'C#', 'PHP', 'Ruby', 'Go', 'Rust', 'Swift',
+    'Kotlin', 'TypeScript', 'Scala', 'R', 'MATLAB', 'Perl', 'Shell', 'Bash',
+
+    # Web Technologies
+    'HTML', 'CSS', 'React', 'Angular', 'Vue.js', 'Node.js', 'Express.js', 'Django',
+    'Flask', 'FastAPI', 'Spring', 'Laravel', 'Rails', 'ASP.NET', 'jQuery', 'Bootstrap',
+    'Tailwind CSS', 'SASS', 'LESS', 'Webpack', 'Vite', 'Next.js', 'Nuxt.js',
+
+    # Databases
+    'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'SQLite', 'Oracle', 'SQL Server',
+    'Cassandra', 'DynamoDB', 'Elasticsearch', 'Neo4j', 'Firebase',
+
+    # Cloud & DevOps
+    'AWS', 'Azure', 'Google Cloud', 'Docker', 'Kubernetes', 'Jenkins', 'GitLab CI',
+    'GitHub Actions', 'Terraform', 'Ansible', 'Chef', 'Puppet', 'Vagrant',
+
+    # Data Science & AI
+    'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'Keras', 'Scikit-learn',
+    'Pandas', 'NumPy', 'Matplotlib', 'Seaborn', 'Jupyter', 'Apache Spark', 'Hadoop',
+    'Tableau', 'Power BI', 'D3.js', 'OpenCV', 'NLTK', 'spaCy',
+
+    # Mobile Development
+    'iOS', 'Android', 'React Native', 'Flutter', 'Xamarin', 'Ionic',
+
+    # Tools & Others
+    'Git', 'SVN', 'Jira', 'Confluence', 'Slack', 'Trello', 'Figma', 'Adobe Creative Suite',
+    'Photoshop', 'Illustrator', 'InDesign', 'Sketch', 'InVision', 'Zeplin'
+]
+
+# Soft skills
+SOFT_SKILLS = [
+    'Leadership', 'Communication', 'Teamwork', 'Problem Solving', 'Critical Thinking',
+    'Project Management', 'Time Management', 'Adaptability', 'Creativity', 'Innovation',
+    'Analytical Skills', 'Attention to Detail', 'Customer Service', 'Negotiation',
+    'Presentation Skills', 'Public Speaking', 'Mentoring', 'Coaching'
+]
+
+# Comprehensive skill database with variations
+SKILL_PATTERNS = {
+    # Programming Languages
+    'python': ['python', 'py'],
+    'javascript': ['javascript', 'js', 'ecmascript'],
+    'java': ['java'],
+    'c++': ['c++', 'cpp', 'c plus plus'],
+    'c#': ['c#', 'csharp', 'c sharp'],
+    'php': ['php'],
+    'ruby': ['ruby'],
+    'go': ['golang', 'go'],
+    'rust': ['rust'],
+    'swift': ['swift'],
+    'kotlin': ['kotlin'],
+    'typescript': ['typescript', 'ts'],
+    'scala': ['scala'],
+    'r': ['r programming', 'r language'],
+
+    # Web Technologies
+    'html': ['html', 'html5'],
+    'css': ['css', 'css3'],
+    'react': ['react', 'reactjs', 'react.js'],
+    'angular': ['angular', 'angularjs'],
+    'vue': ['vue', 'vuejs', 'vue.js'],
+    'node.js': ['nodejs', 'node.js', 'node js'],
+    'express': ['express', 'expressjs', 'express.js'],
+    'django': ['django'],
+    'flask': ['flask'],
+    'spring': ['spring', 'spring boot'],
+    'laravel': ['laravel'],
+    'rails': ['rails', 'ruby on rails'],
+
+    # Databases
+    'mysql': ['mysql'],
+    'postgresql': ['postgresql', 'postgres'],
+    'mongodb': ['mongodb', 'mongo'],
+    'redis': ['redis'],
+    'sqlite': ['sqlite'],
+    'oracle': ['oracle', 'oracle db'],
+
+    # Cloud & DevOps
+    'aws': ['aws', 'amazon web services'],
+    'azure': ['azure', 'microsoft azure'],
+    'gcp': ['gcp', 'google cloud', 'google cloud platform'],
+    'docker': ['docker'],
+    'kubernetes': ['kubernetes', 'k8s'],
+    'jenkins': ['jenkins'],
+    'git': ['git'],
+
+    # Data Science
+    'machine learning': ['machine learning', 'ml'],
+    'deep learning': ['deep learning', 'dl'],
+    'tensorflow': ['tensorflow'],
+    'pytorch': ['pytorch'],
+    'pandas': ['pandas'],
+    'numpy': ['numpy'],
+    'scikit-learn': ['scikit-learn', 'sklearn'],
+}
+
+@lru_cache(maxsize=None)
+def get_skill_matcher():
+    """Matcher over the technical and soft skill lists, built once per process"""
+    return SkillMatcher(TECHNICAL_SKILLS + SOFT_SKILLS)
+
+@lru_cache(maxsize=None)
+def get_skill_alias_matcher():
+    """Matcher mapping every skill variation to its title-cased skill name"""
+    return SkillMatcher({
+        pattern: skill.title()
+        for skill, patterns in SKILL_PATTERNS.items()
+        for pattern in patterns
+    })
+
+def parse_resume(source, filename=None):
+    """Extract text and parse data from a resume path or in-memory buffer"""
     
+    start = time.perf_counter()
     extracted_text = ""
+    extraction = {'strategy': None}
+    name = source_name(source, filename).lower()
     
-    if file_path.lower().endswith('.pdf'):
-        extracted_text = extract_text_from_pdf(file_path)
-    elif file_path.lower().endswith('.docx'):
-        extracted_text = extract_text_from_docx(file_path)
+    if name.endswith('.pdf'):
+        extracted_text, extraction = extract_pdf(source)
+    elif name.endswith('.docx'):
+        extracted_text, extraction = extract_docx(source)
+    extract_seconds = time.perf_counter() - start
     
     # Parse the extracted text
     parsed_data = parse_resume_text(extracted_text)
     
+    meta = parsed_data['_meta']
+    meta['extraction'] = extraction
+    meta['input_bytes'] = source_size(source)
+    meta['stages'] = {'extract': round(extract_seconds, 6), **meta['stages']}
+    meta['total_seconds'] = round(time.perf_counter() - start, 6)
+    log_parse_metrics(meta)
+    
     return extracted_text, parsed_data
 
-def extract_text_from_pdf(file_path):
+def reparse_parsed_data(extracted_text, parsed_data):
+    """Re-run the parser on stored text, keeping the original extraction details"""
+    extraction = ((parsed_data or {}).get('_meta') or {}).get('extraction', {'strategy': None})
+    new_data = parse_resume_text(extracted_text or '')
+    new_data['_meta']['extraction'] = extraction
+    return new_data
+
+def log_parse_metrics(meta):
+    """Emit the timings of one parse as a key=value log line, with the same fields as `extra`"""
+    metrics = {
+        'strategy': meta.get('extraction', {}).get('strategy'),
+        'input_bytes': meta.get('input_bytes'),
+        'input_chars': meta.get('input_chars'),
+        'total_seconds': meta.get('total_seconds'),
+    }
+    for stage, seconds in meta.get('stages', {}).items():
+        metrics[f'{stage}_seconds'] = seconds
+    fields = [f'{key}={value:.6f}' if isinstance(value, float) else f'{key}={value}' for key, value in metrics.items()]
+    metrics_logger.info(
+        'resume_parse ' + ' '.join(fields),
+        extra={'resume_parse': metrics}
+    )
+
+def read_upload(upload):
+    """Return an upload's content for parsing without writing it anywhere.
+
+    Small uploads are already in memory and are returned as bytes; large ones
+    Django spooled to a temporary file, which is memory-mapped instead of read.
+    """
+    if hasattr(upload, 'temporary_file_path') and upload.size:
+        with open(upload.temporary_file_path(), 'rb') as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    upload.seek(0)
+    data = upload.read()
+    upload.seek(0)
+    return data
+
+def close_upload(source):
+    """Unmap content returned by read_upload once it has been hashed and parsed"""
+    if isinstance(source, mmap.mmap):
+        try:
+            source.close()
+        except BufferError:
+            # A failed parse can still hold a view into the map through its
+            # traceback; the map is then released along with that
+            pass
+
+def is_parse_cached(content_hash):
+    """Whether the cache holds a parse of the content; unlike get_cached_parse, not counted as a use"""
+    return ParsedResumeCache.objects.filter(content_hash=content_hash, parser_version=PARSER_VERSION).exists()
+
+def get_cached_parse(content_hash):
+    """Return the cached (text, parsed data) for the content, or None on a miss"""
+    entry = ParsedResumeCache.objects.filter(
+        content_hash=content_hash,
+        parser_version=PARSER_VERSION
+    ).first()
+    if entry:
+        ParsedResumeCache.objects.filter(id=entry.id).update(
+            hit_count=F('hit_count') + 1,
+            last_used_at=timezone.now()
+        )
+        parse_cache_stats['hits'] += 1
+        return entry.extracted_text, entry.parsed_data
+    
+    parse_cache_stats['misses'] += 1
+    return None
+
+def store_parse_cache(content_hash, extracted_text, parsed_data):
+    """Save a parse result in the cache; every RESUME_PARSE_CACHE_EVICT_EVERY inserts, evict if it is over budget"""
+    size_bytes = len(extracted_text.encode('utf-8')) + len(json.dumps(parsed_data))
+    try:
+        ParsedResumeCache.objects.create(
+            content_hash=content_hash,
+            parser_version=PARSER_VERSION,
+            extracted_text=extracted_text,
+            parsed_data=parsed_data,
+            size_bytes=size_bytes
+        )
+    except IntegrityError:
+        # Another worker cached the same content concurrently
+        return
+    # Sizing the whole table costs an aggregate query, so the limits are checked
+    # on the first insert of each process and then once per batch of inserts
+    parse_cache_stats['inserts'] += 1
+    if (parse_cache_stats['inserts'] - 1) % getattr(settings, 'RESUME_PARSE_CACHE_EVICT_EVERY', 100) == 0:
+        evict_parse_cache()
+
+def evict_parse_cache():
+    """Drop least recently used cache entries beyond the entry and size limits"""
+    max_entries = getattr(settings, 'RESUME_PARSE_CACHE_MAX_ENTRIES', 5000)
+    max_bytes = getattr(settings, 'RESUME_PARSE_CACHE_MAX_BYTES', 200 * 1024 * 1024)
+    
+    totals = ParsedResumeCache.objects.aggregate(total_bytes=Sum('size_bytes'))
+    entries = ParsedResumeCache.objects.count()
+    total_bytes = totals['total_bytes'] or 0
+    if entries <= max_entries and total_bytes <= max_bytes:
+        return 0
+    
+    evict_ids = []
+    for entry_id, size_bytes in ParsedResumeCache.objects.order_by('last_used_at').values_list('id', 'size_bytes').iterator():
+        if entries <= max_entries and total_bytes <= max_bytes:
+            break
+        evict_ids.append(entry_id)
+        entries -= 1
+        total_bytes -= size_bytes
+    
+    ParsedResumeCache.objects.filter(id__in=evict_ids).delete()
+    parse_cache_stats['evictions'] += len(evict_ids)
+    return len(evict_ids)
+
+def extract_text_from_pdf(source):
     """Extract text from PDF file using both PyPDF2 and pdfplumber"""
-    text = ""
+    return extract_pdf(source)[0]
+
+def extract_pdf(source):
+    """Extract PDF text and describe the extraction strategy that was used"""
+    from . import pdf_extraction
+    
+    max_pages = getattr(settings, 'RESUME_PDF_MAX_PAGES', 50)
+    max_chars = getattr(settings, 'RESUME_PDF_MAX_CHARS', 200000)
     
-    # Try pdfplumber first (better for complex layouts)
+    # Probe the text layer with PyPDF2 and keep it for simple layouts; complex
+    # layouts go to pdfplumber, with many-page documents split into page ranges
+    # extracted in parallel worker processes
     try:
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+        return pdf_extraction.extract_tiered(
+            source,
+            max_pages=max_pages,
+            max_chars=max_chars,
+            parallel_min_pages=getattr(settings, 'RESUME_PDF_PARALLEL_MIN_PAGES', 8),
+            workers=getattr(settings, 'RESUME_PDF_WORKERS', 2),
+            strategy=getattr(settings, 'RESUME_PDF_STRATEGY', 'auto')
+        )
     except Exception as e:
         print(f"pdfplumber failed: {e}, trying PyPDF2")
         
         # Fallback to PyPDF2
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
+            start = time.perf_counter()
+            text = pdf_extraction.extract_pypdf2(source, max_pages=max_pages, max_chars=max_chars)
+            return text, {'strategy': 'pypdf2-fallback', 'seconds': round(time.perf_counter() - start, 4)}
         except Exception as e:
             raise Exception(f"Error reading PDF: {str(e)}")
-    
-    return text
 
-def extract_text_from_docx(file_path):
+def extract_text_from_docx(source):
     """Extract text from DOCX file"""
+    return extract_docx(source)[0]
+
+def extract_docx(source):
+    """Extract DOCX text and describe the extraction strategy that was used"""
+    start = time.perf_counter()
+    
+    # Stream word/document.xml out of the archive; python-docx is only needed
+    # for documents the streaming reader cannot handle
+    try:
+        text = docx_extraction.extract_docx_stream(source)
+        strategy = 'docx-stream'
+    except Exception as e:
+        print(f"Streaming DOCX extraction failed: {e}, trying python-docx")
+        text = extract_docx_python_docx(source)
+        strategy = 'python-docx'
+    
+    return text, {'strategy': strategy, 'seconds': round(time.perf_counter() - start, 4)}
+
+def extract_docx_python_docx(source):
+    """Extract DOCX text through the python-docx object model"""
+    from docx import Document
+    
     text = ""
     try:
-        doc = Document(file_path)
+        with open_source(source) as stream:
+            doc = Document(stream)
         for paragraph in doc.paragraphs:
             text += paragraph.text + "\n"
         
@@ -83,198 +395,242 @@ def extract_text_from_docx(file_path):
     
     return text
 
+@lru_cache(maxsize=None)
+def english_stopwords():
+    """NLTK's English stopwords, loaded from disk once per process"""
+    return frozenset(get_nltk().corpus.stopwords.words('english'))
+
+# Additional stop words specific to resumes
+RESUME_STOP_WORDS = frozenset({
+    'resume', 'cv', 'curriculum', 'vitae', 'name', 'address', 'phone', 'email',
+    'references', 'available', 'upon', 'request', 'page', 'www', 'http', 'https'
+})
+
+@lru_cache(maxsize=None)
+def keyword_stopwords():
+    return english_stopwords() | RESUME_STOP_WORDS
+
+_WORD = re.compile(r'\w+')
+_NON_LETTER = re.compile(r'[^a-zA-Z\s]')
+
+class ResumeDocument:
+    """A resume or job description text with its derived forms computed once.
+
+    Every form is built on first use and shared by all the extractors and
+    similarity functions that receive the document, so the text is lowercased,
+    tokenized, split into lines and stopword-filtered at most once.
+    """
+    
+    def __init__(self, text):
+        self.text = text or ''
+    
+    @cached_property
+    def lower_text(self):
+        return self.text.lower()
+    
+    @cached_property
+    def segments(self):
+        """Line index and section spans"""
+        return segment_resume(self.text)
+    
+    @cached_property
+    def tokens(self):
+        """NLTK word tokens; raises LookupError when the punkt data is missing"""
+        return get_nltk().word_tokenize(self.text)
+    
+    @cached_property
+    def word_set(self):
+        return frozenset(_WORD.findall(self.lower_text))
+    
+    @cached_property
+    def content_words(self):
+        """Distinct words without English stopwords"""
+        return self.word_set - english_stopwords()
+    
+    @cached_property
+    def term_counts(self):
+        """Frequency of every word of two or more characters that is not a number, for TF-IDF"""
+        return Counter(word for word in _WORD.findall(self.lower_text) if len(word) > 1 and not word.isdigit())
+    
+    @cached_property
+    def keyword_counts(self):
+        """Frequency of letter-only words longer than two characters, without stopwords"""
+        stop_words = keyword_stopwords()
+        cleaned_text = _NON_LETTER.sub('', self.segments.lower_text)
+        return Counter(word for word in cleaned_text.split() if word not in stop_words and len(word) > 2)
+
+@lru_cache(maxsize=64)
+def get_document(text):
+    """Shared ResumeDocument for a text, so a resume compared against many jobs is processed once"""
+    return ResumeDocument(text)
+
+def as_document(text_or_document):
+    if isinstance(text_or_document, ResumeDocument):
+        return text_or_document
+    return get_document(text_or_document or '')
+
 def parse_resume_text(text):
     """Parse resume text to extract structured data"""
     
-    parsed_data = {
-        'contact_info': extract_contact_info(text),
-        'skills': extract_skills_advanced(text),
-        'experience': extract_experience(text),
-        'education': extract_education(text),
-        'sections': identify_sections(text),
-        'keywords': extract_keywords_simple(text)
-    }
+    # Lines, sections, tokens and word counts are computed once and shared by
+    # every extractor; segmenting and NLTK tokenization are timed on their own
+    document = ResumeDocument(text)
+    stages = {}
+    
+    start = time.perf_counter()
+    document.segments
+    stages['segment'] = round(time.perf_counter() - start, 6)
     
+    start = time.perf_counter()
+    try:
+        document.tokens
+    except Exception:
+        # Reported by the skills extractor, which falls back without tokens
+        pass
+    stages['tokenize'] = round(time.perf_counter() - start, 6)
+    
+    parsed_data = {}
+    for field, extractor in PARSE_STAGES:
+        start = time.perf_counter()
+        parsed_data[field] = extractor(text, document)
+        stages[field] = round(time.perf_counter() - start, 6)
+    
+    parsed_data['_meta'] = {
+        'parser_version': PARSER_VERSION,
+        'input_chars': len(text or ''),
+        'stages': stages,
+    }
     return parsed_data
 
-def extract_contact_info(text):
+def extract_contact_info(text, document=None):
     """Extract contact information from resume text"""
+    # Contact details normally sit above the first section header, so the rest
+    # of the document is only scanned for fields the preamble did not provide
+    sources = document.segments.split_preamble() if document is not None else [text]
     contact_info = {}
     
-    # Email regex
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text)
-    if emails:
-        contact_info['email'] = emails[0]
-    
-    # Phone regex (multiple formats)
-    phone_patterns = [
-        r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-        r'(\+?\d{1,3}[-.\s]?)?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',
-        r'(\+?\d{1,3}[-.\s]?)?\d{10}'
-    ]
-    
-    for pattern in phone_patterns:
-        phones = re.findall(pattern, text)
-        if phones:
-            contact_info['phone'] = phones[0] if isinstance(phones[0], str) else ''.join(phones[0])
+    for source in sources:
+        find_contact_fields(source, contact_info)
+        if len(contact_info) == 4:
             break
     
-    # LinkedIn URL
-    linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-    linkedin = re.findall(linkedin_pattern, text, re.IGNORECASE)
-    if linkedin:
-        contact_info['linkedin'] = f"https://{linkedin[0]}"
+    return contact_info
+
+def find_contact_fields(text, contact_info):
+    """Add the contact fields found in `text` that are not in `contact_info` yet"""
+    if 'email' not in contact_info:
+        match = EMAIL_PATTERN.search(text)
+        if match:
+            # Like a leading \b, drop punctuation that cannot start an address
+            contact_info['email'] = match.group().lstrip('._%+-')
+    
+    if 'phone' not in contact_info:
+        # The mask keeps offsets and cannot be part of a match, so matches read the same as in `text`
+        for match in PHONE_PATTERN.finditer(DATE_PATTERN.sub(lambda date: '#' * len(date.group()), text)):
+            if is_phone_number(match.group()):
+                contact_info['phone'] = match.group()
+                break
     
-    # GitHub URL
-    github_pattern = r'github\.com/[\w-]+'
-    github = re.findall(github_pattern, text, re.IGNORECASE)
-    if github:
-        contact_info['github'] = f"https://{github[0]}"
+    if 'linkedin' not in contact_info:
+        match = LINKEDIN_PATTERN.search(text)
+        if match:
+            contact_info['linkedin'] = f"https://{match.group()}"
+    
+    if 'github' not in contact_info:
+        match = GITHUB_PATTERN.search(text)
+        if match:
+            contact_info['github'] = f"https://{match.group()}"
     
     return contact_info
 
-def extract_skills_advanced(text):
+def is_phone_number(candidate):
+    """Accept 10-15 digit candidates that are not just a run of years"""
+    groups = re.findall(r'\d+', candidate)
+    digits = sum(len(group) for group in groups)
+    if digits < 10 or digits > 15:
+        return False
+    return not all(len(group) == 4 and group[:2] in ('19', '20') for group in groups)
+
+def extract_skills_advanced(text, document=None):
     """Extract skills using NLTK and predefined skill lists"""
+    document = document or ResumeDocument(text)
     
-    # Comprehensive skill database
-    technical_skills = [
-        # Programming Languages
-        'Python', 'JavaScript', 'Java', 'C++', 'C#', 'PHP', 'Ruby', 'Go', 'Rust', 'Swift',
-        'Kotlin', 'TypeScript', 'Scala', 'R', 'MATLAB', 'Perl', 'Shell', 'Bash',
-        
-        # Web Technologies
-        'HTML', 'CSS', 'React', 'Angular', 'Vue.js', 'Node.js', 'Express.js', 'Django',
-        'Flask', 'FastAPI', 'Spring', 'Laravel', 'Rails', 'ASP.NET', 'jQuery', 'Bootstrap',
-        'Tailwind CSS', 'SASS', 'LESS', 'Webpack', 'Vite', 'Next.js', 'Nuxt.js',
-        
-        # Databases
-        'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'SQLite', 'Oracle', 'SQL Server',
-        'Cassandra', 'DynamoDB', 'Elasticsearch', 'Neo4j', 'Firebase',
-        
-        # Cloud & DevOps
-        'AWS', 'Azure', 'Google Cloud', 'Docker', 'Kubernetes', 'Jenkins', 'GitLab CI',
-        'GitHub Actions', 'Terraform', 'Ansible', 'Chef', 'Puppet', 'Vagrant',
-        
-        # Data Science & AI
-        'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'Keras', 'Scikit-learn',
-        'Pandas', 'NumPy', 'Matplotlib', 'Seaborn', 'Jupyter', 'Apache Spark', 'Hadoop',
-        'Tableau', 'Power BI', 'D3.js', 'OpenCV', 'NLTK', 'spaCy',
-        
-        # Mobile Development
-        'iOS', 'Android', 'React Native', 'Flutter', 'Xamarin', 'Ionic',
-        
-        # Tools & Others
-        'Git', 'SVN', 'Jira', 'Confluence', 'Slack', 'Trello', 'Figma', 'Adobe Creative Suite',
-        'Photoshop', 'Illustrator', 'InDesign', 'Sketch', 'InVision', 'Zeplin'
-    ]
-    
-    # Soft skills
-    soft_skills = [
-        'Leadership', 'Communication', 'Teamwork', 'Problem Solving', 'Critical Thinking',
-        'Project Management', 'Time Management', 'Adaptability', 'Creativity', 'Innovation',
-        'Analytical Skills', 'Attention to Detail', 'Customer Service', 'Negotiation',
-        'Presentation Skills', 'Public Speaking', 'Mentoring', 'Coaching'
-    ]
-    
-    all_skills = technical_skills + soft_skills
-    found_skills = []
-    text_lower = text.lower()
-    
-    # Direct skill matching
-    for skill in all_skills:
-        if skill.lower() in text_lower:
-            found_skills.append(skill)
+    # Direct skill matching in a single pass over the text
+    found_skills = get_skill_matcher().find_skills(text)
     
     # Use NLTK for additional entity-like extraction
     try:
-        tokens = word_tokenize(text)
         # Look for capitalized words that might be technologies
-        for token in tokens:
-            if token.istitle() and len(token) > 2:
-                # Check if it's similar to known technologies
-                for tech in technical_skills:
-                    if tech.lower() in token.lower() or token.lower() in tech.lower():
-                        if token not in found_skills:
-                            found_skills.append(token)
+        found_skills.extend(match_skill_tokens(document.tokens))
     except Exception as e:
         print(f"Error in NLTK processing: {e}")
     
     return list(set(found_skills))  # Remove duplicates
 
-def extract_experience(text):
+def match_skill_tokens(tokens):
+    """Return title-case tokens that contain, or are contained in, a technical skill"""
+    candidates = dict.fromkeys(token for token in tokens if token.istitle() and len(token) > 2)
+    return [token for token in candidates if is_technical_skill_token(token.lower())]
+
+@lru_cache(maxsize=None)
+def technical_skill_lookup():
+    """Precomputed maps replacing the token x skill comparison loop.
+
+    Returns the lowercase skill names grouped by length (to test whether a
+    skill occurs inside a token) and every substring of every skill name (to
+    test whether a token occurs inside a skill).
+    """
+    names_by_length = {}
+    fragments = set()
+    for tech in TECHNICAL_SKILLS:
+        name = tech.lower()
+        names_by_length.setdefault(len(name), set()).add(name)
+        for start in range(len(name)):
+            for end in range(start + 1, len(name) + 1):
+                fragments.add(name[start:end])
+    return names_by_length, frozenset(fragments)
+
+@lru_cache(maxsize=8192)
+def is_technical_skill_token(token_lower):
+    """Equivalent to any(tech in token or token in tech) over TECHNICAL_SKILLS"""
+    names_by_length, fragments = technical_skill_lookup()
+    if token_lower in fragments:
+        return True
+    for length, names in names_by_length.items():
+        for start in range(len(token_lower) - length + 1):
+            if token_lower[start:start + length] in names:
+                return True
+    return False
+
+def extract_experience(text, document=None):
     """Extract work experience from resume text"""
-    experience_keywords = ['experience', 'work history', 'employment', 'career', 'professional experience']
-    education_keywords = ['education', 'academic', 'degree', 'university', 'college', 'school']
-    
-    lines = text.split('\n')
+    segments = (document or ResumeDocument(text)).segments
     experience_section = []
-    in_experience = False
     
-    for i, line in enumerate(lines):
-        line_lower = line.lower().strip()
-        
-        # Check if we're entering experience section
-        if any(keyword in line_lower for keyword in experience_keywords):
-            in_experience = True
-            continue
-        
-        # Check if we're leaving experience section
-        if in_experience and any(keyword in line_lower for keyword in education_keywords + ['skills', 'projects', 'certifications']):
-            break
-        
-        if in_experience and line.strip():
-            # Look for job titles, companies, and dates
-            if re.search(r'\d{4}', line) or any(word in line_lower for word in ['manager', 'developer', 'engineer', 'analyst', 'specialist', 'coordinator']):
-                experience_section.append(line.strip())
+    for line, line_lower in segments.body_lines('experience'):
+        # Look for job titles, companies, and dates
+        if re.search(r'\d{4}', line) or any(word in line_lower for word in ['manager', 'developer', 'engineer', 'analyst', 'specialist', 'coordinator']):
+            experience_section.append(line)
     
     return experience_section
 
-def extract_education(text):
+def extract_education(text, document=None):
     """Extract education information from resume text"""
-    education_keywords = ['education', 'academic', 'degree', 'university', 'college', 'school']
-    
-    lines = text.split('\n')
+    segments = (document or ResumeDocument(text)).segments
     education_section = []
-    in_education = False
     
-    for line in lines:
-        line_lower = line.lower().strip()
-        
-        if any(keyword in line_lower for keyword in education_keywords):
-            in_education = True
-            continue
-        
-        if in_education and line.strip():
-            # Stop if we hit another section
-            if any(keyword in line_lower for keyword in ['experience', 'skills', 'projects', 'certifications']):
-                break
-            
-            # Look for degrees, institutions, and dates
-            if any(word in line_lower for word in ['bachelor', 'master', 'phd', 'degree', 'university', 'college']) or re.search(r'\d{4}', line):
-                education_section.append(line.strip())
+    for line, line_lower in segments.body_lines('education'):
+        # Look for degrees, institutions, and dates
+        if any(word in line_lower for word in ['bachelor', 'master', 'phd', 'degree', 'university', 'college']) or re.search(r'\d{4}', line):
+            education_section.append(line)
     
     return education_section
 
-def extract_keywords_simple(text):
+def extract_keywords_simple(text, document=None):
     """Extract important keywords using simple frequency analysis"""
     try:
-        # Remove common stop words
-        stop_words = set(stopwords.words('english'))
-        
-        # Additional stop words specific to resumes
-        additional_stop_words = {
-            'resume', 'cv', 'curriculum', 'vitae', 'name', 'address', 'phone', 'email',
-            'references', 'available', 'upon', 'request', 'page', 'www', 'http', 'https'
-        }
-        stop_words.update(additional_stop_words)
-        
-        # Clean text
-        cleaned_text = re.sub(r'[^a-zA-Z\s]', '', text.lower())
-        words = [word for word in cleaned_text.split() if word not in stop_words and len(word) > 2]
-        
-        # Count word frequency
-        word_freq = Counter(words)
+        # Word frequency without common and resume-specific stop words
+        word_freq = (document or as_document(text)).keyword_counts
         
         # Get top keywords (appearing more than once)
         keywords = [word for word, freq in word_freq.most_common(30) if freq > 1]
@@ -285,8 +641,9 @@ def extract_keywords_simple(text):
         print(f"Error extracting keywords: {e}")
         return []
 
-def identify_sections(text):
+def identify_sections(text, document=None):
     """Identify which sections are present in the resume"""
+    segments = (document or ResumeDocument(text)).segments
     sections = {
         'contact': False,
         'summary': False,
@@ -297,42 +654,39 @@ def identify_sections(text):
         'certifications': False
     }
     
-    text_lower = text.lower()
-    
     # Check for contact info
-    if '@' in text or re.search(r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}', text):
+    if '@' in text or SECTION_PHONE_PATTERN.search(text):
         sections['contact'] = True
     
-    # Check for other sections
-    section_keywords = {
-        'summary': ['summary', 'objective', 'profile', 'about'],
-        'experience': ['experience', 'work history', 'employment', 'career'],
-        'education': ['education', 'academic', 'degree', 'university', 'college'],
-        'skills': ['skills', 'technical skills', 'competencies', 'technologies'],
-        'projects': ['projects', 'portfolio', 'work samples'],
-        'certifications': ['certifications', 'certificates', 'licenses']
-    }
-    
-    for section, keywords in section_keywords.items():
-        if any(keyword in text_lower for keyword in keywords):
-            sections[section] = True
+    # Sections are detected from their headers, the same way the extractors
+    # find them; text without any recognisable header falls back to keywords
+    for section, keywords in SECTION_KEYWORDS.items():
+        if segments.has_headers:
+            sections[section] = segments.has(section)
+        else:
+            sections[section] = any(keyword in segments.lower_text for keyword in keywords)
     
     return sections
 
+# The parsed_data fields built by parse_resume_text, in order, with their extractors
+PARSE_STAGES = [
+    ('contact_info', extract_contact_info),
+    ('skills', extract_skills_advanced),
+    ('experience', extract_experience),
+    ('education', extract_education),
+    ('sections', identify_sections),
+    ('keywords', extract_keywords_simple),
+]
+
 def calculate_simple_similarity(text1, text2):
-    """Calculate simple text similarity using word overlap"""
+    """Calculate simple text similarity using word overlap; accepts texts or ResumeDocuments"""
     try:
         if not text1 or not text2:
             return 0.0
         
-        # Tokenize and clean
-        words1 = set(re.findall(r'\w+', text1.lower()))
-        words2 = set(re.findall(r'\w+', text2.lower()))
-        
-        # Remove stop words
-        stop_words = set(stopwords.words('english'))
-        words1 = words1 - stop_words
-        words2 = words2 - stop_words
+        # Distinct words without stop words, computed once per text
+        words1 = as_document(text1).content_words
+        words2 = as_document(text2).content_words
         
         # Calculate Jaccard similarity
         intersection = len(words1 & words2)
@@ -353,31 +707,7 @@ def calculate_skill_match_score(user_skills, job_skills):
         return 0.0
     
     try:
-        user_skills_lower = [skill.lower().strip() for skill in user_skills]
-        job_skills_lower = [skill.lower().strip() for skill in job_skills]
-        
-        # Exact matches
-        exact_matches = sum(1 for job_skill in job_skills_lower if job_skill in user_skills_lower)
-        exact_match_score = (exact_matches / len(job_skills_lower)) if job_skills_lower else 0
-        
-        # Partial matches (contains)
-        partial_matches = 0
-        for job_skill in job_skills_lower:
-            for user_skill in user_skills_lower:
-                if job_skill in user_skill or user_skill in job_skill:
-                    partial_matches += 1
-                    break
-        
-        partial_match_score = (partial_matches / len(job_skills_lower)) if job_skills_lower else 0
-        
-        # Combine scores (weighted average)
-        combined_score = (
-            exact_match_score * 0.7 +  # 70% weight for exact matches
-            partial_match_score * 0.3   # 30% weight for partial matches
-        )
-        
-        return min(combined_score * 100, 100.0)
-        
+        return skill_id_match_score(normalize_skills(user_skills), normalize_skills(job_skills))
     except Exception as e:
         print(f"Error calculating skill match: {e}")
         # Fallback to simple string matching
@@ -387,6 +717,65 @@ def calculate_skill_match_score(user_skills, job_skills):
         matches = sum(1 for job_skill in job_skills_lower if job_skill in user_skills_lower)
         return (matches / len(job_skills_lower)) * 100 if job_skills_lower else 0
 
+def normalize_skills(skills):
+    """Skill ids: distinct skill names lowercased with their whitespace collapsed"""
+    return list(dict.fromkeys(normalize_phrase(skill) for skill in skills or [] if skill and skill.strip()))
+
+def skill_id_match_score(user_skill_ids, job_skill_ids):
+    """Skill match score of already normalized skill ids, such as a JobProfile's"""
+    if not user_skill_ids or not job_skill_ids:
+        return 0.0
+    
+    # Exact matches
+    user_skill_set = set(user_skill_ids)
+    exact_matches = sum(1 for job_skill in job_skill_ids if job_skill in user_skill_set)
+    exact_match_score = exact_matches / len(job_skill_ids)
+    
+    # Partial matches (contains)
+    partial_matches = 0
+    for job_skill in job_skill_ids:
+        for user_skill in user_skill_ids:
+            if job_skill in user_skill or user_skill in job_skill:
+                partial_matches += 1
+                break
+    
+    partial_match_score = partial_matches / len(job_skill_ids)
+    
+    # Combine scores (weighted average)
+    combined_score = (
+        exact_match_score * 0.7 +  # 70% weight for exact matches
+        partial_match_score * 0.3   # 30% weight for partial matches
+    )
+    
+    return min(combined_score * 100, 100.0)
+
+def build_job_profile(job):
+    """Field values of the JobProfile derived from a job's skills and description"""
+    document = ResumeDocument(job.description)
+    return {
+        'skill_ids': normalize_skills(job.skills),
+        'keywords': extract_keywords_simple(job.description, document),
+        'tokens': sorted(document.word_set),
+        'description_length': len(job.description or ''),
+        'version': JOB_PROFILE_VERSION,
+    }
+
+def refresh_job_profile(job):
+    """Rebuild and store the job's profile; called by Job.save()"""
+    profile, _ = JobProfile.objects.update_or_create(job=job, defaults=build_job_profile(job))
+    job.profile = profile
+    return profile
+
+def get_job_profile(job):
+    """The job's stored profile, or an unsaved one built now when it is missing or outdated"""
+    try:
+        profile = job.profile
+    except JobProfile.DoesNotExist:
+        profile = None
+    if profile is None or profile.version != JOB_PROFILE_VERSION:
+        profile = JobProfile(job=job, **build_job_profile(job))
+    return profile
+
 def calculate_text_similarity(text1, text2):
     """Calculate similarity between two texts using simple word overlap"""
     return calculate_simple_similarity(text1, text2)
@@ -394,74 +783,8 @@ def calculate_text_similarity(text1, text2):
 def enhanced_skill_extraction(text):
     """Enhanced skill extraction with better pattern matching"""
     
-    # Comprehensive skill database with variations
-    skill_patterns = {
-        # Programming Languages
-        'python': ['python', 'py'],
-        'javascript': ['javascript', 'js', 'ecmascript'],
-        'java': ['java'],
-        'c++': ['c++', 'cpp', 'c plus plus'],
-        'c#': ['c#', 'csharp', 'c sharp'],
-        'php': ['php'],
-        'ruby': ['ruby'],
-        'go': ['golang', 'go'],
-        'rust': ['rust'],
-        'swift': ['swift'],
-        'kotlin': ['kotlin'],
-        'typescript': ['typescript', 'ts'],
-        'scala': ['scala'],
-        'r': ['r programming', 'r language'],
-        
-        # Web Technologies
-        'html': ['html', 'html5'],
-        'css': ['css', 'css3'],
-        'react': ['react', 'reactjs', 'react.js'],
-        'angular': ['angular', 'angularjs'],
-        'vue': ['vue', 'vuejs', 'vue.js'],
-        'node.js': ['nodejs', 'node.js', 'node js'],
-        'express': ['express', 'expressjs', 'express.js'],
-        'django': ['django'],
-        'flask': ['flask'],
-        'spring': ['spring', 'spring boot'],
-        'laravel': ['laravel'],
-        'rails': ['rails', 'ruby on rails'],
-        
-        # Databases
-        'mysql': ['mysql'],
-        'postgresql': ['postgresql', 'postgres'],
-        'mongodb': ['mongodb', 'mongo'],
-        'redis': ['redis'],
-        'sqlite': ['sqlite'],
-        'oracle': ['oracle', 'oracle db'],
-        
-        # Cloud & DevOps
-        'aws': ['aws', 'amazon web services'],
-        'azure': ['azure', 'microsoft azure'],
-        'gcp': ['gcp', 'google cloud', 'google cloud platform'],
-        'docker': ['docker'],
-        'kubernetes': ['kubernetes', 'k8s'],
-        'jenkins': ['jenkins'],
-        'git': ['git'],
-        
-        # Data Science
-        'machine learning': ['machine learning', 'ml'],
-        'deep learning': ['deep learning', 'dl'],
-        'tensorflow': ['tensorflow'],
-        'pytorch': ['pytorch'],
-        'pandas': ['pandas'],
-        'numpy': ['numpy'],
-        'scikit-learn': ['scikit-learn', 'sklearn'],
-    }
-    
-    found_skills = set()
-    text_lower = text.lower()
-    
     # Extract skills using patterns
-    for skill, patterns in skill_patterns.items():
-        for pattern in patterns:
-            if pattern in text_lower:
-                found_skills.add(skill.title())
-                break
+    found_skills = set(get_skill_alias_matcher().find_skills(text))
     
     # Additional pattern-based extraction
     # Look for common skill sections
@@ -478,142 +801,149 @@ def enhanced_skill_extraction(text):
     
     return list(found_skills)
 
+def resume_analysis_fields(resume):
+    """The job-independent part of an analysis, shared by every job it is compared against"""
+    return {
+        'overall_score': calculate_overall_score(resume),
+        'ats_score': calculate_ats_score(resume),
+        'strengths': identify_strengths(resume),
+        'improvements': identify_improvements(resume),
+        'section_scores': resume.parsed_data.get('sections', {}),
+    }
+
+def resume_content_hash(resume):
+    """SHA-256 identifying the resume content; resumes stored before hashing fall back to the text"""
+    return resume.content_hash or hashlib.sha256(resume.extracted_text.encode('utf-8')).hexdigest()
+
+def analysis_key(resume, job=None):
+    """The fields a stored analysis of this resume against this job must match to be reused"""
+    return {
+        'resume': resume,
+        'job': job,
+        'content_hash': resume_content_hash(resume),
+        'parser_version': (resume.parsed_data or {}).get('_meta', {}).get('parser_version', 0),
+        'job_updated_at': job.updated_at if job else None,
+        # Profiles are rebuilt in place by backfill_job_profiles without touching the job
+        'job_profile_version': JOB_PROFILE_VERSION if job else None,
+        'scorer_version': SCORER_VERSION,
+    }
+
+def find_analysis(resume, job=None):
+    """The stored analysis for the current resume content and job version, or None"""
+    return ResumeAnalysis.objects.filter(**analysis_key(resume, job)).order_by('-id').first()
+
 def analyze_resume(resume, job_id=None):
-    """Analyze resume and provide scoring and recommendations"""
-    
-    # Basic analysis
-    overall_score = calculate_overall_score(resume)
-    ats_score = calculate_ats_score(resume)
-    strengths = identify_strengths(resume)
-    improvements = identify_improvements(resume)
-    missing_keywords = []
-    
-    # Job-specific analysis if job_id provided
-    if job_id:
-        try:
-            job = Job.objects.get(id=job_id)
-            missing_keywords = find_missing_keywords(resume, job)
-        except Job.DoesNotExist:
-            pass
+    """Analyze resume and provide scoring and recommendations.
+
+    An analysis of the same resume content against the same job version is
+    returned as stored instead of being computed again.
+    """
+    job = Job.objects.select_related('profile').filter(id=job_id).first() if job_id else None
+    return find_analysis(resume, job) or create_analysis(resume, job)
+
+def create_analysis(resume, job=None):
+    """Compute and store a new analysis of the resume, against the job if given"""
+    fields = resume_analysis_fields(resume)
+    missing_keywords = find_missing_keywords(resume, job) if job else []
     
-    # Create analysis record
-    analysis = ResumeAnalysis.objects.create(
-        resume=resume,
-        job_id=job_id if job_id else None,
-        overall_score=overall_score,
-        ats_score=ats_score,
-        strengths=strengths,
-        improvements=improvements,
+    return ResumeAnalysis.objects.create(
         missing_keywords=missing_keywords,
-        section_scores=resume.parsed_data.get('sections', {})
+        **analysis_key(resume, job),
+        **fields
     )
-    
-    return analysis
+
+def analyze_resume_batch(resume, job_ids):
+    """Analyze a resume against several jobs at once.
+
+    The jobs and the analyses already stored for the current resume content
+    are loaded in one query each; only the missing analyses are computed, with
+    the resume-side scores computed once, and written with a single bulk
+    insert. Returns the analyses (in job_ids order, unknown ids skipped),
+    each job's skill match score and the number of analyses created.
+    """
+    resume_skill_ids = normalize_skills(resume.parsed_data.get('skills', []))
+    jobs = Job.objects.select_related('profile').in_bulk(job_ids)
+    
+    key = analysis_key(resume)
+    del key['job'], key['job_updated_at']
+    key['job_profile_version'] = JOB_PROFILE_VERSION
+    stored = {}
+    for analysis in ResumeAnalysis.objects.filter(job_id__in=list(jobs), **key).order_by('id'):
+        if analysis.job_updated_at == jobs[analysis.job_id].updated_at:
+            stored[analysis.job_id] = analysis
+    
+    analyses = []
+    new_analyses = []
+    match_scores = {}
+    fields = None
+    for job_id in job_ids:
+        job = jobs.get(job_id)
+        if job is None:
+            continue
+        match_scores[job_id] = skill_id_match_score(resume_skill_ids, get_job_profile(job).skill_ids)
+        analysis = stored.get(job_id)
+        if analysis is None:
+            if fields is None:
+                fields = resume_analysis_fields(resume)
+            analysis = ResumeAnalysis(
+                missing_keywords=find_missing_keywords(resume, job),
+                **analysis_key(resume, job),
+                **fields
+            )
+            new_analyses.append(analysis)
+        analyses.append(analysis)
+    
+    ResumeAnalysis.objects.bulk_create(new_analyses)
+    return analyses, match_scores, len(new_analyses)
 
 def calculate_overall_score(resume):
     """Calculate overall resume score based on multiple factors"""
-    score = 0
-    
-    # Section completeness (40 points)
-    sections = resume.parsed_data.get('sections', {})
-    section_weights = {
-        'contact': 10,
-        'experience': 15,
-        'education': 10,
-        'skills': 5
-    }
-    
-    for section, weight in section_weights.items():
-        if sections.get(section, False):
-            score += weight
-    
-    # Content quality (30 points)
-    skills = resume.parsed_data.get('skills', [])
-    if len(skills) >= 10:
-        score += 20
-    elif len(skills) >= 5:
-        score += 15
-    elif len(skills) >= 3:
-        score += 10
-    elif len(skills) >= 1:
-        score += 5
-    
-    experience = resume.parsed_data.get('experience', [])
-    if len(experience) >= 3:
-        score += 10
-    elif len(experience) >= 1:
-        score += 5
-    
-    # Text quality and structure (30 points)
-    text_length = len(resume.extracted_text)
-    if text_length >= 2000:
-        score += 15
-    elif text_length >= 1000:
-        score += 12
-    elif text_length >= 500:
-        score += 8
-    elif text_length >= 200:
-        score += 5
-    
-    # Keywords and relevance
-    keywords = resume.parsed_data.get('keywords', [])
-    if len(keywords) >= 15:
-        score += 10
-    elif len(keywords) >= 10:
-        score += 7
-    elif len(keywords) >= 5:
-        score += 5
-    
-    # Contact info bonus
-    contact_info = resume.parsed_data.get('contact_info', {})
-    if contact_info.get('email'):
-        score += 3
-    if contact_info.get('phone'):
-        score += 2
-    
-    return min(score, 100)  # Cap at 100
+    return score_features(get_resume_features(resume))[0]
 
 def calculate_ats_score(resume):
     """Calculate ATS compatibility score"""
-    score = 0
-    
-    # File format (20 points)
-    if resume.original_filename.lower().endswith(('.pdf', '.docx')):
-        score += 20
-    
-    # Section headers (30 points)
-    sections = resume.parsed_data.get('sections', {})
-    required_sections = ['contact', 'experience', 'skills']
-    for section in required_sections:
-        if sections.get(section):
-            score += 10
-    
-    # Skills and keywords (30 points)
-    skills = resume.parsed_data.get('skills', [])
-    if len(skills) >= 8:
-        score += 30
-    elif len(skills) >= 5:
-        score += 20
-    elif len(skills) >= 3:
-        score += 15
-    elif len(skills) >= 1:
-        score += 10
-    
-    # Text structure and readability (20 points)
-    text = resume.extracted_text
-    lines = text.split('\n')
-    non_empty_lines = [line for line in lines if line.strip()]
-    
-    if len(non_empty_lines) >= 20:  # Good structure
-        score += 20
-    elif len(non_empty_lines) >= 15:
-        score += 15
-    elif len(non_empty_lines) >= 10:
-        score += 10
-    elif len(non_empty_lines) >= 5:
-        score += 5
-    
-    return min(score, 100)
+    return score_features(get_resume_features(resume))[1]
+
+def get_resume_features(resume):
+    """The resume's stored feature vector, or one computed from its parse result"""
+    if len(resume.features or []) == len(FEATURES):
+        return resume.features
+    return resume_features(resume.extracted_text, resume.parsed_data, resume.original_filename)
+
+def set_resume_scores(*resumes):
+    """Store the feature vectors and scores of freshly parsed resumes on the instances (not saved).
+
+    All the resumes are scored together in one vectorized pass.
+    """
+    for resume in resumes:
+        resume.features = resume_features(resume.extracted_text, resume.parsed_data, resume.original_filename)
+    matrix = feature_matrix([resume.features for resume in resumes])
+    for resume, overall_score, ats_score in zip(resumes, overall_scores(matrix), ats_scores(matrix)):
+        resume.overall_score = float(overall_score)
+        resume.ats_score = float(ats_score)
+
+def set_application_match_scores(*applications):
+    """Store the skill match score of job applications on the instances (not saved).
+
+    The applicants' resumes are loaded in one query; the jobs should come with
+    their profile selected. Applications whose applicant has no resume keep
+    their score. Returns the applications that were scored.
+    """
+    skills_by_user = dict(
+        Resume.objects
+        .filter(user_id__in={application.applicant_id for application in applications})
+        .values_list('user_id', 'parsed_data__skills')
+    )
+    scored = []
+    for application in applications:
+        if application.applicant_id not in skills_by_user:
+            continue
+        application.match_score = skill_id_match_score(
+            normalize_skills(skills_by_user[application.applicant_id]),
+            get_job_profile(application.job).skill_ids
+        )
+        scored.append(application)
+    return scored
 
 def identify_strengths(resume):
     """Identify resume strengths"""
@@ -689,11 +1019,12 @@ def identify_improvements(resume):
 
 def find_missing_keywords(resume, job):
     """Find keywords missing from resume compared to job requirements"""
-    resume_text = resume.extracted_text.lower()
-    job_skills = [skill.lower() for skill in job.skills] if job.skills else []
+    resume_text = as_document(resume.extracted_text).lower_text
     
-    # Extract keywords from job description
-    job_keywords = extract_keywords_simple(job.description)
+    # Skills and description keywords precomputed when the job was saved
+    profile = get_job_profile(job)
+    job_skills = profile.skill_ids
+    job_keywords = profile.keywords
     
     missing_keywords = []
     
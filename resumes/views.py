@@ -1,12 +1,19 @@
+import hashlib
 from rest_framework import generics, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from django.conf import settings
 from django.core.files.storage import default_storage
 from django.utils import timezone
-from .models import Resume, ResumeAnalysis
-from .serializers import ResumeSerializer, ResumeAnalysisSerializer
-from .utils import parse_resume, analyze_resume
+from .models import Resume, ResumeAnalysis, ResumeParseJob
+from .serializers import ResumeSerializer, ResumeAnalysisSerializer, ResumeParseJobSerializer
+from .tasks import enqueue_parse_job, start_parse
+from jobs.models import Job
+from .utils import (
+    analyze_resume_batch, close_upload, create_analysis, find_analysis, get_job_profile, is_parse_cached,
+    normalize_skills, read_upload, skill_id_match_score
+)
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
@@ -26,43 +33,46 @@ def upload_resume(request):
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    # Delete existing resume if any
-    try:
-        existing_resume = Resume.objects.get(user=request.user)
-        existing_resume.file.delete()
-        existing_resume.delete()
-    except Resume.DoesNotExist:
-        pass
-    
-    # Create new resume
-    resume = Resume.objects.create(
+    # Content already in the parse cache is not extracted again. Otherwise
+    # parsing starts from the in-memory upload right away and overlaps with
+    # storing it on a parse job; the user's Resume is only replaced once the
+    # background parse has succeeded.
+    source = read_upload(file)
+    content_hash = hashlib.sha256(source).hexdigest()
+    if is_parse_cached(content_hash):
+        pending = None
+        close_upload(source)
+    else:
+        pending = start_parse(source, file.name)
+    job = ResumeParseJob(
         user=request.user,
-        file=file,
-        original_filename=file.name
+        original_filename=file.name,
+        content_hash=content_hash
     )
+    job.file.save(file.name, file, save=False)
+    job.save()
+    enqueue_parse_job(job, pending)
     
-    # Parse resume content
+    serializer = ResumeParseJobSerializer(job)
+    return Response({
+        "job_id": job.id,
+        "job": serializer.data,
+        "status_url": f"/api/resumes/parse-status/{job.id}/",
+        "message": "Resume uploaded, parsing in progress"
+    }, status=status.HTTP_202_ACCEPTED)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def parse_status(request, job_id):
+    """Report the progress of a background resume parse"""
     try:
-        extracted_text, parsed_data = parse_resume(resume.file.path)
-        resume.extracted_text = extracted_text
-        resume.parsed_data = parsed_data
-        resume.save()
-        
-        # Update user's resume_uploaded status
-        request.user.resume_uploaded = True
-        request.user.save()
-        
-        serializer = ResumeSerializer(resume)
-        return Response({
-            "resume": serializer.data,
-            "message": "Resume uploaded and parsed successfully"
-        }, status=status.HTTP_201_CREATED)
-        
-    except Exception as e:
-        resume.delete()
+        job = ResumeParseJob.objects.get(id=job_id, user=request.user)
+        serializer = ResumeParseJobSerializer(job)
+        return Response(serializer.data)
+    except ResumeParseJob.DoesNotExist:
         return Response(
-            {"error": f"Failed to parse resume: {str(e)}"}, 
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            {"error": "Parse job not found"}, 
+            status=status.HTTP_404_NOT_FOUND
         )
 
 @api_view(['GET'])
@@ -81,80 +91,34 @@ def get_resume(request):
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def analyze_resume_view(request):
+    """Analyze the user's resume, against a job if one is given; an unchanged resume and job reuse the stored analysis"""
     try:
         resume = Resume.objects.get(user=request.user)
         job_id = request.data.get('job_id')
+        job = Job.objects.select_related('profile').filter(id=job_id).first() if job_id else None
         
-        # Enhanced analysis with AI insights
-        analysis_result = {
-            "overall_score": 85,
-            "ats_score": 78,
-            "sections_analysis": {
-                "contact_info": {"score": 95, "status": "excellent", "feedback": "Complete contact information provided"},
-                "summary": {"score": 80, "status": "good", "feedback": "Professional summary could be more impactful"},
-                "experience": {"score": 88, "status": "very_good", "feedback": "Strong work experience with relevant details"},
-                "education": {"score": 90, "status": "excellent", "feedback": "Educational background well presented"},
-                "skills": {"score": 75, "status": "good", "feedback": "Skills section could include more technical keywords"}
-            },
-            "strengths": [
-                "Strong technical background in relevant technologies",
-                "Clear career progression shown",
-                "Quantified achievements in previous roles",
-                "Professional formatting and structure"
-            ],
-            "improvements": [
-                "Add more industry-specific keywords",
-                "Include metrics and numbers in achievements",
-                "Optimize for ATS scanning",
-                "Consider adding relevant certifications"
-            ],
-            "keyword_analysis": {
-                "found_keywords": ["Python", "JavaScript", "React", "Django"],
-                "missing_keywords": ["TypeScript", "AWS", "Docker", "API"],
-                "keyword_density": "Good"
-            },
-            "ai_recommendations": [
-                "Consider adding a 'Projects' section to showcase your work",
-                "Include relevant volunteer work or open-source contributions",
-                "Tailor your resume for each specific job application",
-                "Use action verbs to start each bullet point"
-            ],
-            "match_score": 82 if job_id else None,
-            "analysis_date": timezone.now().isoformat(),
-            "next_steps": [
-                "Review and implement the suggested improvements",
-                "Test your resume with different ATS systems",
-                "Get feedback from industry professionals",
-                "Keep your resume updated with latest achievements"
-            ]
-        }
+        analysis = find_analysis(resume, job)
+        created = analysis is None
+        if created:
+            analysis = create_analysis(resume, job)
         
-        if job_id:
-            # Add job-specific analysis
-            try:
-                from jobs.models import Job
-                job = Job.objects.get(id=job_id)
-                analysis_result["job_match"] = {
-                    "job_title": job.title,
-                    "company": job.company,
-                    "skills_match": len(set(resume.parsed_data.get('skills', [])) & set(job.skills)) if resume.parsed_data else 0,
-                    "missing_skills": list(set(job.skills) - set(resume.parsed_data.get('skills', []))) if resume.parsed_data else job.skills,
-                    "recommendations": f"Focus on highlighting experience with {', '.join(job.skills[:3])} in your resume"
-                }
-            except Job.DoesNotExist:
-                pass
-        
-        # Store analysis in database
-        analysis = ResumeAnalysis.objects.create(
-            resume=resume,
-            overall_score=analysis_result["overall_score"],
-            ats_score=analysis_result["ats_score"],
-            strengths=analysis_result["strengths"],
-            improvements=analysis_result["improvements"],
-            missing_keywords=analysis_result["keyword_analysis"]["missing_keywords"]
-        )
+        analysis_result = ResumeAnalysisSerializer(analysis).data
+        analysis_result["match_score"] = None
+        if job:
+            resume_skills = resume.parsed_data.get('skills', []) if resume.parsed_data else []
+            analysis_result["match_score"] = skill_id_match_score(
+                normalize_skills(resume_skills),
+                get_job_profile(job).skill_ids
+            )
+            analysis_result["job_match"] = {
+                "job_title": job.title,
+                "company": job.company,
+                "skills_match": len(set(resume_skills) & set(job.skills)),
+                "missing_skills": list(set(job.skills) - set(resume_skills)),
+                "recommendations": f"Focus on highlighting experience with {', '.join(job.skills[:3])} in your resume"
+            }
         
-        return Response(analysis_result, status=status.HTTP_201_CREATED)
+        return Response(analysis_result, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
         
     except Resume.DoesNotExist:
         return Response(
@@ -167,6 +131,47 @@ def analyze_resume_view(request):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def analyze_resume_batch_view(request):
+    """Analyze the user's resume against several jobs in one request"""
+    job_ids = request.data.get('job_ids')
+    max_jobs = getattr(settings, 'RESUME_ANALYZE_BATCH_MAX_JOBS', 50)
+    
+    if not isinstance(job_ids, list) or not job_ids:
+        return Response(
+            {"error": "job_ids must be a non-empty list"}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    try:
+        job_ids = list(dict.fromkeys(int(job_id) for job_id in job_ids))
+    except (TypeError, ValueError):
+        return Response(
+            {"error": "job_ids must contain job ids"}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if len(job_ids) > max_jobs:
+        return Response(
+            {"error": f"At most {max_jobs} jobs can be analyzed at once"}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    try:
+        resume = Resume.objects.get(user=request.user)
+    except Resume.DoesNotExist:
+        return Response(
+            {"error": "No resume found. Please upload a resume first."}, 
+            status=status.HTTP_404_NOT_FOUND
+        )
+    
+    analyses, match_scores, created = analyze_resume_batch(resume, job_ids)
+    serializer = ResumeAnalysisSerializer(analyses, many=True)
+    return Response({
+        "analyses": serializer.data,
+        "match_scores": match_scores,
+        "missing_job_ids": [job_id for job_id in job_ids if job_id not in match_scores],
+    }, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def resume_analyses(request):